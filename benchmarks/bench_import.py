@@ -0,0 +1,97 @@
+# encoding: utf-8
+
+"""
+Benchmark of the time taken by ``import docx`` in a fresh interpreter, as
+paid on every cold start of a short-lived process.
+
+Runs ``python -X importtime -c "import docx"`` several times and reports
+the median total import time, along with the modules taking the most time
+to import themselves in the median run. Bytecode is written by a first,
+unmeasured import and used by the measured ones, as in an installed
+package, even when ``PYTHONDONTWRITEBYTECODE`` is set; without it every
+module is compiled again on each run, roughly doubling the time reported.
+Exits with status 1 when the median is over the budget, so the benchmark
+can be run as a check.
+
+Run with ``python benchmarks/bench_import.py [budget_ms]``.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import os
+import subprocess
+import sys
+
+
+BUDGET_MS = 200
+RUNS = 9
+TOP = 15
+
+
+def import_times():
+    """
+    Return a list of `(module, self_usec, cumulative_usec)` 3-tuples for
+    each module imported by ``import docx`` in a new interpreter, in the
+    order ``-X importtime`` reports them.
+    """
+    output = subprocess.check_output(
+        [sys.executable, '-X', 'importtime', '-c', 'import docx'],
+        stderr=subprocess.STDOUT, env=_env(), cwd=_root(),
+    )
+    times = []
+    for line in output.decode('utf-8').splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_usec, cumulative_usec, module = line[12:].split('|')
+        times.append((
+            module.strip(), int(self_usec), int(cumulative_usec)
+        ))
+    return times
+
+
+def _env():
+    """
+    Return the environment to run ``import docx`` in, importing this
+    checkout and writing bytecode.
+    """
+    env = dict(os.environ, PYTHONPATH=_root())
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    return env
+
+
+def _root():
+    """
+    Return the path of the checkout this benchmark is part of, run from so
+    the ``docx`` package imported is that of the checkout.
+    """
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def main():
+    budget_ms = float(sys.argv[1]) if len(sys.argv) > 1 else BUDGET_MS
+    subprocess.check_call(
+        [sys.executable, '-c', 'import docx'], env=_env(), cwd=_root()
+    )
+    runs = sorted(
+        (import_times() for _ in range(RUNS)), key=lambda t: t[-1][2]
+    )
+    median = runs[len(runs) // 2]
+    total_ms = median[-1][2] / 1000.0
+
+    print('%-40s %10s %10s' % ('module', 'self ms', 'cum ms'))
+    top = sorted(median, key=lambda t: t[1], reverse=True)[:TOP]
+    for module, self_usec, cumulative_usec in top:
+        print('%-40s %10.1f %10.1f' % (
+            module, self_usec / 1000.0, cumulative_usec / 1000.0
+        ))
+    print()
+    print('import docx: %.1f ms median of %d runs, budget %.0f ms' % (
+        total_ms, RUNS, budget_ms
+    ))
+    return 1 if total_ms > budget_ms else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
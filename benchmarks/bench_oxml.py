@@ -0,0 +1,94 @@
+# encoding: utf-8
+
+"""
+Microbenchmarks of custom element class access, reading and writing the
+properties of ``<w:rPr>`` and ``<w:pPr>`` elements and looking up styles
+and numbering definitions by id.
+
+Run with ``python benchmarks/bench_oxml.py``.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import timeit
+
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+
+
+NUMBER = 20000
+REPEAT = 3
+
+RPR_XML = (
+    '<w:rPr %s><w:rStyle w:val="Emphasis"/><w:rFonts w:ascii="Arial"/><w:b/>'
+    '<w:i w:val="0"/><w:color w:val="FF0000"/><w:sz w:val="24"/><w:u w:val='
+    '"single"/></w:rPr>' % nsdecls('w')
+)
+
+PPR_XML = (
+    '<w:pPr %s><w:pStyle w:val="Heading1"/><w:keepNext/><w:spacing w:before'
+    '="240" w:after="120"/><w:ind w:left="720" w:firstLine="360"/><w:jc w:v'
+    'al="center"/></w:pPr>' % nsdecls('w')
+)
+
+
+def styles_xml(count):
+    styles = ''.join(
+        '<w:style w:type="paragraph" w:styleId="Style%d"><w:name w:val="Styl'
+        'e %d"/></w:style>' % (n, n) for n in range(count)
+    )
+    return '<w:styles %s>%s</w:styles>' % (nsdecls('w'), styles)
+
+
+def numbering_xml(count):
+    nums = ''.join(
+        '<w:num w:numId="%d"><w:abstractNumId w:val="0"/></w:num>' % n
+        for n in range(1, count + 1)
+    )
+    return '<w:numbering %s>%s</w:numbering>' % (nsdecls('w'), nums)
+
+
+def cases():
+    rPr, pPr = parse_xml(RPR_XML), parse_xml(PPR_XML)
+    styles = parse_xml(styles_xml(50))
+    numbering = parse_xml(numbering_xml(50))
+
+    def set_rPr():
+        rPr.sz_val = 28
+        rPr._set_bool_val('b', False)
+
+    def set_pPr():
+        pPr.spacing_before = 120
+        pPr.keepNext_val = False
+
+    return (
+        ('CT_RPr bold', lambda: rPr._get_bool_val('b')),
+        ('CT_RPr italic', lambda: rPr._get_bool_val('i')),
+        ('CT_RPr.sz_val', lambda: rPr.sz_val),
+        ('CT_RPr.style', lambda: rPr.style),
+        ('CT_RPr.rFonts_ascii', lambda: rPr.rFonts_ascii),
+        ('CT_RPr.u_val', lambda: rPr.u_val),
+        ('CT_RPr set sz_val, bold', set_rPr),
+        ('CT_PPr.jc_val', lambda: pPr.jc_val),
+        ('CT_PPr.ind_left', lambda: pPr.ind_left),
+        ('CT_PPr.spacing_before', lambda: pPr.spacing_before),
+        ('CT_PPr.keepNext_val', lambda: pPr.keepNext_val),
+        ('CT_PPr.style', lambda: pPr.style),
+        ('CT_PPr set spacing, keepNext', set_pPr),
+        ('CT_Styles.get_by_id', lambda: styles.get_by_id('Style25')),
+        ('CT_Numbering.num_having_numId',
+         lambda: numbering.num_having_numId(25)),
+    )
+
+
+def main():
+    print('%-32s %12s' % ('operation', 'usec/call'))
+    for name, func in cases():
+        seconds = min(timeit.repeat(func, number=NUMBER, repeat=REPEAT))
+        print('%-32s %12.3f' % (name, seconds / NUMBER * 1e6))
+
+
+if __name__ == '__main__':
+    main()
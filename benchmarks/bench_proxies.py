@@ -0,0 +1,164 @@
+# encoding: utf-8
+
+"""
+Benchmark of the memory used by proxy objects, comparing the slotted proxy
+classes with equivalent classes that keep an instance ``__dict__``.
+
+A large document is built in memory and every paragraph, run, table row and
+cell proxy is gathered into a list, as an application indexing a document
+would. The number of allocations still held and the peak of traced memory
+are measured with :mod:`tracemalloc`, and the growth of the resident set
+size of a fresh process doing the same work is reported alongside.
+
+Run with ``python benchmarks/bench_proxies.py``.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import gc
+import os
+import subprocess
+import sys
+import tracemalloc
+
+from docx import Document
+from docx.table import _Cell, _Row, Table
+from docx.text.paragraph import Paragraph
+from docx.text.run import Run
+
+
+PARAGRAPHS = 10000
+TABLES = 100
+
+
+def build_document():
+    """
+    Return a document of PARAGRAPHS three-run paragraphs and TABLES tables
+    of 10 rows by 4 columns.
+    """
+    document = Document()
+    for n in range(PARAGRAPHS):
+        paragraph = document.add_paragraph('paragraph %d ' % n)
+        paragraph.add_run('bold').bold = True
+        paragraph.add_run(' tail')
+        if n % (PARAGRAPHS // TABLES) == 0:
+            document.add_table(rows=10, cols=4)
+    return document
+
+
+def gather_proxies(document, classes):
+    """
+    Return a list of the paragraph, run, table, row and cell proxies of
+    *document*, created from the proxy classes in *classes*, a `(Paragraph,
+    Run, Table, Row, Cell)` 5-tuple, as the document, paragraph and table
+    properties do.
+    """
+    Paragraph, Run, Table, Row, Cell = classes
+    body = document._body
+    proxies = []
+    for p in body._element.p_lst:
+        paragraph = Paragraph(p, body)
+        proxies.append(paragraph)
+        proxies.extend(Run(r, paragraph) for r in p.r_lst)
+    for tbl in body._element.tbl_lst:
+        table = Table(tbl, body)
+        proxies.append(table)
+        for tr in tbl.tr_lst:
+            proxies.append(Row(tr, table))
+            proxies.extend(Cell(tc, table) for tc in tr.tc_lst)
+    return proxies
+
+
+def proxy_classes(variant):
+    """
+    Return the `(Paragraph, Run, Table, Row, Cell)` proxy classes for
+    *variant*, the slotted classes themselves for 'slots' or, for 'dict',
+    subclasses of them whose instances also hold their attributes in an
+    instance ``__dict__``, as they did before the classes used
+    ``__slots__``.
+    """
+    classes = (Paragraph, Run, Table, _Row, _Cell)
+    if variant == 'slots':
+        return classes
+    return tuple(_dict_class(cls) for cls in classes)
+
+
+def _dict_class(cls):
+    slots = [
+        name for klass in cls.__mro__
+        for name in getattr(klass, '__slots__', ())
+    ]
+
+    def __init__(self, *args):
+        cls.__init__(self, *args)
+        for name in slots:
+            if hasattr(self, name):
+                self.__dict__[name] = getattr(self, name)
+
+    return type(str(cls.__name__), (cls,), {'__init__': __init__})
+
+
+def measure(document, variant):
+    """
+    Return `(proxy_count, allocations, peak_bytes)` for gathering the
+    proxies of *document* as *variant*.
+    """
+    classes = proxy_classes(variant)
+    tracemalloc.start()
+    proxies = gather_proxies(document, classes)
+    snapshot = tracemalloc.take_snapshot()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    allocations = sum(stat.count for stat in snapshot.statistics('filename'))
+    return len(proxies), allocations, peak
+
+
+def rss_growth(variant):
+    """
+    Return the growth in KiB of the resident set size of a new process
+    gathering the proxies of a document as *variant*. The document is built
+    first, so its own memory is left out. Reads ``/proc/self/statm`` and so
+    needs Linux.
+    """
+    output = subprocess.check_output(
+        [sys.executable, __file__, '--rss', variant]
+    )
+    return int(output)
+
+
+def _rss_kib():
+    with open('/proc/self/statm') as f:
+        pages = int(f.read().split()[1])
+    return pages * os.sysconf(str('SC_PAGE_SIZE')) // 1024
+
+
+def _rss_child(variant):
+    document, classes = build_document(), proxy_classes(variant)
+    gc.collect()
+    before = _rss_kib()
+    proxies = gather_proxies(document, classes)
+    print(_rss_kib() - before)
+    return proxies
+
+
+def main():
+    document = build_document()
+    dicts = measure(document, 'dict')
+    slots = measure(document, 'slots')
+    print('%8s %9s %13s %13s %14s' % (
+        'proxies', 'variant', 'allocations', 'peak KiB', 'RSS KiB'
+    ))
+    for variant, (count, allocations, peak) in (
+            ('dict', dicts), ('slots', slots)):
+        print('%8d %9s %13d %13d %14d' % (
+            count, variant, allocations, peak // 1024, rss_growth(variant)
+        ))
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--rss']:
+        _rss_child(sys.argv[2])
+    else:
+        main()
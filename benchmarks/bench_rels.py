@@ -0,0 +1,43 @@
+# encoding: utf-8
+
+"""
+Benchmark of adding relationships to a part, showing the time per
+relationship stays flat as the number of relationships grows.
+
+Run with ``python benchmarks/bench_rels.py``.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import time
+
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.rel import Relationships
+
+
+def add_hyperlinks(count):
+    """
+    Return the seconds taken to add *count* distinct external hyperlink
+    relationships and then look each of them up again.
+    """
+    rels = Relationships('/word')
+    urls = ['http://example.com/%d' % n for n in range(count)]
+    start = time.time()
+    for url in urls:
+        rels.get_or_add_ext_rel(RT.HYPERLINK, url)
+    for url in urls:
+        rels.get_or_add_ext_rel(RT.HYPERLINK, url)
+    return time.time() - start
+
+
+def main():
+    print('%8s %10s %14s' % ('rels', 'seconds', 'usec per rel'))
+    for count in (1000, 2000, 4000, 8000, 16000):
+        seconds = min(add_hyperlinks(count) for _ in range(3))
+        print('%8d %10.4f %14.2f' % (count, seconds, seconds / count * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,376 @@
+# encoding: utf-8
+
+"""
+Benchmark suite timing the main operations of building, saving, opening and
+reading documents, on synthetic documents generated as it runs, so it needs
+no network access or test files.
+
+Each case is run several times and the results are written to a JSON file
+along with the commit, Python and lxml versions they were measured with.
+Given the results file of an earlier run, such as one of the commit before
+a change, the median time of each case is compared with it and the suite
+exits with status 1 when any case is slower by more than the threshold.
+
+Run with ``python benchmarks/bench_suite.py [-o results.json] [-k pattern]
+[--quick] [--compare baseline.json] [--threshold 0.2]``.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import argparse
+import binascii
+import datetime
+import json
+import os
+import platform
+import struct
+import subprocess
+import sys
+import zlib
+
+from timeit import default_timer
+
+from lxml import etree
+
+from docx import Document, extract_text, iter_blocks
+from docx.compat import BytesIO
+from docx.shared import Inches
+
+
+REPEAT = 5
+THRESHOLD = 0.2
+TABLE_ROWS, TABLE_COLS = 200, 8
+PICTURES = 200
+
+CASES = []
+
+
+def case(name, repeat=REPEAT, slow=False):
+    """
+    Register the decorated function as the benchmark case *name*, run
+    *repeat* times. The function does any setup and returns a `(func,
+    items)` 2-tuple, where *func* is the function timed and *items* the
+    number of paragraphs, cells, pictures or lookups it handles. Cases
+    marked *slow* are skipped by ``--quick``.
+    """
+    def decorator(setup):
+        CASES.append((name, setup, repeat, slow))
+        return setup
+    return decorator
+
+
+@case('open.default_template', repeat=20)
+def open_default_template():
+    return Document, 1
+
+
+@case('paragraphs.10k.add')
+def add_10k_paragraphs():
+    return _paragraph_adder(10000), 10000
+
+
+@case('paragraphs.10k.save')
+def save_10k_paragraphs():
+    return _saver(_document_with_paragraphs(10000)), 10000
+
+
+@case('paragraphs.100k.add', repeat=1, slow=True)
+def add_100k_paragraphs():
+    return _paragraph_adder(100000), 100000
+
+
+@case('paragraphs.100k.save', repeat=3, slow=True)
+def save_100k_paragraphs():
+    return _saver(_document_with_paragraphs(100000)), 100000
+
+
+@case('table.add_and_fill')
+def add_table():
+    return _table_adder(Document()), TABLE_ROWS * TABLE_COLS
+
+
+@case('table.save')
+def save_table():
+    document = Document()
+    _table_adder(document)()
+    return _saver(document), TABLE_ROWS * TABLE_COLS
+
+
+@case('picture.add')
+def add_pictures():
+    document = Document()
+    pngs = [_png(n) for n in range(PICTURES)]
+
+    def add():
+        for png in pngs:
+            document.add_picture(BytesIO(png), width=Inches(1))
+
+    return add, PICTURES
+
+
+@case('picture.save')
+def save_pictures():
+    document = Document()
+    for n in range(PICTURES):
+        document.add_picture(BytesIO(_png(n)), width=Inches(1))
+    return _saver(document), PICTURES
+
+
+@case('styles.lookup')
+def look_up_styles():
+    styles = Document().styles
+    names = [style.name for style in styles] * 20
+
+    def look_up():
+        for name in names:
+            styles[name]
+
+    return look_up, len(names)
+
+
+@case('text.extract')
+def extract_paragraph_text():
+    blob = _docx_with_paragraphs(10000)
+
+    def extract():
+        for text in extract_text(BytesIO(blob)):
+            pass
+
+    return extract, 10000
+
+
+@case('text.iter_blocks')
+def iterate_blocks():
+    blob = _docx_with_paragraphs(10000)
+
+    def iterate():
+        for block in iter_blocks(BytesIO(blob)):
+            block.text
+
+    return iterate, 10000
+
+
+@case('text.open_and_read')
+def read_paragraph_text():
+    blob = _docx_with_paragraphs(10000)
+
+    def open_and_read():
+        document = Document(BytesIO(blob))
+        for paragraph in document.paragraphs:
+            paragraph.text
+
+    return open_and_read, 10000
+
+
+def _document_with_paragraphs(count):
+    """
+    Return a document having *count* paragraphs of two runs each, the
+    same document each time it is called with the same *count*.
+    """
+    if count not in _documents:
+        _documents[count] = _paragraph_adder(count)()
+    return _documents[count]
+
+
+def _docx_with_paragraphs(count):
+    """
+    Return the bytes of a .docx file having *count* paragraphs.
+    """
+    stream = BytesIO()
+    _document_with_paragraphs(count).save(stream)
+    return stream.getvalue()
+
+
+def _paragraph_adder(count):
+    """
+    Return a function adding *count* paragraphs of two runs each to a new
+    document and returning that document.
+    """
+    def add_paragraphs():
+        document = Document()
+        for n in range(count):
+            paragraph = document.add_paragraph('Paragraph %d, ' % n)
+            paragraph.add_run('in bold.').bold = True
+        return document
+    return add_paragraphs
+
+
+def _png(n):
+    """
+    Return the bytes of a distinct 64 x 64 pixel RGB PNG image for each
+    value of *n*.
+    """
+    def chunk(type_, data):
+        crc = binascii.crc32(type_ + data) & 0xFFFFFFFF
+        return struct.pack('>I', len(data)) + type_ + data + struct.pack(
+            '>I', crc
+        )
+
+    size = 64
+    pixel = struct.pack('>BBB', n % 256, n // 256 % 256, 128)
+    rows = (b'\x00' + pixel * size) * size
+    ihdr = struct.pack('>IIBBBBB', size, size, 8, 2, 0, 0, 0)
+    phys = struct.pack('>IIB', 3780, 3780, 1)
+    return b''.join((
+        b'\x89PNG\r\n\x1a\n', chunk(b'IHDR', ihdr), chunk(b'pHYs', phys),
+        chunk(b'IDAT', zlib.compress(rows)), chunk(b'IEND', b'')
+    ))
+
+
+def _table_adder(document):
+    """
+    Return a function adding a table of TABLE_ROWS by TABLE_COLS cells to
+    *document* and setting the text of each cell.
+    """
+    def add_and_fill():
+        table = document.add_table(rows=TABLE_ROWS, cols=TABLE_COLS)
+        for row_idx, row in enumerate(table.rows):
+            for col_idx, cell in enumerate(row.cells):
+                cell.text = 'r%d c%d' % (row_idx, col_idx)
+    return add_and_fill
+
+
+def _saver(document):
+    """
+    Return a function saving *document* to a new in-memory file.
+    """
+    def save():
+        document.save(BytesIO())
+    return save
+
+
+def run(cases):
+    """
+    Return a list of result dicts, one for each case in *cases*, having the
+    case name, the number of items it handles and the seconds taken by each
+    run along with their minimum and median.
+    """
+    results = []
+    for name, setup, repeat, slow in cases:
+        runs = []
+        for _ in range(repeat):
+            func, items = setup()
+            start = default_timer()
+            func()
+            runs.append(default_timer() - start)
+        ordered = sorted(runs)
+        results.append({
+            'name': name,
+            'items': items,
+            'runs': runs,
+            'min': ordered[0],
+            'median': ordered[len(ordered) // 2],
+        })
+        print('%-28s %10.4f %10.4f %14.2f' % (
+            name, ordered[0], results[-1]['median'],
+            results[-1]['median'] / items * 1e6
+        ))
+        sys.stdout.flush()
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Print the change in median time of each case in *results* from the
+    same case in *baseline*, an earlier results dict, and return the names
+    of the cases slower by more than *threshold*, a fraction.
+    """
+    baseline_medians = dict(
+        (result['name'], result['median']) for result in baseline['results']
+    )
+    print()
+    print('compared with %s' % (baseline.get('commit') or 'baseline'))
+    print('%-28s %10s %10s %8s' % ('case', 'before', 'after', 'change'))
+    regressions = []
+    for result in results:
+        before = baseline_medians.get(result['name'])
+        if before is None:
+            continue
+        change = result['median'] / before - 1
+        flag = ''
+        if change > threshold:
+            regressions.append(result['name'])
+            flag = '  slower'
+        print('%-28s %10.4f %10.4f %+7.1f%%%s' % (
+            result['name'], before, result['median'], change * 100, flag
+        ))
+    return regressions
+
+
+_documents = {}
+
+
+def _commit():
+    """
+    Return the id of the commit checked out in the working tree this
+    benchmark is in, or |None| if it is not a git working tree.
+    """
+    try:
+        output = subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], stderr=subprocess.STDOUT,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.decode('utf-8').strip()
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description='Run the benchmark suite.')
+    parser.add_argument(
+        '-o', '--output', default='bench_results.json',
+        help='file to write the results to, default %(default)s'
+    )
+    parser.add_argument(
+        '-k', dest='pattern', default='',
+        help='run only the cases with a name containing PATTERN'
+    )
+    parser.add_argument(
+        '--quick', action='store_true',
+        help='skip the cases building or saving 100k paragraphs'
+    )
+    parser.add_argument(
+        '--compare', metavar='BASELINE',
+        help='results file of an earlier run to compare with'
+    )
+    parser.add_argument(
+        '--threshold', type=float, default=THRESHOLD,
+        help='fraction slower than the baseline counted as a regression, '
+             'default %(default)s'
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = _parse_args()
+    cases = [
+        c for c in CASES
+        if args.pattern in c[0] and not (args.quick and c[3])
+    ]
+
+    print('%-28s %10s %10s %14s' % ('case', 'min s', 'median s', 'usec/item'))
+    results = run(cases)
+    report = {
+        'commit': _commit(),
+        'date': datetime.datetime.utcnow().isoformat(),
+        'python': platform.python_version(),
+        'lxml': '.'.join(str(n) for n in etree.LXML_VERSION),
+        'platform': platform.platform(),
+        'results': results,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=1, sort_keys=True)
+    print('results written to %s' % args.output)
+
+    if args.compare is None:
+        return 0
+    with open(args.compare) as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.threshold)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -145,6 +145,8 @@ rst_epilog = """
 
 .. |Relationships| replace:: :class:`._Relationships`
 
+.. |Recorder| replace:: :class:`.Recorder`
+
 .. |RGBColor| replace:: :class:`.RGBColor`
 
 .. |_Row| replace:: :class:`._Row`
@@ -159,6 +161,8 @@ rst_epilog = """
 
 .. |Settings| replace:: :class:`.Settings`
 
+.. |Span| replace:: :class:`.Span`
+
 .. |str| replace:: :class:`.str`
 
 .. |Styles| replace:: :class:`.Styles`
@@ -1,10 +1,41 @@
 # encoding: utf-8
 
+import sys
+
 from docx.api import Document  # noqa
 
 __version__ = '0.8.6'
 
 
+# module of each name loaded on first access rather than on import
+_lazy_names = {
+    'MergeTemplate': 'docx.merge',
+    'TemplateCache': 'docx.template',
+    'extract_text': 'docx.streaming',
+    'iter_blocks': 'docx.streaming',
+}
+
+
+def __getattr__(name):
+    """
+    Return the lazily-loaded module attribute *name*, importing the module
+    defining it on first access.
+    """
+    if name not in _lazy_names:
+        raise AttributeError(
+            "module '%s' has no attribute '%s'" % (__name__, name)
+        )
+    module = __import__(_lazy_names[name], fromlist=[name])
+    value = globals()[name] = getattr(module, name)
+    return value
+
+
+if sys.version_info < (3, 7):  # pragma: no cover, no module __getattr__
+    from docx.merge import MergeTemplate  # noqa
+    from docx.streaming import extract_text, iter_blocks  # noqa
+    from docx.template import TemplateCache  # noqa
+
+
 # register custom Part classes with opc package reader
 
 from docx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT # type: ignore
@@ -33,5 +64,5 @@ PartFactory.part_type_for[CT.WML_STYLES] = StylesPart
 
 del (
     CT, CorePropertiesPart, DocumentPart, NumberingPart, PartFactory,
-    StylesPart, part_class_selector
+    StylesPart, part_class_selector, sys
 )
@@ -14,15 +14,25 @@ from docx.opc.constants import CONTENT_TYPE as CT # type: ignore
 from docx.package import Package # type: ignore
 
 
-def Document(docx=None):
+def Document(docx=None, lazy=False):
     """
     Return a |Document| object loaded from *docx*, where *docx* can be
     either a path to a ``.docx`` file (a string) or a file-like object. If
     *docx* is missing or ``None``, the built-in default document "template"
     is loaded.
+
+    When *lazy* is |True|, parts are read from the package and parsed only
+    when first accessed, which makes opening a large package to read a few
+    parts fast and keeps the rest of it out of memory. In that case *docx*
+    must remain available and unchanged while the document is in use, and
+    the package file is kept open until :meth:`.Document.close` is called.
+    Saving a lazily opened document also copies the parts that were never
+    loaded or changed into the new file without recompressing them. A
+    document not opened lazily holds only the uncompressed parts, so each
+    of its parts is compressed again when it is saved.
     """
     docx = _default_docx_path() if docx is None else docx
-    document_part = Package.open(docx).main_document_part
+    document_part = Package.open(docx, lazy).main_document_part
     if document_part.content_type != CT.WML_DOCUMENT_MAIN:
         tmpl = "file '%s' is not a Word file, content type is '%s'"
         raise ValueError(tmpl % (docx, document_part.content_type))
@@ -0,0 +1,149 @@
+# encoding: utf-8
+
+"""
+Saving many documents built from templates in a pool of worker processes.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import os
+import traceback
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from timeit import default_timer
+
+from .api import Document
+from .template import TemplateCache
+
+
+def save_many(jobs, workers=None):
+    """
+    Save each `(doc, target)` pair in *jobs* in a pool of *workers* worker
+    processes, one per CPU when *workers* is |None|, by calling
+    ``doc.save(target)`` in a worker. *doc* is any object having that
+    method and a ``filename`` attribute naming the template it is built
+    from, or |None|. Each worker parses every template file once, and
+    :func:`open_template` called while saving returns a copy of the parsed
+    template. Return a list of one |DocxJobResult| per job, in job order; a
+    failing job does not stop the others. Jobs are pickled to reach the
+    workers, so anything they hold must be picklable; a job that cannot be
+    pickled fails like one raising an error, as do the jobs left unfinished
+    when a worker process dies.
+    """
+    jobs = [(index, doc, target) for index, (doc, target) in enumerate(jobs)]
+    if not jobs:
+        return []
+    workers = workers or os.cpu_count() or 1
+    templates = sorted(set(
+        doc.filename for _, doc, _ in jobs
+        if doc.filename and os.path.isfile(doc.filename)
+    ))
+    with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker,
+            initargs=(templates,)) as executor:
+        futures = [_submit(executor, job) for job in jobs]
+        return [
+            _job_result(job, future) for job, future in zip(jobs, futures)
+        ]
+
+
+def open_template(filename):
+    """
+    Return a new |Document| object loaded from the template at *filename*.
+    In a worker process of :func:`save_many`, it is a copy of the template
+    parsed when the worker started.
+    """
+    if _template_cache is None:
+        return Document(filename)
+    return _template_cache.document(filename)
+
+
+class DocxJobResult(object):
+    """
+    Outcome of one job run by :func:`save_many`: the job *index*, its
+    *target* filename, the time spent rendering and saving it in *seconds*
+    and, if it failed, the formatted traceback of the error as *error*.
+    """
+    def __init__(self, index, target, seconds, error=None):
+        super(DocxJobResult, self).__init__()
+        self.index = index
+        self.target = target
+        self.seconds = seconds
+        self.error = error
+
+    def __repr__(self):
+        status = 'ok' if self.ok else 'failed'
+        return '<DocxJobResult #%d %s %s in %.3fs>' % (
+            self.index, self.target, status, self.seconds
+        )
+
+    @property
+    def ok(self):
+        """
+        |True| if the job succeeded, |False| if it raised an error.
+        """
+        return self.error is None
+
+
+def _init_worker(templates):
+    """
+    Parse each template file in *templates* into the template cache of
+    this worker process.
+    """
+    global _template_cache
+    _template_cache = TemplateCache(max_templates=max(16, len(templates)))
+    for filename in templates:
+        _template_cache.document(filename)
+
+
+def _job_result(job, future):
+    """
+    Return the |DocxJobResult| of *job* from *future*, the future of its
+    run in a worker, including when the job never ran because it could not
+    be pickled or its worker died.
+    """
+    error = future.exception()
+    if error is None:
+        return future.result()
+    index, doc, target = job
+    return DocxJobResult(index, target, 0.0, ''.join(
+        traceback.format_exception(
+            type(error), error, getattr(error, '__traceback__', None)
+        )
+    ))
+
+
+def _run_job(job):
+    """
+    Save the document of *job*, an `(index, doc, target)` 3-tuple, and
+    return its |DocxJobResult|.
+    """
+    index, doc, target = job
+    start = default_timer()
+    try:
+        doc.save(target)
+    except Exception:
+        return DocxJobResult(
+            index, target, default_timer() - start, traceback.format_exc()
+        )
+    return DocxJobResult(index, target, default_timer() - start)
+
+
+def _submit(executor, job):
+    """
+    Return the future of running *job* on *executor*, one already failed
+    when the pool is broken and no longer accepts jobs.
+    """
+    try:
+        return executor.submit(_run_job, job)
+    except BrokenProcessPool as e:
+        future = Future()
+        future.set_exception(e)
+        return future
+
+
+# templates parsed once per worker process by save_many()
+_template_cache = None
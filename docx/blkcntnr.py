@@ -8,8 +8,8 @@ ones like structured document tags.
 
 from __future__ import absolute_import, print_function
 
-from .oxml.table import CT_Tbl
-from .shared import Parented
+from .compat import zip_longest
+from .shared import Parented, ProxySequence
 from .text.paragraph import Paragraph
 
 
@@ -20,6 +20,9 @@ class BlockItemContainer(Parented):
     Provides the shared functionality to add a block item like a paragraph or
     table.
     """
+
+    __slots__ = ('_element',)
+
     def __init__(self, element, parent):
         super(BlockItemContainer, self).__init__(parent)
         self._element = element
@@ -44,27 +47,50 @@ class BlockItemContainer(Parented):
         newly appended to the content in this container. *width* is evenly
         distributed between the table columns.
         """
+        from .oxml.table import CT_Tbl
         from .table import Table
         tbl = CT_Tbl.new_tbl(rows, cols, width)
         self._element._insert_tbl(tbl)
         return Table(tbl, self)
 
+    def add_table_from_rows(self, rows, width, header=None):
+        """
+        Return a table of *width* holding the values in *rows*, newly
+        appended to the content in this container. *rows* is an iterable of
+        row sequences, such as a list of tuples or a two-dimensional NumPy
+        array, or a mapping of column header to column values, such as
+        a dict of lists, whose keys become the header row unless *header*
+        is given. Columns of a mapping shorter than the longest are padded
+        with empty cells, as are short rows. The table XML is built in
+        a single pass, see :meth:`.CT_Tbl.new_tbl_from_rows`.
+        """
+        from .oxml.table import CT_Tbl
+        from .table import Table
+        if hasattr(rows, 'keys'):
+            if header is None:
+                header = list(rows.keys())
+            rows = zip_longest(*[rows[key] for key in rows.keys()])
+        tbl = CT_Tbl.new_tbl_from_rows(rows, width, header)
+        self._element._insert_tbl(tbl)
+        return Table(tbl, self)
+
     @property
     def paragraphs(self):
         """
-        A list containing the paragraphs in this container, in document
-        order. Read-only.
+        A sequence of the paragraphs in this container, in document order.
+        Each |Paragraph| object is created only as it is accessed.
+        Read-only.
         """
-        return [Paragraph(p, self) for p in self._element.p_lst]
+        return ProxySequence(self._element, 'w:p', Paragraph, self)
 
     @property
     def tables(self):
         """
-        A list containing the tables in this container, in document order.
-        Read-only.
+        A sequence of the tables in this container, in document order. Each
+        |Table| object is created only as it is accessed. Read-only.
         """
         from .table import Table
-        return [Table(tbl, self) for tbl in self._element.tbl_lst]
+        return ProxySequence(self._element, 'w:tbl', Table, self)
 
     def _add_paragraph(self):
         """
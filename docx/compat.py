@@ -16,7 +16,9 @@ import sys
 
 if sys.version_info >= (3, 0):
 
+    from collections.abc import Sequence  # noqa
     from io import BytesIO
+    from itertools import zip_longest  # noqa
 
     def is_string(obj):
         """
@@ -32,6 +34,8 @@ if sys.version_info >= (3, 0):
 
 else:
 
+    from collections import Sequence  # noqa
+    from itertools import izip_longest as zip_longest  # noqa
     from StringIO import StringIO as BytesIO  # noqa
 
     def is_string(obj):
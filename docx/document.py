@@ -8,6 +8,7 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+from . import image
 from .blkcntnr import BlockItemContainer
 from .enum.section import WD_SECTION # type: ignore
 from .enum.text import WD_BREAK
@@ -28,6 +29,12 @@ class Document(ElementProxy):
         self._part = part
         self.__body = None
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def add_heading(self, text='', level=1, style=None):
         """
         Return a heading paragraph newly added to the end of the document,
@@ -63,7 +70,8 @@ class Document(ElementProxy):
         """
         return self._body.add_paragraph(text, style)
 
-    def add_picture(self, image_path_or_stream, width=None, height=None):
+    def add_picture(self, image_path_or_stream, width=None, height=None,
+                    downscaler=None):
         """
         Return a new picture shape added in its own paragraph at the end of
         the document. The picture contains the image at
@@ -74,10 +82,32 @@ class Document(ElementProxy):
         preserving the aspect ratio of the image. The native size of the
         picture is calculated using the dots-per-inch (dpi) value specified
         in the image file, defaulting to 72 dpi if no value is specified, as
-        is often the case.
+        is often the case. *image_path_or_stream* may also be a buffer such
+        as |bytes|, a |memoryview| or an ``mmap``, as for
+        :meth:`.Run.add_picture`, which also describes *downscaler*.
         """
         run = self.add_paragraph().add_run()
-        return run.add_picture(image_path_or_stream, width, height)
+        return run.add_picture(image_path_or_stream, width, height, downscaler)
+
+    def add_pictures(self, image_paths_or_streams, width=None, height=None,
+                     max_workers=8, downscaler=None):
+        """
+        Return a list of new picture shapes, one for each image in
+        *image_paths_or_streams*, each added in its own paragraph at the end
+        of the document as by :meth:`add_picture`, with the same *width*
+        and *height* applied to each. The images are read, hashed and
+        parsed on a pool of *max_workers* threads, ahead of their pictures
+        being added on this thread, so for images on slow storage the time
+        spent waiting on reads overlaps. Resampling by *downscaler*, when
+        given, is done on the same threads.
+        """
+        if downscaler is None:
+            images = image.load_images(image_paths_or_streams, max_workers)
+            return [self.add_picture(img, width, height) for img in images]
+        prepared = downscaler.prepare_all(
+            image_paths_or_streams, width, height, max_workers
+        )
+        return [self.add_picture(image, cx, cy) for image, cx, cy in prepared]
 
     def add_section(self, start_type=WD_SECTION.NEW_PAGE):
         """
@@ -101,6 +131,35 @@ class Document(ElementProxy):
         table.style = style
         return table
 
+    def add_table_from_rows(self, rows, style=None, header=None):
+        """
+        Add a table holding the values in *rows*, one cell per value, and
+        having table style *style*. *rows* is an iterable of row sequences,
+        such as a list of tuples or a two-dimensional NumPy array, or
+        a mapping of column header to column values, such as a dict of
+        lists. If *header* is a sequence, its values form a first row that
+        repeats at the top of each page; the keys of a mapping are used when
+        *header* is |None|. Each value is converted with ``str()``, and
+        a |None| value leaves its cell empty. The table is built in one pass,
+        which is much faster than filling the cells of :meth:`add_table`
+        one at a time.
+        """
+        table = self._body.add_table_from_rows(
+            rows, self._block_width, header
+        )
+        table.style = style
+        return table
+
+    def close(self):
+        """
+        Close the package file kept open since this document was opened with
+        ``lazy=True``. Parts not read from the file before then can no longer
+        be loaded, so this is best called once the document is no longer in
+        use. Does nothing for a document not opened lazily. A document is
+        also a context manager that closes it on exit.
+        """
+        self._part.package.close()
+
     @property
     def core_properties(self):
         """
@@ -122,9 +181,11 @@ class Document(ElementProxy):
     @property
     def paragraphs(self):
         """
-        A list of |Paragraph| instances corresponding to the paragraphs in
-        the document, in document order. Note that paragraphs within revision
-        marks such as ``<w:ins>`` or ``<w:del>`` do not appear in this list.
+        A sequence of |Paragraph| instances corresponding to the paragraphs
+        in the document, in document order. Each is created only as it is
+        accessed, so ``len()`` and indexed access stay cheap on a long
+        document. Note that paragraphs within revision marks such as
+        ``<w:ins>`` or ``<w:del>`` do not appear in this sequence.
         """
         return self._body.paragraphs
 
@@ -135,12 +196,19 @@ class Document(ElementProxy):
         """
         return self._part
 
-    def save(self, path_or_stream):
+    def save(self, path_or_stream, streaming=False):
         """
         Save this document to *path_or_stream*, which can be either a path to
         a filesystem location (a string) or a file-like object.
-        """
-        self._part.save(path_or_stream)
+
+        When *streaming* is |True|, the body of the document is serialized
+        block by block directly into the zip archive, so the serialized XML
+        of the document is never held in memory as a whole. This saves the
+        memory taken by that XML, often as much as the document tree itself,
+        but not the memory of the tree, which is built before saving begins.
+        The document is left unchanged and may be saved again.
+        """
+        self._part.save(path_or_stream, streaming)
 
     @property
     def sections(self):
@@ -168,11 +236,11 @@ class Document(ElementProxy):
     @property
     def tables(self):
         """
-        A list of |Table| instances corresponding to the tables in the
+        A sequence of |Table| instances corresponding to the tables in the
         document, in document order. Note that only tables appearing at the
-        top level of the document appear in this list; a table nested inside
-        a table cell does not appear. A table within revision marks such as
-        ``<w:ins>`` or ``<w:del>`` will also not appear in the list.
+        top level of the document appear in this sequence; a table nested
+        inside a table cell does not appear. A table within revision marks
+        such as ``<w:ins>`` or ``<w:del>`` will also not appear.
         """
         return self._body.tables
 
@@ -202,6 +270,9 @@ class _Body(BlockItemContainer):
     Proxy for ``<w:body>`` element in this document, having primarily a
     container role.
     """
+
+    __slots__ = ('_body',)
+
     def __init__(self, body_elm, parent):
         super(_Body, self).__init__(body_elm, parent)
         self._body = body_elm
@@ -212,5 +283,8 @@ class _Body(BlockItemContainer):
         Section properties for the main document story, if present, are
         preserved.
         """
+        had_ids = bool(self._body.xpath('./*[not(self::w:sectPr)]//@id'))
         self._body.clear_content()
+        if had_ids:
+            self.part.rescan_ids()
         return self
@@ -56,10 +56,7 @@ class _DocsPageFormatter(object):
         The docstring of the enumeration, formatted for use at the top of the
         documentation page
         """
-        try:
-            cls_docstring = self._clsdict['__doc__']
-        except KeyError:
-            cls_docstring = ''
+        cls_docstring = self._clsdict.get('__doc__') or ''
         return textwrap.dedent(cls_docstring).strip()
 
     def _member_def(self, member):
@@ -113,9 +110,20 @@ class MetaEnumeration(type):
     def __new__(meta, clsname, bases, clsdict):
         meta._add_enum_members(clsdict)
         meta._collect_valid_settings(clsdict)
-        meta._generate_docs_page(clsname, clsdict)
         return type.__new__(meta, clsname, bases, clsdict)
 
+    @property
+    def __docs_rst__(cls):
+        """
+        The RST documentation page for the enumeration, generated on first
+        access rather than when the enumeration class is defined.
+        """
+        docs_rst = cls.__dict__.get('_docs_rst')
+        if docs_rst is None:
+            docs_rst = _DocsPageFormatter(cls.__name__, cls.__dict__).page_str
+            cls._docs_rst = docs_rst
+        return docs_rst
+
     @classmethod
     def _add_enum_members(meta, clsdict):
         """
@@ -139,15 +147,6 @@ class MetaEnumeration(type):
             valid_settings.extend(member.valid_settings)
         clsdict['_valid_settings'] = valid_settings
 
-    @classmethod
-    def _generate_docs_page(meta, clsname, clsdict):
-        """
-        Return the RST documentation page for the enumeration.
-        """
-        clsdict['__docs_rst__'] = (
-            _DocsPageFormatter(clsname, clsdict).page_str
-        )
-
 
 class EnumerationBase(object):
     """
@@ -0,0 +1,248 @@
+# encoding: utf-8
+
+"""
+Command-line tool extracting the text and metadata of many ``.docx`` files
+in parallel, writing one JSON record per file to stdout::
+
+    python -m docx.extract [-j JOBS] [--no-text] PATH [PATH ...]
+
+Each *PATH* is a ``.docx`` file, a directory searched recursively for
+``.docx`` files, or a glob pattern such as ``'reports/**/*.docx'``. A file
+that cannot be read produces a record with an ``error`` key and extraction
+carries on with the next file. Progress and a final throughput summary in
+files per second are written to stderr.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .opc.constants import RELATIONSHIP_TYPE as RT
+from .opc.coreprops import CoreProperties
+from .opc.pkgreader import PackageReader
+from .oxml import parse_xml
+from .streaming import iter_paragraph_text
+from .styles import BabelFish
+
+
+def main(argv=None):
+    """
+    Run the extraction described by the command-line arguments *argv*,
+    ``sys.argv[1:]`` when |None|, and return the process exit status, 1 if
+    any file could not be read, 0 otherwise.
+    """
+    args = _parse_args(argv)
+    paths = _iter_docx_paths(args.paths)
+    out, err = sys.stdout, sys.stderr
+    count = errors = 0
+    start = time.time()
+    for record in _iter_records(paths, args.jobs, not args.no_text):
+        out.write(json.dumps(record, sort_keys=True) + '\n')
+        count += 1
+        errors += 'error' in record
+        if args.progress and count % args.progress == 0:
+            err.write(_throughput(count, errors, time.time() - start))
+    out.flush()
+    err.write(_throughput(count, errors, time.time() - start))
+    return 1 if errors else 0
+
+
+def extract_file(path, include_text=True):
+    """
+    Return a dict holding the text, core properties, style usage and image
+    count of the ``.docx`` file at *path*, ready to serialize as JSON. If the
+    file cannot be read, the dict holds an ``error`` message instead. Text
+    is one string with the paragraphs separated by ``\\n`` and is omitted
+    when *include_text* is |False|. Style usage maps the UI name of each
+    style referenced in the main document to its number of references.
+    """
+    try:
+        with open(path, 'rb') as f:
+            return _extract(f, path, include_text)
+    except Exception as e:
+        return {'path': path, 'error': '%s: %s' % (type(e).__name__, e)}
+
+
+def _extract(pkg_file, path, include_text):
+    """
+    Return the extraction record for the package in open file *pkg_file*.
+    Part blobs are read from the package only as each is needed, and the
+    main document part is stream-parsed.
+    """
+    pkg_reader = PackageReader.from_file(pkg_file, lazy=True)
+    try:
+        blobs, image_count = {}, 0
+        for partname, content_type, reltype, blob in pkg_reader.iter_sparts():
+            if reltype == RT.IMAGE:
+                image_count += 1
+            else:
+                blobs.setdefault(reltype, blob)
+        if RT.OFFICE_DOCUMENT not in blobs:
+            raise ValueError('package has no main document part')
+
+        style_counts = Counter()
+        with blobs[RT.OFFICE_DOCUMENT].open() as stream:
+            texts = list(iter_paragraph_text(stream, style_counts))
+
+        record = {
+            'path': path,
+            'paragraphs': len(texts),
+            'images': image_count,
+            'core_properties': _core_properties(
+                blobs.get(RT.CORE_PROPERTIES)
+            ),
+            'styles': _style_usage(style_counts, blobs.get(RT.STYLES)),
+        }
+    finally:
+        pkg_reader.close()
+    if include_text:
+        record['text'] = '\n'.join(texts)
+    return record
+
+
+def _core_properties(blob):
+    """
+    Return a dict of the core document properties in the core properties
+    part *blob*, a |DeferredBlob|, leaving out those not set. Returns an
+    empty dict when the package has no core properties part.
+    """
+    if blob is None:
+        return {}
+    core_properties = CoreProperties(parse_xml(blob.load()))
+    props = {}
+    for name in _CORE_PROPERTY_NAMES:
+        value = getattr(core_properties, name)
+        if value is None or value == '':
+            continue
+        if hasattr(value, 'isoformat'):
+            value = value.isoformat()
+        props[name] = value
+    return props
+
+
+def _style_usage(style_counts, blob):
+    """
+    Return a dict mapping the UI name of each style in *style_counts* to its
+    reference count, looking up names in the styles part *blob*. A style id
+    not defined in the styles part is reported as-is.
+    """
+    names = {}
+    if blob is not None:
+        for style in parse_xml(blob.load()).style_lst:
+            if style.name_val is not None:
+                names[style.styleId] = BabelFish.internal2ui(style.name_val)
+    usage = {}
+    for style_id, count in style_counts.items():
+        name = names.get(style_id, style_id)
+        usage[name] = usage.get(name, 0) + count
+    return usage
+
+
+def _iter_docx_paths(paths):
+    """
+    Generate the path of each ``.docx`` file named by *paths*, expanding
+    directories recursively and glob patterns as they are reached so a
+    large tree starts producing paths right away. Temporary Word lock files
+    starting with ``~$`` are skipped.
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            for dirpath, dirnames, filenames in os.walk(path):
+                dirnames.sort()
+                for filename in sorted(filenames):
+                    if _is_docx_filename(filename):
+                        yield os.path.join(dirpath, filename)
+        elif glob.has_magic(path):
+            for match in sorted(glob.iglob(path, recursive=True)):
+                if os.path.isfile(match) and not _is_lock_file(match):
+                    yield match
+        else:
+            yield path
+
+
+def _is_docx_filename(filename):
+    return filename.lower().endswith('.docx') and not _is_lock_file(filename)
+
+
+def _is_lock_file(path):
+    return os.path.basename(path).startswith('~$')
+
+
+def _iter_records(paths, jobs, include_text):
+    """
+    Generate the extraction record of each path in *paths*, in order. Files
+    are extracted by a pool of *jobs* worker processes, or in this process
+    when *jobs* is 1. A fixed number of files is kept in flight, a new one
+    submitted as the oldest record is generated, so workers are kept busy
+    while memory use does not grow with the number of files.
+    """
+    if jobs == 1:
+        for path in paths:
+            yield extract_file(path, include_text)
+        return
+    window = _IN_FLIGHT_PER_JOB * (jobs or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        pending = deque()
+        for path in paths:
+            pending.append(executor.submit(extract_file, path, include_text))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog='python -m docx.extract',
+        description=(
+            'Extract the text, core properties, style usage and image count '
+            'of .docx files as JSON Lines.'
+        ),
+    )
+    parser.add_argument(
+        'paths', nargs='+', metavar='PATH',
+        help='a .docx file, a directory to search or a glob pattern',
+    )
+    parser.add_argument(
+        '-j', '--jobs', type=int, default=None,
+        help='number of worker processes, default one per CPU',
+    )
+    parser.add_argument(
+        '--no-text', action='store_true',
+        help='leave the document text out of each record',
+    )
+    parser.add_argument(
+        '--progress', type=int, default=1000, metavar='N',
+        help='report throughput every N files, 0 for a final summary only',
+    )
+    return parser.parse_args(argv)
+
+
+def _throughput(count, errors, elapsed):
+    rate = count / elapsed if elapsed else 0.0
+    return '%d files, %d errors in %.1fs (%.1f files/s)\n' % (
+        count, errors, elapsed, rate
+    )
+
+
+_IN_FLIGHT_PER_JOB = 64
+
+_CORE_PROPERTY_NAMES = (
+    'author', 'category', 'comments', 'content_status', 'created',
+    'identifier', 'keywords', 'language', 'last_modified_by', 'last_printed',
+    'modified', 'revision', 'subject', 'title', 'version',
+)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
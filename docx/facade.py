@@ -1,16 +1,18 @@
 
-from PIL import Image # type: ignore
 import docx # type: ignore
 import docx.document # type: ignore
 from docx.shared import Cm, Pt # type: ignore
 from docx.enum.dml import MSO_THEME_COLOR_INDEX as MSO_THEME_COLOR # type: ignore
 from docx.enum.section import WD_SECTION_START # type: ignore
 from docx.enum.section import WD_ORIENTATION # type: ignore
+from docx.image import probe # type: ignore
+from docx.instrument import span # type: ignore
 from docx.oxml import OxmlElement # type: ignore
 from docx.oxml.ns import qn # type: ignore
-from typing import Callable, List, cast
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple, cast
 from docx.text.paragraph import Paragraph # type: ignore
 from docx.table import Table # type: ignore
+from docx.batch import DocxJobResult, open_template, save_many # type: ignore
 import abc
 import uno  # type: ignore
 import Danny.OOo.OOoLib
@@ -142,8 +144,8 @@ class DocxEntityPicture(IDocxEntityRenderer):
             width = self.width
             
         # ajuster de sorte que l'image ne sorte pas de la page verticalement
-        im = Image.open(imagePath)
-        ratio = im.size[0] / float(im.size[1])
+        header = probe(imagePath)
+        ratio = header.px_width / float(header.px_height)
         computedHeight = width / ratio
         if last_section.orientation == WD_ORIENTATION.LANDSCAPE:  # @UndefinedVariable pylint: disable=no-member
             if computedHeight > self.MAX_HEIGHT or (self.height and self.height > self.MAX_HEIGHT):
@@ -222,6 +224,19 @@ class DocxEntityTable((IDocxEntityRenderer)):
         if self.caption:
             doc.add_paragraph(Docx.DEFAULT_TABLEAU+self.key+" : "+ self.caption, Docx.DEFAULT_STYLE_LEGENDE_TABLEAU)
 
+class DocxEntityTableFromRows(DocxEntityTable):
+    """
+    Table whose cell values are known up front, built in one pass with Document.add_table_from_rows
+    instead of cell by cell through a TableConstructor.
+    """
+    def __init__(self, rows: Iterable, caption: str=None, style: str=None, header: Sequence=None) -> None:
+        self.data, self.header, self.caption, self.style = rows, header, caption, style
+        self.key = "?"
+    def render(self, doc: docx.document.Document) -> None:
+        doc.add_table_from_rows(self.data, self.style, self.header)
+        if self.caption:
+            doc.add_paragraph(Docx.DEFAULT_TABLEAU+self.key+" : "+ self.caption, Docx.DEFAULT_STYLE_LEGENDE_TABLEAU)
+
 class DocxEntityTOC(IDocxEntityRenderer):
     def __init__(self, titre:str, command:str) -> None:
         self.command, self.titre = command, titre
@@ -302,9 +317,11 @@ class DocxEntity(IDocxEntityRenderer):
         paragraph_format.space_after = Pt(12)
         
     def render(self, doc: docx.document.Document) -> None:
-        self.initialize(doc)
-        for obj in self.entities:
-            obj.render(doc)
+        with span('document.render', filename=self.filename, entities=len(self.entities)):
+            self.initialize(doc)
+            for obj in self.entities:
+                with span('entity.render', entity=type(obj).__name__):
+                    obj.render(doc)
 
 class Docx(object):
     
@@ -400,9 +417,12 @@ class Docx(object):
     def table(self, callback: TableConstructor, rows: int, cols: int, caption=None, style=None) -> DocxEntityTable:
         return cast(DocxEntityTable, self.entity.append(DocxEntityTable(callback, rows, cols, caption, style)))
 
+    def table_from_rows(self, rows: Iterable, caption=None, style=None, header: Sequence=None) -> DocxEntityTableFromRows:
+        return cast(DocxEntityTableFromRows, self.entity.append(DocxEntityTableFromRows(rows, caption, style, header)))
+
     def save(self, target:str=None, pre: Callable[[docx.document.Document],None]=None) -> None:
         if self.filename:
-            d = docx.Document(self.filename)
+            d = open_template(self.filename)
         else:
             d = docx.Document()
         #for i in d.styles:
@@ -416,6 +436,17 @@ class Docx(object):
             filename = self.filename
         d.save(filename)
 
+    @staticmethod
+    def save_many(jobs: Iterable[Tuple['Docx', str]], workers: Optional[int]=None) -> List[DocxJobResult]:
+        """
+        Render and save each (docx, target) pair of jobs in a pool of worker processes, one per core
+        unless workers is given. Each worker parses every template file once and builds the document
+        of each of its jobs from a copy of the parsed template. Returns one DocxJobResult per job, in
+        job order; a failing job does not stop the others. Jobs are pickled to reach the workers, so
+        any _ref callable or TableConstructor they hold must be defined at module level.
+        """
+        return save_many(jobs, workers)
+
     def export_pdf(self, target:str=None, source:str=None):
         ## open docx with libreoffice
         if source:
@@ -9,21 +9,60 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
-from docx.image.bmp import Bmp
-from docx.image.gif import Gif
-from docx.image.jpeg import Exif, Jfif
-from docx.image.png import Png
-from docx.image.tiff import Tiff
-
-
-SIGNATURES = (
-    # class, offset, signature_bytes
-    (Png,  0, b'\x89PNG\x0D\x0A\x1A\x0A'),
-    (Jfif, 6, b'JFIF'),
-    (Exif, 6, b'Exif'),
-    (Gif,  0, b'GIF87a'),
-    (Gif,  0, b'GIF89a'),
-    (Tiff, 0, b'MM\x00*'),  # big-endian (Motorola) TIFF
-    (Tiff, 0, b'II*\x00'),  # little-endian (Intel) TIFF
-    (Bmp,  0, b'BM'),
-)
+import sys
+
+
+def _signatures():
+    """
+    Return the `(class, offset, signature_bytes)` 3-tuple identifying each
+    image format by the bytes at *offset* in its header.
+    """
+    from docx.image.bmp import Bmp
+    from docx.image.gif import Gif
+    from docx.image.jpeg import Exif, Jfif
+    from docx.image.png import Png
+    from docx.image.tiff import Tiff
+    return (
+        # class, offset, signature_bytes
+        (Png,  0, b'\x89PNG\x0D\x0A\x1A\x0A'),
+        (Jfif, 6, b'JFIF'),
+        (Exif, 6, b'Exif'),
+        (Gif,  0, b'GIF87a'),
+        (Gif,  0, b'GIF89a'),
+        (Tiff, 0, b'MM\x00*'),  # big-endian (Motorola) TIFF
+        (Tiff, 0, b'II*\x00'),  # little-endian (Intel) TIFF
+        (Bmp,  0, b'BM'),
+    )
+
+
+# module of each name loaded on first access rather than on import
+_lazy_names = {
+    'Downscaler': 'docx.image.downscale',
+    'load_images': 'docx.image.pool',
+    'probe': 'docx.image.image',
+}
+
+
+def __getattr__(name):
+    """
+    Return the value of the lazily-loaded module attribute *name*, loading
+    the image header classes or the module defining it on first access.
+    """
+    if name == 'SIGNATURES':
+        value = _signatures()
+    elif name in _lazy_names:
+        module = __import__(_lazy_names[name], fromlist=[name])
+        value = getattr(module, name)
+    else:
+        raise AttributeError(
+            "module '%s' has no attribute '%s'" % (__name__, name)
+        )
+    globals()[name] = value
+    return value
+
+
+if sys.version_info < (3, 7):  # pragma: no cover, no module __getattr__
+    SIGNATURES = _signatures()
+    from docx.image.downscale import Downscaler  # noqa
+    from docx.image.image import probe  # noqa
+    from docx.image.pool import load_images  # noqa
@@ -0,0 +1,155 @@
+# encoding: utf-8
+
+"""
+|Downscaler| object, an optional stage in adding a picture that resamples
+an image to the resolution it is displayed at before it is embedded.
+Requires the Pillow package.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import math
+import threading
+
+from collections import OrderedDict
+
+from ..compat import BytesIO
+from ..shared import Emu
+from .constants import MIME_TYPE
+from .image import Image
+from .pool import imap_ordered
+
+
+class Downscaler(object):
+    """
+    Resamples images larger than needed for the size they are displayed at
+    down to *dpi* dots per inch at that size, re-encoding JPEG images as JPEG
+    at *quality* and other images as PNG. Images already at or below the
+    target resolution, and GIF images, are left unchanged. The last
+    *max_cached* results are cached by image SHA1, target pixel size and
+    dpi, so an image added more than once at the same size is resampled only
+    once while it stays cached.
+
+    A |Downscaler| may be used from several threads at once.
+    """
+    def __init__(self, dpi=150, quality=85, max_cached=64):
+        super(Downscaler, self).__init__()
+        self._dpi = dpi
+        self._quality = quality
+        self._max_cached = max_cached
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def dpi(self):
+        """
+        Resolution in dots per inch that images are resampled to.
+        """
+        return self._dpi
+
+    def prepare(self, image_descriptor, width=None, height=None):
+        """
+        Return an `(image, width, height)` 3-tuple for the picture of the
+        image identified by *image_descriptor*, a path, file-like object,
+        buffer or |Image| instance, displayed at *width* and *height* as for
+        :meth:`.Document.add_picture`. *image* is an |Image| resampled for
+        that size when it is larger than needed, and *width* and *height*
+        are the display size as |Length| values, both calculated from the
+        original image so the picture has the size it would have had
+        without resampling.
+        """
+        if isinstance(image_descriptor, Image):
+            image = image_descriptor
+        else:
+            image = Image.from_file(image_descriptor)
+        width, height = image.scaled_dimensions(width, height)
+        return self.downscale(image, width, height), width, height
+
+    def prepare_all(self, image_descriptors, width=None, height=None,
+                    max_workers=8):
+        """
+        Generate an `(image, width, height)` 3-tuple as returned by
+        :meth:`prepare` for each item in *image_descriptors*, in order,
+        loading and resampling the images on a pool of *max_workers*
+        threads. Only a few images per thread are prepared ahead of the one
+        last generated, as for :func:`.load_images`.
+        """
+        def prepare(image_descriptor):
+            return self.prepare(image_descriptor, width, height)
+
+        return imap_ordered(prepare, image_descriptors, max_workers)
+
+    def downscale(self, image, width, height):
+        """
+        Return an |Image| holding *image* resampled to this downscaler's dpi
+        at a display size of *width* by *height* EMU, or *image* itself when
+        it is already small enough or is not of a format resampled.
+        """
+        px_width, px_height = self._target_px(width, height)
+        if image.content_type == MIME_TYPE.GIF or (
+                px_width >= image.px_width or px_height >= image.px_height):
+            return image
+        key = (image.sha1, px_width, px_height, self._dpi)
+        with self._lock:
+            downscaled = self._cache.pop(key, None)
+            if downscaled is not None:
+                self._cache[key] = downscaled
+        if downscaled is None:
+            downscaled = self._resample(image, px_width, px_height)
+            with self._lock:
+                downscaled = self._cache.setdefault(key, downscaled)
+                while len(self._cache) > self._max_cached:
+                    self._cache.popitem(last=False)
+        return downscaled
+
+    def _resample(self, image, px_width, px_height):
+        """
+        Return a new |Image| holding *image* resampled to *px_width* by
+        *px_height* pixels and re-encoded.
+        """
+        PILImage = _pil_image()
+        pil_image = PILImage.open(BytesIO(image.blob))
+        is_jpeg = image.content_type == MIME_TYPE.JPEG
+        options = {'dpi': (self._dpi, self._dpi), 'optimize': True}
+        if is_jpeg:
+            # let the decoder skip detail that is about to be discarded
+            pil_image.draft(pil_image.mode, (px_width, px_height))
+            options['quality'] = self._quality
+            if pil_image.info.get('exif'):
+                options['exif'] = pil_image.info['exif']
+        elif pil_image.mode not in ('L', 'LA', 'RGB', 'RGBA'):
+            pil_image = pil_image.convert('RGBA')
+        resized = pil_image.resize((px_width, px_height), PILImage.LANCZOS)
+
+        stream = BytesIO()
+        resized.save(stream, 'JPEG' if is_jpeg else 'PNG', **options)
+        filename = '%s.%s' % (
+            image.filename.rsplit('.', 1)[0], 'jpg' if is_jpeg else 'png'
+        )
+        downscaled = Image.from_blob(stream.getvalue(), filename)
+        downscaled.sha1
+        return downscaled
+
+    def _target_px(self, width, height):
+        """
+        Return the `(px_width, px_height)` pixel size at this downscaler's
+        dpi of an image displayed at *width* by *height* EMU.
+        """
+        def px(emu):
+            return max(int(math.ceil(Emu(emu).inches * self._dpi)), 1)
+        return px(width), px(height)
+
+
+def _pil_image():
+    """
+    Return the Pillow ``Image`` module, raising |ImportError| with a helpful
+    message if Pillow is not installed.
+    """
+    try:
+        from PIL import Image as PILImage
+    except ImportError:
+        raise ImportError(
+            'resampling images requires the Pillow package, install it with '
+            '"pip install Pillow"'
+        )
+    return PILImage
@@ -11,6 +11,62 @@ BIG_ENDIAN = '>'
 LITTLE_ENDIAN = '<'
 
 
+def byte_view(buffer):
+    """
+    Return a one-dimensional, byte-format |memoryview| of *buffer*, any
+    object supporting the buffer protocol, sharing its memory. Raises
+    |TypeError| if *buffer* does not support the buffer protocol.
+    """
+    view = memoryview(buffer)
+    if view.ndim != 1 or view.format != 'B':
+        view = view.cast('B')
+    return view
+
+
+class BufferStream(object):
+    """
+    Read-only file-like object over *buffer*, any object supporting the
+    buffer protocol such as |bytes|, |memoryview| or an ``mmap``, reading
+    from the buffer in place rather than from a copy of it. Only the bytes
+    returned by :meth:`read` are copied.
+    """
+    def __init__(self, buffer):
+        super(BufferStream, self).__init__()
+        self._view = byte_view(buffer)
+        self._pos = 0
+
+    def read(self, count=-1):
+        """
+        Return up to *count* bytes from the current position, or all the
+        remaining bytes when *count* is negative.
+        """
+        start = self._pos
+        end = len(self._view) if count < 0 else start + count
+        self._pos = min(end, len(self._view))
+        return self._view[start:self._pos].tobytes()
+
+    def seek(self, offset, whence=0):
+        base = (0, self._pos, len(self._view))[whence]
+        self._pos = max(base + offset, 0)
+        return self._pos
+
+    def tell(self):
+        return self._pos
+
+    def unpack(self, struct):
+        """
+        Return the tuple of values unpacked by *struct*, a :class:`Struct`
+        instance, from the buffer at the current position, and advance past
+        them. Raises |UnexpectedEndOfFileError| if the buffer ends first.
+        """
+        end = self._pos + struct.size
+        if end > len(self._view):
+            raise UnexpectedEndOfFileError
+        values = struct.unpack_from(self._view, self._pos)
+        self._pos = end
+        return values
+
+
 class StreamReader(object):
     """
     Wraps a file-like object to provide access to structured data from a
@@ -93,5 +149,8 @@ class StreamReader(object):
         return self._unpack_item(struct, base, offset)
 
     def _unpack_item(self, struct, base, offset):
+        if isinstance(self._stream, BufferStream):
+            self.seek(base, offset)
+            return self._stream.unpack(struct)[0]
         bytes_ = self._read_bytes(struct.size, base, offset)
         return struct.unpack(bytes_)[0]
@@ -10,8 +10,11 @@ from __future__ import absolute_import, division, print_function
 import hashlib
 import os
 
+from collections import OrderedDict
+
 from ..compat import BytesIO, is_string
 from .exceptions import UnrecognizedImageError
+from .helpers import BufferStream, byte_view
 from ..shared import Emu, Inches, lazyproperty
 
 
@@ -27,32 +30,52 @@ class Image(object):
         self._image_header = image_header
 
     @classmethod
-    def from_blob(cls, blob):
+    def from_blob(cls, blob, filename=None):
         """
         Return a new |Image| subclass instance parsed from the image binary
-        contained in *blob*.
+        contained in *blob*. *filename* is the name of the file the image
+        was read from, if any. *blob* may be any object supporting the
+        buffer protocol, such as a |memoryview| or an ``mmap``, in which
+        case the image is parsed and kept in place without being copied, so
+        the buffer must not change while the image is in use.
         """
-        stream = BytesIO(blob)
-        return cls._from_stream(stream, blob)
+        if isinstance(blob, bytes):
+            return cls._from_stream(BytesIO(blob), blob, filename)
+        blob = byte_view(blob)
+        return cls._from_stream(BufferStream(blob), blob, filename)
 
     @classmethod
     def from_file(cls, image_descriptor):
         """
         Return a new |Image| subclass instance loaded from the image file
-        identified by *image_descriptor*, a path or file-like object.
+        identified by *image_descriptor*, a path, a file-like object or
+        a buffer holding the image bytes as accepted by :meth:`from_blob`.
         """
+        blob, filename = cls.read_blob(image_descriptor)
+        return cls.from_blob(blob, filename)
+
+    @classmethod
+    def read_blob(cls, image_descriptor):
+        """
+        Return a `(blob, filename)` 2-tuple holding the bytes of the image
+        identified by *image_descriptor*, as accepted by :meth:`from_file`,
+        and the name of its file, or |None| when there is no file name. The
+        image is not parsed, so its bytes can be hashed first. A buffer is
+        used in place rather than copied, so the blob is then a |memoryview|
+        of it, unless it is |bytes|.
+        """
+        if _is_buffer(image_descriptor):
+            if isinstance(image_descriptor, bytes):
+                return image_descriptor, None
+            return byte_view(image_descriptor), None
         if is_string(image_descriptor):
             path = image_descriptor
             with open(path, 'rb') as f:
                 blob = f.read()
-                stream = BytesIO(blob)
-            filename = os.path.basename(path)
-        else:
-            stream = image_descriptor
-            stream.seek(0)
-            blob = stream.read()
-            filename = None
-        return cls._from_stream(stream, blob, filename)
+            return blob, os.path.basename(path)
+        stream = image_descriptor
+        stream.seek(0)
+        return stream.read(), None
 
     @property
     def blob(self):
@@ -179,6 +202,51 @@ class Image(object):
         return cls(blob, filename, image_header)
 
 
+def probe(path):
+    """
+    Return the image header of the image file at *path*, a |BaseImageHeader|
+    subclass instance such as |Png| providing the content type, pixel
+    dimensions and dpi of the image. Only the bytes the header parser for
+    the image format needs are read, not the whole file.
+
+    Results are memoized by absolute path for the most recently probed
+    :data:`_PROBE_CACHE_SIZE` files, and a file is probed again only when
+    its modification time or size has changed since it was last probed.
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    stamp = (stat.st_mtime, stat.st_size)
+    cached = _probe_cache.pop(path, None)
+    if cached is None or cached[0] != stamp:
+        with open(path, 'rb') as f:
+            cached = (stamp, _ImageHeaderFactory(f))
+    _probe_cache[path] = cached
+    while len(_probe_cache) > _PROBE_CACHE_SIZE:
+        _probe_cache.popitem(last=False)
+    return cached[1]
+
+
+# (stamp, image_header) pair for each path probed, keyed by absolute path,
+# least recently used first
+_PROBE_CACHE_SIZE = 1024
+_probe_cache = OrderedDict()
+
+
+def _is_buffer(obj):
+    """
+    Return |True| if *obj* is a buffer holding image bytes, such as |bytes|,
+    a |memoryview| or an ``mmap``, rather than a path or a file-like object.
+    A |str| path is not a buffer, although |bytes| is on Python 2.
+    """
+    if is_string(obj):
+        return False
+    try:
+        memoryview(obj)
+    except TypeError:
+        return False
+    return True
+
+
 def _ImageHeaderFactory(stream):
     """
     Return a |BaseImageHeader| subclass instance that knows how to parse the
@@ -186,8 +186,10 @@ class _ChunkParser(object):
     def _iter_chunk_offsets(self):
         """
         Generate a (chunk_type, chunk_offset) 2-tuple for each of the chunks
-        in the PNG image stream. Iteration stops after the IEND chunk is
-        returned.
+        in the PNG image stream. Iteration stops after the first IDAT chunk
+        is returned, since the chunks holding header properties must come
+        before it, or after the IEND chunk in an image with no IDAT chunk.
+        This keeps parsing from walking the image data.
         """
         chunk_offset = 8
         while True:
@@ -195,7 +197,7 @@ class _ChunkParser(object):
             chunk_type = self._stream_rdr.read_str(4, chunk_offset, 4)
             data_offset = chunk_offset + 8
             yield chunk_type, data_offset
-            if chunk_type == 'IEND':
+            if chunk_type in (PNG_CHUNK_TYPE.IDAT, PNG_CHUNK_TYPE.IEND):
                 break
             # incr offset for chunk len long, chunk type, chunk data, and CRC
             chunk_offset += (4 + 4 + chunk_data_len + 4)
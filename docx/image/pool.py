@@ -0,0 +1,63 @@
+# encoding: utf-8
+
+"""
+Loading and preparing images ahead of their use on a pool of threads.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from .image import Image
+
+
+def imap_ordered(func, items, max_workers):
+    """
+    Generate the result of calling *func* on each item in *items*, in order,
+    the calls being made on a pool of *max_workers* threads. At most
+    :data:`_IN_FLIGHT_PER_WORKER` times *max_workers* items are in flight, a
+    new one submitted as the oldest result is generated, so memory use does
+    not grow with the number of items when the caller is slower than the
+    pool. An exception raised by *func* is raised when its item is reached,
+    and calls not yet started are then cancelled.
+    """
+    window = _IN_FLIGHT_PER_WORKER * max_workers
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        try:
+            for item in items:
+                pending.append(executor.submit(func, item))
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def load_images(image_descriptors, max_workers=8):
+    """
+    Generate an |Image| instance for each item in *image_descriptors*, in
+    order. Each item is a path, file-like object or buffer as accepted by
+    :meth:`Image.from_file`. Images are read, hashed and have their headers
+    parsed ahead of being generated, on a pool of *max_workers* threads, so
+    waiting on storage overlaps with the caller's work on images already
+    generated. An error loading an image is raised when that image is
+    reached.
+    """
+    return imap_ordered(_load_image, image_descriptors, max_workers)
+
+
+def _load_image(image_descriptor):
+    """
+    Return the |Image| for *image_descriptor* with its SHA1 hash already
+    computed.
+    """
+    image = Image.from_file(image_descriptor)
+    image.sha1
+    return image
+
+
+_IN_FLIGHT_PER_WORKER = 4
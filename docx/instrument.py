@@ -0,0 +1,264 @@
+# encoding: utf-8
+
+"""
+Opt-in instrumentation of the work done opening, building and saving
+documents, reported as timed spans to a callback.
+
+Spans are emitted for opening a package, parsing and serializing each XML
+part, writing each zip member, adding an image and rendering each entity
+of a :class:`.facade.DocxEntity`. Instrumentation is disabled by default,
+and while disabled each instrumented operation costs one function call.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import threading
+
+from timeit import default_timer
+
+from .compat import is_string
+
+
+_callback = None
+_local = threading.local()
+
+
+def enable(callback):
+    """
+    Start emitting spans, calling *callback* with each |Span| as it ends.
+    *callback* is called on the thread that did the work, so it must be
+    safe to call from several threads at once when documents are built on
+    more than one thread. A |Recorder| instance may be used as *callback*.
+    Replaces any callback already enabled.
+    """
+    global _callback
+    _callback = callback
+
+
+def disable():
+    """
+    Stop emitting spans.
+    """
+    global _callback
+    _callback = None
+
+
+def is_enabled():
+    """
+    |True| if spans are being emitted, |False| otherwise.
+    """
+    return _callback is not None
+
+
+def span(name, **attrs):
+    """
+    Return a context manager timing the work done in its ``with`` block as
+    a span named *name*, having the keyword arguments as its attributes.
+    When instrumentation is disabled, a shared do-nothing context manager is
+    returned. The object bound by ``as`` is false in that case, so
+    attributes that are costly to compute can be added only when they will
+    be reported::
+
+        with span('part.parse', partname=partname) as s:
+            element = parse_xml(blob)
+            if s:
+                s.set(elements=count_elements(element))
+    """
+    callback = _callback
+    if callback is None:
+        return _null_span
+    return Span(name, attrs, callback)
+
+
+def count_elements(element):
+    """
+    Return the number of elements in the tree rooted at *element*, including
+    *element* itself.
+    """
+    return sum(1 for _ in element.iter())
+
+
+class Span(object):
+    """
+    A timed piece of work, such as parsing one part. *name* is a dotted
+    name identifying the kind of work, like ``'part.parse'``, and *attrs* is
+    a dict of the attributes describing it, like the partname and the number
+    of bytes parsed. *start* and *end* are in seconds, from an arbitrary
+    starting point that is the same for all spans in a process. *parent* is
+    the span that was open on the same thread when this one began, or
+    |None|.
+    """
+
+    __slots__ = (
+        'name', 'attrs', 'start', 'end', 'parent', 'thread_id', '_callback'
+    )
+
+    def __init__(self, name, attrs, callback):
+        self.name = name
+        self.attrs = attrs
+        self.start = self.end = None
+        self.parent = None
+        self.thread_id = None
+        self._callback = callback
+
+    def __bool__(self):
+        return True
+
+    __nonzero__ = __bool__
+
+    def __enter__(self):
+        self.parent = getattr(_local, 'span', None)
+        self.thread_id = threading.current_thread().ident
+        _local.span = self
+        self.start = default_timer()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.end = default_timer()
+        _local.span = self.parent
+        if exc_type is not None:
+            self.attrs['error'] = exc_type.__name__
+        self._callback(self)
+
+    def __repr__(self):
+        return '<Span %s %.3fms %r>' % (
+            self.name, self.duration * 1000.0, self.attrs
+        )
+
+    @property
+    def duration(self):
+        """
+        Time in seconds taken by the work of this span.
+        """
+        return self.end - self.start
+
+    @property
+    def path(self):
+        """
+        Tuple of the names of the spans enclosing this one, outermost first,
+        followed by the name of this span.
+        """
+        names = []
+        span = self
+        while span is not None:
+            names.append(span.name)
+            span = span.parent
+        return tuple(reversed(names))
+
+    def set(self, **attrs):
+        """
+        Add the keyword arguments to the attributes of this span.
+        """
+        self.attrs.update(attrs)
+
+
+class _NullSpan(object):
+    """
+    Stands in for a |Span| when instrumentation is disabled.
+    """
+
+    __slots__ = ()
+
+    def __bool__(self):
+        return False
+
+    __nonzero__ = __bool__
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    def set(self, **attrs):
+        pass
+
+
+_null_span = _NullSpan()
+
+
+class Recorder(object):
+    """
+    Span callback keeping each span it is called with, in the order they
+    end, and exporting them for viewing as a flame graph, either as JSON in
+    the trace event format read by ``chrome://tracing``, Perfetto and
+    speedscope, or as the folded stacks read by ``flamegraph.pl``.
+    """
+    def __init__(self):
+        super(Recorder, self).__init__()
+        self._spans = []
+
+    def __call__(self, span):
+        self._spans.append(span)
+
+    def clear(self):
+        """
+        Forget the spans recorded so far.
+        """
+        del self._spans[:]
+
+    def folded(self):
+        """
+        Return the recorded spans as folded stacks, one line for each
+        distinct stack of span names, like ``package.open;part.parse 1520``,
+        where the number is the time in microseconds spent in the innermost
+        span of that stack and not in spans it encloses.
+        """
+        self_times, child_times = {}, {}
+        for span in self._spans:
+            if span.parent is not None:
+                key = id(span.parent)
+                child_times[key] = child_times.get(key, 0.0) + span.duration
+        for span in self._spans:
+            stack = ';'.join(span.path)
+            self_time = span.duration - child_times.get(id(span), 0.0)
+            self_times[stack] = self_times.get(stack, 0.0) + self_time
+        return ''.join(
+            '%s %d\n' % (stack, round(self_times[stack] * 1e6))
+            for stack in sorted(self_times)
+        )
+
+    @property
+    def spans(self):
+        """
+        List of the recorded spans, in the order they ended.
+        """
+        return list(self._spans)
+
+    def trace(self):
+        """
+        Return the recorded spans as a trace event format dict, ready to be
+        serialized as JSON, having a complete event for each span with its
+        attributes as the event arguments. Times are in microseconds from
+        the start of the earliest span.
+        """
+        origin = min(span.start for span in self._spans) if self._spans else 0
+        events = [
+            {
+                'name': span.name,
+                'cat': 'docx',
+                'ph': 'X',
+                'ts': round((span.start - origin) * 1e6, 3),
+                'dur': round(span.duration * 1e6, 3),
+                'pid': 0,
+                'tid': span.thread_id,
+                'args': span.attrs,
+            }
+            for span in sorted(self._spans, key=lambda span: span.start)
+        ]
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def write_json(self, file):
+        """
+        Write the recorded spans as returned by :meth:`trace` to *file*,
+        a path or a text file-like object, as JSON.
+        """
+        import json
+        text = json.dumps(self.trace(), default=str, indent=1)
+        if is_string(file):
+            with open(file, 'w') as f:
+                f.write(text)
+        else:
+            file.write(text)
@@ -0,0 +1,191 @@
+# encoding: utf-8
+
+"""
+|MergeTemplate| object, providing fast mail merge of data records into a
+``.docx`` template containing ``{{name}}`` placeholders.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import re
+
+from .api import _default_docx_path
+from .compat import BytesIO, Unicode
+from .opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from .opc.part import XmlPart
+from .oxml import OxmlElement, parse_xml
+from .oxml.ns import qn
+from .package import Package
+
+
+class MergeTemplate(object):
+    """
+    A ``.docx`` template compiled for mail merge. A placeholder is a field
+    name in double braces, such as ``{{first_name}}``, in the text of
+    a paragraph anywhere in the document body, including tables and text
+    boxes, or in a header or footer. Runs in hyperlinks, tracked insertions
+    and smart tags are searched too. Word often splits a placeholder across
+    several runs; the template is scanned once, when it is created, and
+    each placeholder is gathered into the run where it begins, keeping that
+    run's formatting.
+
+    Rendering a record copies the compiled package and replaces the text of
+    each placeholder in place, without searching or rebuilding paragraphs.
+    The template is held in memory as a lazily-loaded package, so only the
+    main document part and the headers and footers holding a placeholder
+    are copied as XML; other parts are shared with each rendered document
+    until they are changed, and are written unchanged to its file when it
+    is saved.
+    """
+    def __init__(self, docx=None):
+        super(MergeTemplate, self).__init__()
+        docx = _default_docx_path() if docx is None else docx
+        self._package = Package.open(BytesIO(_read(docx)), lazy=True)
+        document_part = self._package.main_document_part
+        if document_part.content_type != CT.WML_DOCUMENT_MAIN:
+            tmpl = "file '%s' is not a Word file, content type is '%s'"
+            raise ValueError(tmpl % (docx, document_part.content_type))
+        self._part_fields = [
+            (document_part.partname, _compile(document_part.element))
+        ]
+        for rel in list(document_part.rels.values()):
+            if rel.reltype not in (RT.HEADER, RT.FOOTER) or rel.is_external:
+                continue
+            part = rel.target_part
+            # the XML of a part without a brace can hold no placeholder
+            if b'{' not in part.blob:
+                continue
+            xml_part = _xml_part(part)
+            fields = _compile(xml_part.element)
+            if fields:
+                document_part.load_rel(rel.reltype, xml_part, rel.rId)
+                self._part_fields.append((part.partname, fields))
+
+    @property
+    def field_names(self):
+        """
+        Tuple of the distinct field names of the placeholders in this
+        template, in the order each first appears in the document body, then
+        in the headers and footers.
+        """
+        names = []
+        for partname, fields in self._part_fields:
+            for path, name in fields:
+                if name not in names:
+                    names.append(name)
+        return tuple(names)
+
+    def render(self, values):
+        """
+        Return a new |Document| object holding a copy of this template with
+        each placeholder replaced by the text of its field in *values*,
+        a mapping of field name to value. A value that is not a string is
+        converted with ``str()``. A tab in the value becomes a ``<w:tab/>``
+        and a newline or carriage return a ``<w:br/>``, as for
+        :attr:`.Run.text`. Raises |KeyError| if *values* has no value for
+        a field in this template.
+        """
+        package = self._package.copy()
+        parts = dict((part.partname, part) for part in package.iter_parts())
+        for partname, fields in self._part_fields:
+            root = parts[partname].element
+            # last first, so elements added for a break don't move the rest
+            for path, name in reversed(fields):
+                t = root
+                for idx in path:
+                    t = t[idx]
+                _set_field_text(t, values[name])
+        return package.main_document_part.document
+
+    def render_all(self, records):
+        """
+        Generate a new |Document| object for each mapping in *records*, as
+        rendered by :meth:`render`.
+        """
+        for values in records:
+            yield self.render(values)
+
+
+def _compile(root):
+    """
+    Gather each placeholder in the document element *root* into a ``<w:t>``
+    element of its own and return a list of `(path, name)` pairs, one for
+    each placeholder in document order. *path* is the sequence of child
+    indexes leading from *root* to the placeholder's ``<w:t>`` element, so
+    it can be found again in a copy of *root*.
+    """
+    fields = []
+    for p in list(root.iter(qn('w:p'))):
+        for match, t in p.isolate_matches(_placeholder_re):
+            fields.append((match.group(1), t))
+    return [(_path_to(root, t), name) for name, t in fields]
+
+
+def _read(docx):
+    """
+    Return the bytes of *docx*, a path to a ``.docx`` file or a file-like
+    object.
+    """
+    if isinstance(docx, (bytes, Unicode)):
+        with open(docx, 'rb') as f:
+            return f.read()
+    docx.seek(0)
+    return docx.read()
+
+
+def _xml_part(part):
+    """
+    Return an |XmlPart| parsed from the blob of *part*, a header or footer
+    part that is loaded as a plain part, having the same partname, content
+    type and relationships. Headers and footers are parsed only in the
+    template this way, so opening a document leaves them unparsed.
+    """
+    xml_part = XmlPart(
+        part.partname, part.content_type, parse_xml(part.blob), part.package
+    )
+    for rel in part.rels.values():
+        target = rel.target_ref if rel.is_external else rel.target_part
+        xml_part.load_rel(rel.reltype, target, rel.rId, rel.is_external)
+    return xml_part
+
+
+def _set_field_text(t, value):
+    """
+    Set the text of the placeholder ``<w:t>`` element *t* to *value*,
+    adding a ``<w:tab/>`` or ``<w:br/>`` element after it for each tab or
+    line break in *value*, each followed by a ``<w:t>`` holding the text
+    after it.
+    """
+    text = value if isinstance(value, Unicode) else Unicode(value)
+    pieces = _break_re.split(text)
+    t.text = pieces[0]
+    last = t
+    for idx in range(1, len(pieces), 2):
+        separator, piece = pieces[idx], pieces[idx + 1]
+        elm = OxmlElement('w:tab' if separator == '\t' else 'w:br')
+        last.addnext(elm)
+        last = elm
+        if piece:
+            t = OxmlElement('w:t')
+            t.text = piece
+            t.set(qn('xml:space'), 'preserve')
+            last.addnext(t)
+            last = t
+
+
+def _path_to(root, elm):
+    """
+    Return the tuple of child indexes leading from *root* to *elm*.
+    """
+    path = []
+    while elm is not root:
+        parent = elm.getparent()
+        path.append(parent.index(elm))
+        elm = parent
+    return tuple(reversed(path))
+
+
+_break_re = re.compile('([\t\r\n])')
+_placeholder_re = re.compile(r'\{\{ *([\w.]+) *\}\}', re.UNICODE)
@@ -57,6 +57,27 @@ def serialize_part_xml(part_elm):
     return etree.tostring(part_elm, encoding='UTF-8', standalone=True)
 
 
+def stream_part_xml(part_elm, stream, container=None):
+    """
+    Write *part_elm* to the file-like object *stream* as XML suitable for
+    storage as an XML part, like |serialize_part_xml| but incrementally,
+    using ``lxml.etree.xmlfile``. When *container* is an element within
+    *part_elm*, its children are serialized and written one at a time, so
+    the serialized XML of the part is never held in memory as a whole,
+    only that of its largest child. The tree is left unchanged. Namespace
+    declarations already made on *part_elm* are not repeated on each child,
+    so the XML written is no larger than that of |serialize_part_xml|.
+    """
+    with etree.xmlfile(stream, encoding='UTF-8') as xf:
+        xf.write_declaration(standalone=True)
+        if container is None:
+            xf.write(part_elm)
+            return
+        path = _path_to(part_elm, container)
+        nsdecls = _nsdecls(part_elm.nsmap)
+        _stream_element(xf, stream, part_elm, path, nsdecls, part_elm.nsmap)
+
+
 def serialize_for_reading(element):
     """
     Serialize *element* to human-readable XML suitable for tests. No XML
@@ -65,6 +86,71 @@ def serialize_for_reading(element):
     return etree.tostring(element, encoding='unicode', pretty_print=True)
 
 
+def _nsdecls(nsmap):
+    """
+    Return the list of namespace declarations in *nsmap*, each as the bytes
+    lxml writes for it in a start tag, like `` xmlns:w="http://..."``.
+    A namespace URI needing escaping is left out.
+    """
+    nsdecls = []
+    for prefix, uri in nsmap.items():
+        if any(c in uri for c in '&<>"'):
+            continue
+        attr = 'xmlns' if prefix is None else 'xmlns:%s' % prefix
+        nsdecls.append((' %s="%s"' % (attr, uri)).encode('utf-8'))
+    return nsdecls
+
+
+def _path_to(part_elm, container):
+    """
+    Return the list of elements from the child of *part_elm* that contains
+    *container* down to *container* itself. Raises |ValueError| if
+    *container* is not a descendant of *part_elm*.
+    """
+    if container is part_elm:
+        return []
+    path = [container]
+    for ancestor in container.iterancestors():
+        if ancestor is part_elm:
+            return path
+        path.insert(0, ancestor)
+    raise ValueError('container is not a descendant of part element')
+
+
+def _stream_element(xf, stream, elm, path, nsdecls, nsmap=None):
+    """
+    Write *elm* to *xf*, descending into the elements in *path* rather than
+    writing them whole, so the children of the last element in *path* are
+    written one at a time. Each child is serialized on its own and written
+    directly to *stream*, *xf* writing to, without the declarations in
+    *nsdecls* made by the part element.
+    """
+    with xf.element(elm.tag, elm.attrib, nsmap=nsmap):
+        if elm.text:
+            xf.write(elm.text)
+        xf.flush()
+        for child in elm:
+            if path and child is path[0]:
+                _stream_element(xf, stream, child, path[1:], nsdecls)
+                xf.flush()
+            else:
+                stream.write(_serialize_child(child, nsdecls))
+
+
+def _serialize_child(child, nsdecls):
+    """
+    Return *child* serialized as XML bytes without those of the namespace
+    declarations in *nsdecls* lxml writes on its start tag for the
+    namespaces in scope.
+    """
+    xml = etree.tostring(child, encoding='UTF-8', xml_declaration=False)
+    end = xml.find(b'>') + 1
+    start_tag = xml[:end]
+    for nsdecl in nsdecls:
+        start_tag = start_tag.replace(nsdecl, b'', 1)
+    return start_tag + xml[end:]
+
+
 # ===========================================================================
 # Custom element classes
 # ===========================================================================
@@ -7,6 +7,10 @@ writing presentations to and from a .pptx file.
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+import os
+
+from ..instrument import span
+from .compat import is_string
 from .constants import RELATIONSHIP_TYPE as RT
 from .packuri import PACKAGE_URI
 from .part import PartFactory
@@ -25,6 +29,14 @@ class OpcPackage(object):
     """
     def __init__(self):
         super(OpcPackage, self).__init__()
+        self._lazy_source = None
+        self._lazy_reader = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def after_unmarshal(self):
         """
@@ -35,6 +47,48 @@ class OpcPackage(object):
         # subclass
         pass
 
+    def close(self):
+        """
+        Close the package file kept open since this package was opened in
+        lazy mode. A part not read from the file before then, including an
+        XML part not yet parsed, can no longer be loaded and raises
+        |ValueError| when it is accessed, and so does saving the package.
+        Copies of the package made with :meth:`copy` read their unloaded
+        parts from the same file and are affected too. Does nothing for
+        a package not opened in lazy mode. A package is also a context
+        manager that closes it on exit.
+        """
+        if self._lazy_reader is not None:
+            self._lazy_reader.close()
+            self._lazy_reader = None
+
+    def copy(self):
+        """
+        Return a new package of the same type as this one, holding a copy of
+        each of its parts and relationships. XML parts get a deep copy of
+        their element tree, so no part is parsed again, and changes to the
+        copy do not affect this package.
+        """
+        package = type(self)()
+        parts = dict(
+            (part, part.copy_to(package)) for part in self.iter_parts()
+        )
+        sources = [(self, package)] + list(parts.items())
+        for source, source_copy in sources:
+            for rel in source.rels.values():
+                target = (
+                    rel.target_ref if rel.is_external
+                    else parts[rel.target_part]
+                )
+                source_copy.load_rel(
+                    rel.reltype, target, rel.rId, rel.is_external
+                )
+        for part in parts.values():
+            part.after_unmarshal()
+        package.after_unmarshal()
+        package._lazy_source = self._lazy_source
+        return package
+
     @property
     def core_properties(self):
         """
@@ -108,14 +162,25 @@ class OpcPackage(object):
         return self.part_related_by(RT.OFFICE_DOCUMENT)
 
     @classmethod
-    def open(cls, pkg_file):
+    def open(cls, pkg_file, lazy=False):
         """
         Return an |OpcPackage| instance loaded with the contents of
-        *pkg_file*.
-        """
-        pkg_reader = PackageReader.from_file(pkg_file)
-        package = cls()
-        Unmarshaller.unmarshal(pkg_reader, package, PartFactory)
+        *pkg_file*. When *lazy* is |True|, the blob of each part is read
+        from *pkg_file*, and XML parts parsed, only when first needed, so
+        *pkg_file* must remain available and unchanged while the package is
+        in use. Only the parts of a lazily opened package are copied into
+        the saved package as compressed in *pkg_file*; those of a package
+        opened otherwise are always compressed again on save.
+        """
+        with span('package.open', lazy=lazy) as s:
+            pkg_reader = PackageReader.from_file(pkg_file, lazy)
+            package = cls()
+            Unmarshaller.unmarshal(pkg_reader, package, PartFactory)
+            if s:
+                s.set(parts=len(package.parts))
+        if lazy:
+            package._lazy_source = pkg_file
+            package._lazy_reader = pkg_reader
         return package
 
     def part_related_by(self, reltype):
@@ -150,14 +215,19 @@ class OpcPackage(object):
         """
         return Relationships(PACKAGE_URI.baseURI)
 
-    def save(self, pkg_file):
+    def save(self, pkg_file, streaming=False):
         """
         Save this package to *pkg_file*, where *file* can be either a path to
-        a file (a string) or a file-like object.
+        a file (a string) or a file-like object. When *streaming* is |True|,
+        parts are serialized directly into the package file, see
+        :meth:`PackageWriter.write`.
         """
         for part in self.parts:
             part.before_marshal()
-        PackageWriter.write(pkg_file, self.rels, self.parts)
+        if _is_same_file(pkg_file, self._lazy_source):
+            for part in self.parts:
+                part.materialize()
+        PackageWriter.write(pkg_file, self.rels, self.parts, streaming)
 
     @property
     def _core_properties_part(self):
@@ -173,6 +243,22 @@ class OpcPackage(object):
             return core_properties_part
 
 
+def _is_same_file(pkg_file, source):
+    """
+    Return |True| if *pkg_file* refers to the same file or stream as
+    *source*, such that writing to it would overwrite parts not yet read
+    from *source*.
+    """
+    if source is None:
+        return False
+    if not (is_string(pkg_file) and is_string(source)):
+        return pkg_file is source
+    try:
+        return os.path.samefile(pkg_file, source)
+    except OSError:
+        return False
+
+
 class Unmarshaller(object):
     """
     Hosts static methods for unmarshalling a package from a |PackageReader|
@@ -8,10 +8,14 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+from copy import deepcopy
+
+from ..instrument import count_elements, span
 from .compat import cls_method_fn
-from .oxml import serialize_part_xml # type: ignore
+from .oxml import serialize_part_xml, stream_part_xml # type: ignore
 from ..oxml import parse_xml
 from .packuri import PackURI
+from .pkgreader import DeferredBlob
 from .rel import Relationships
 from .shared import lazyproperty
 
@@ -28,6 +32,7 @@ class Part(object):
         self._content_type = content_type
         self._blob = blob
         self._package = package
+        self._source_blob = blob if isinstance(blob, DeferredBlob) else None
 
     def after_unmarshal(self):
         """
@@ -54,8 +59,11 @@ class Part(object):
         """
         Contents of this package part as a sequence of bytes. May be text or
         binary. Intended to be overridden by subclasses. Default behavior is
-        to return load blob.
+        to return load blob, reading it from the package file on first
+        access when the package was opened in lazy mode.
         """
+        if isinstance(self._blob, DeferredBlob):
+            self._blob = self._blob.load()
         return self._blob
 
     @property
@@ -74,10 +82,29 @@ class Part(object):
         if self._rel_ref_count(rId) < 2:
             del self.rels[rId]
 
+    def copy_to(self, package):
+        """
+        Return a new part of the same type as this one and having the same
+        partname, content type and content, belonging to *package*.
+        Relationships are not copied. A plain part shares its blob with this
+        one, which is safe because the blob is never modified.
+        """
+        blob = self._blob if self._source_blob is None else self._source_blob
+        return self.load(self._partname, self._content_type, blob, package)
+
     @classmethod
     def load(cls, partname, content_type, blob, package):
         return cls(partname, content_type, blob, package)
 
+    def materialize(self):
+        """
+        Read the contents of this part from the package file if they were
+        deferred when the package was opened in lazy mode. Does nothing
+        otherwise.
+        """
+        self.blob
+        self._source_blob = None
+
     def load_rel(self, reltype, target, rId, is_external=False):
         """
         Return newly added |_Relationship| instance of *reltype* between this
@@ -96,6 +123,17 @@ class Part(object):
         """
         return self._package
 
+    @property
+    def source_blob(self):
+        """
+        The |DeferredBlob| this part was loaded from when its contents are
+        unchanged since the package was opened in lazy mode, |None|
+        otherwise. Used by |PackageWriter| to copy untouched parts into the
+        saved package without recompressing them. The blob of a plain part
+        is never modified, so it remains unchanged even after being read.
+        """
+        return self._source_blob
+
     @property
     def partname(self):
         """
@@ -155,6 +193,15 @@ class Part(object):
         rel = self.rels[rId]
         return rel.target_ref
 
+    def write_to(self, stream):
+        """
+        Write the contents of this part to the file-like object *stream*.
+        Used in place of :attr:`blob` when the package is saved in streaming
+        mode. Default behavior is to write the blob; may be overridden by
+        subclasses that can serialize themselves incrementally.
+        """
+        stream.write(self.blob)
+
     def _rel_ref_count(self, rId):
         """
         Return the count of references in this part's XML to the relationship
@@ -217,7 +264,34 @@ class XmlPart(Part):
 
     @property
     def blob(self):
-        return serialize_part_xml(self._element)
+        """
+        The serialized XML of this part. While the XML of a part loaded
+        lazily has not been parsed, it is read from the package file and
+        inflated again on each access rather than kept in memory, so code
+        needing it more than once should hold on to the value.
+        """
+        if self._blob is not None:
+            return self._blob.load()
+        with span('part.serialize', partname=self._partname) as s:
+            blob = serialize_part_xml(self._element)
+            if s:
+                s.set(bytes=len(blob), elements=count_elements(self._element))
+        return blob
+
+    def copy_to(self, package):
+        """
+        Return a new part of the same type as this one, belonging to
+        *package* and having a deep copy of this part's XML. Relationships
+        are not copied.
+        """
+        if self._blob is not None:
+            return self.load(
+                self._partname, self._content_type, self._blob, package
+            )
+        return type(self)(
+            self._partname, self._content_type, deepcopy(self._element),
+            package
+        )
 
     @property
     def element(self):
@@ -228,9 +302,29 @@ class XmlPart(Part):
 
     @classmethod
     def load(cls, partname, content_type, blob, package):
-        element = parse_xml(blob)
+        if isinstance(blob, DeferredBlob):
+            xml_part = cls(partname, content_type, None, package)
+            xml_part._blob = blob
+            return xml_part
+        element = _parse_part_xml(partname, blob)
         return cls(partname, content_type, element, package)
 
+    def materialize(self):
+        """
+        Parse the XML of this part if parsing was deferred when the package
+        was opened in lazy mode. Does nothing otherwise.
+        """
+        self._element
+
+    @property
+    def source_blob(self):
+        """
+        The |DeferredBlob| this part was loaded from, as long as its XML has
+        not been parsed. Once parsed, the XML may have changed and must be
+        serialized again.
+        """
+        return self._blob
+
     @property
     def part(self):
         """
@@ -239,3 +333,45 @@ class XmlPart(Part):
         chain of delegation ends here for child objects.
         """
         return self
+
+    def write_to(self, stream):
+        """
+        Write the XML of this part to *stream* incrementally, without first
+        serializing it to a single bytes object.
+        """
+        if self._blob is not None:
+            stream.write(self._blob.load())
+            return
+        with span('part.serialize', partname=self._partname) as s:
+            stream_part_xml(self._element, stream)
+            if s:
+                s.set(elements=count_elements(self._element), streamed=True)
+
+    @property
+    def _element(self):
+        """
+        The root element of this part, parsed from the package file on first
+        access when parsing was deferred by a lazy open.
+        """
+        if self._blob is not None:
+            self._element = _parse_part_xml(
+                self._partname, self._blob.load()
+            )
+        return self.__element
+
+    @_element.setter
+    def _element(self, element):
+        self._blob = None
+        self.__element = element
+
+
+def _parse_part_xml(partname, blob):
+    """
+    Return the root element of the XML in *blob*, the serialized XML of the
+    part named *partname*.
+    """
+    with span('part.parse', partname=partname) as s:
+        element = parse_xml(blob)
+        if s:
+            s.set(bytes=len(blob), elements=count_elements(element))
+    return element
@@ -12,7 +12,6 @@ from datetime import datetime
 
 from ..constants import CONTENT_TYPE as CT
 from ..coreprops import CoreProperties
-from ...oxml.coreprops import CT_CoreProperties
 from ..packuri import PackURI
 from ..part import XmlPart
 
@@ -48,6 +47,7 @@ class CorePropertiesPart(XmlPart):
     def _new(cls, package):
         partname = PackURI('/docProps/core.xml')
         content_type = CT.OPC_CORE_PROPERTIES
+        from ...oxml.coreprops import CT_CoreProperties
         coreProperties = CT_CoreProperties.new()
         return CorePropertiesPart(
             partname, content_type, coreProperties, package
@@ -7,9 +7,14 @@ Provides a general interface to a *physical* OPC package, such as a zip file.
 from __future__ import absolute_import
 
 import os
+import struct
+import threading
+import time
+import zlib
 
-from zipfile import ZipFile, is_zipfile, ZIP_DEFLATED
+from zipfile import ZipFile, is_zipfile, ZIP_DEFLATED, ZIP64_LIMIT
 
+from ..instrument import span
 from .compat import is_string
 from .exceptions import PackageNotFoundError
 from .packuri import CONTENT_TYPES_URI
@@ -66,6 +71,13 @@ class _DirPkgReader(PhysPkgReader):
             blob = f.read()
         return blob
 
+    def compressed_blob_for(self, pack_uri):
+        """
+        Provides interface consistency with |_ZipPkgReader|, but always
+        returns |None|; files in a directory are not compressed.
+        """
+        return None
+
     def close(self):
         """
         Provides interface consistency with |ZipFileSystem|, but does
@@ -80,6 +92,14 @@ class _DirPkgReader(PhysPkgReader):
         """
         return self.blob_for(CONTENT_TYPES_URI)
 
+    def open(self, pack_uri):
+        """
+        Return a binary file object for reading the file corresponding to
+        *pack_uri* in the package directory.
+        """
+        path = os.path.join(self._path, pack_uri.membername)
+        return open(path, 'rb')
+
     def rels_xml_for(self, source_uri):
         """
         Return rels item XML for source with *source_uri*, or None if the
@@ -98,20 +118,50 @@ class _ZipPkgReader(PhysPkgReader):
     """
     def __init__(self, pkg_file):
         super(_ZipPkgReader, self).__init__()
+        if is_string(pkg_file):
+            pkg_file = self._owned_fp = open(pkg_file, 'rb')
+        else:
+            self._owned_fp = None
+        self._fp = pkg_file
         self._zipf = ZipFile(pkg_file, 'r')
+        self._lock = threading.Lock()
 
     def blob_for(self, pack_uri):
         """
         Return blob corresponding to *pack_uri*. Raises |ValueError| if no
-        matching member is present in zip archive.
+        matching member is present in zip archive. Safe to call from several
+        threads at once, as when packages sharing this reader are saved
+        concurrently.
         """
-        return self._zipf.read(pack_uri.membername)
+        with self._lock:
+            return self._zipf.read(pack_uri.membername)
+
+    def compressed_blob_for(self, pack_uri):
+        """
+        Return a `(zinfo, compressed)` 2-tuple for the member corresponding
+        to *pack_uri*, where *compressed* is the member data exactly as
+        stored in the archive, without inflating it. Returns |None| if the
+        member is encrypted. Safe to call from several threads at once, like
+        :meth:`blob_for`.
+        """
+        zinfo = self._zipf.getinfo(pack_uri.membername)
+        if zinfo.flag_bits & 0x01:
+            return None
+        with self._lock:
+            fp = self._fp
+            fp.seek(zinfo.header_offset)
+            header = fp.read(30)
+            name_len, extra_len = struct.unpack('<HH', header[26:30])
+            fp.seek(zinfo.header_offset + 30 + name_len + extra_len)
+            return zinfo, fp.read(zinfo.compress_size)
 
     def close(self):
         """
         Close the zip archive, releasing any resources it is using.
         """
         self._zipf.close()
+        if self._owned_fp is not None:
+            self._owned_fp.close()
 
     @property
     def content_types_xml(self):
@@ -120,6 +170,14 @@ class _ZipPkgReader(PhysPkgReader):
         """
         return self.blob_for(CONTENT_TYPES_URI)
 
+    def open(self, pack_uri):
+        """
+        Return a binary file object reading the member corresponding to
+        *pack_uri*, inflating it as it is read rather than all at once.
+        Raises |KeyError| if no matching member is present in zip archive.
+        """
+        return self._zipf.open(pack_uri.membername)
+
     def rels_xml_for(self, source_uri):
         """
         Return rels item XML for source with *source_uri* or None if no rels
@@ -134,22 +192,295 @@ class _ZipPkgReader(PhysPkgReader):
 
 class _ZipPkgWriter(PhysPkgWriter):
     """
-    Implements |PhysPkgWriter| interface for a zip file OPC package.
+    Implements |PhysPkgWriter| interface for a zip file OPC package. The
+    archive is written member by member as local header and data, and its
+    central directory is written on :meth:`close`, so members compressed
+    elsewhere can be copied in as they are. The ZIP64 extensions are used
+    where needed, as by |ZipFile|, for packages over 4 GB or having more
+    than 65535 members. Like a member opened for writing by |ZipFile|,
+    a member written through :meth:`open` can't exceed 4 GB.
     """
     def __init__(self, pkg_file):
         super(_ZipPkgWriter, self).__init__()
-        self._zipf = ZipFile(pkg_file, 'w', compression=ZIP_DEFLATED)
+        if is_string(pkg_file):
+            self._fp = open(pkg_file, 'wb')
+            self._owns_fp = True
+        else:
+            self._fp = pkg_file
+            self._owns_fp = False
+        self._offset = _tell(self._fp)
+        self._entries = []
 
     def close(self):
         """
-        Close the zip archive, flushing any pending physical writes and
-        releasing any resources it's using.
+        Write the central directory of the zip archive, flushing any pending
+        physical writes and releasing any resources it's using.
         """
-        self._zipf.close()
+        start = self._offset
+        for entry in self._entries:
+            self._write_bytes(entry.central_header())
+        count = len(self._entries)
+        size = self._offset - start
+        if (count >= _FILECOUNT_LIMIT or start >= ZIP64_LIMIT or
+                size >= ZIP64_LIMIT):
+            zip64_end_offset = self._offset
+            self._write_bytes(struct.pack(
+                _ZIP64_END_RECORD, 0x06064b50, 44, _VERSION_MADE_BY,
+                _ZIP64_VERSION, 0, 0, count, count, size, start
+            ))
+            self._write_bytes(struct.pack(
+                _ZIP64_END_LOCATOR, 0x07064b50, 0, zip64_end_offset, 1
+            ))
+            count = min(count, 0xFFFF)
+            size = min(size, 0xFFFFFFFF)
+            start = min(start, 0xFFFFFFFF)
+        self._write_bytes(struct.pack(
+            _END_RECORD, 0x06054b50, 0, 0, count, count, size, start, 0
+        ))
+        if self._owns_fp:
+            self._fp.close()
+
+    def open(self, pack_uri):
+        """
+        Return a writable file-like object for the zip member corresponding
+        to *pack_uri*. Bytes written to it are compressed into the package
+        as they arrive. The object must be closed before another member is
+        written.
+        """
+        entry = _ZipEntry(
+            pack_uri.membername, _now(), ZIP_DEFLATED, _DATA_DESCRIPTOR
+        )
+        self._start_member(entry)
+        return _ZipMemberStream(self, entry)
 
     def write(self, pack_uri, blob):
         """
         Write *blob* to this zip package with the membername corresponding to
         *pack_uri*.
         """
-        self._zipf.writestr(pack_uri.membername, blob)
+        with span('zip.write', membername=pack_uri.membername) as s:
+            entry = _ZipEntry(pack_uri.membername, _now(), ZIP_DEFLATED)
+            compressor = _compressor()
+            compressed = compressor.compress(blob) + compressor.flush()
+            entry.CRC = zlib.crc32(blob) & 0xFFFFFFFF
+            entry.compress_size = len(compressed)
+            entry.file_size = len(blob)
+            self._start_member(entry)
+            self._write_bytes(compressed)
+            if s:
+                s.set(bytes=len(blob))
+
+    def write_compressed(self, pack_uri, src_zinfo, compressed):
+        """
+        Write *compressed*, member data already compressed as described by
+        *src_zinfo*, to this zip package with the membername corresponding to
+        *pack_uri*. The data is copied as-is, without being inflated and
+        deflated again, and the member needs the same zip version to be
+        extracted as in its source.
+        """
+        with span('zip.copy', membername=pack_uri.membername) as s:
+            entry = _ZipEntry(
+                pack_uri.membername, src_zinfo.date_time,
+                src_zinfo.compress_type, src_zinfo.flag_bits & 0x06,
+                src_zinfo.extract_version
+            )
+            entry.CRC = src_zinfo.CRC
+            entry.compress_size = src_zinfo.compress_size
+            entry.file_size = src_zinfo.file_size
+            self._start_member(entry)
+            self._write_bytes(compressed)
+            if s:
+                s.set(bytes=len(compressed))
+
+    def _start_member(self, entry):
+        """
+        Write the local header of *entry*, a member about to be written.
+        """
+        entry.header_offset = self._offset
+        self._entries.append(entry)
+        self._write_bytes(entry.local_header())
+
+    def _write_bytes(self, data):
+        self._fp.write(data)
+        self._offset += len(data)
+
+
+class _ZipEntry(object):
+    """
+    The zip archive headers of one member written by |_ZipPkgWriter|.
+    *version_needed* is the zip version needed to extract the member, 2.0
+    when |None|, raised to that of ZIP64 when its headers need the ZIP64
+    extensions.
+    """
+    def __init__(self, membername, date_time, compress_type, flag_bits=0,
+                 version_needed=None):
+        super(_ZipEntry, self).__init__()
+        self._name = membername.encode('utf-8')
+        if self._name != membername.encode('ascii', 'replace'):
+            flag_bits |= _UTF8_NAME
+        self._date_time = date_time
+        self._compress_type = compress_type
+        self._flag_bits = flag_bits
+        self._version_needed = version_needed or _VERSION_NEEDED
+        self.CRC = self.compress_size = self.file_size = 0
+        self.header_offset = 0
+
+    def central_header(self):
+        """
+        Return the central directory header of this member, having a ZIP64
+        extra field for the sizes and offset too large for its own fields.
+        """
+        fields = [self.file_size, self.compress_size, self.header_offset]
+        zip64_values = [value for value in fields if value >= ZIP64_LIMIT]
+        file_size, compress_size, header_offset = [
+            0xFFFFFFFF if value >= ZIP64_LIMIT else value for value in fields
+        ]
+        extra = _zip64_extra(zip64_values)
+        return struct.pack(
+            _CENTRAL_HEADER, 0x02014b50, _VERSION_MADE_BY,
+            self._version_for(extra), self._flag_bits, self._compress_type,
+            self._dos_time, self._dos_date, self.CRC, compress_size,
+            file_size, len(self._name), len(extra), 0, 0, 0, 0o600 << 16,
+            header_offset
+        ) + self._name + extra
+
+    def data_descriptor(self):
+        """
+        Return the data descriptor following the data of this member when it
+        was written as a stream, giving its size and checksum.
+        """
+        if max(self.compress_size, self.file_size) >= ZIP64_LIMIT:
+            raise ValueError('member too large to write without ZIP64')
+        return struct.pack(
+            '<4L', 0x08074b50, self.CRC, self.compress_size, self.file_size
+        )
+
+    def local_header(self):
+        """
+        Return the local header preceding the data of this member. The
+        checksum and sizes are zero when they follow the data in a data
+        descriptor. Sizes too large for its fields are given in a ZIP64
+        extra field.
+        """
+        file_size, compress_size = self.file_size, self.compress_size
+        extra = b''
+        if max(file_size, compress_size) >= ZIP64_LIMIT:
+            extra = _zip64_extra([file_size, compress_size])
+            file_size = compress_size = 0xFFFFFFFF
+        return struct.pack(
+            _LOCAL_HEADER, 0x04034b50, self._version_for(extra),
+            self._flag_bits, self._compress_type, self._dos_time,
+            self._dos_date, self.CRC, compress_size, file_size,
+            len(self._name), len(extra)
+        ) + self._name + extra
+
+    @property
+    def _dos_date(self):
+        year, month, day = self._date_time[:3]
+        return (year - 1980) << 9 | month << 5 | day
+
+    @property
+    def _dos_time(self):
+        hour, minute, second = self._date_time[3:6]
+        return hour << 11 | minute << 5 | second // 2
+
+    def _version_for(self, extra):
+        """
+        Return the zip version needed to extract this member from headers
+        having the extra field *extra*.
+        """
+        if extra:
+            return max(self._version_needed, _ZIP64_VERSION)
+        return self._version_needed
+
+
+class _ZipMemberStream(object):
+    """
+    Write-only file-like object compressing the bytes written to it into
+    the data of a zip member, followed by a data descriptor when closed.
+    """
+    def __init__(self, phys_writer, entry):
+        super(_ZipMemberStream, self).__init__()
+        self._phys_writer = phys_writer
+        self._entry = entry
+        self._compressor = _compressor()
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Finish the member, writing the data still held by the compressor and
+        the data descriptor. Closing again does nothing.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._write_compressed(self._compressor.flush())
+        self._phys_writer._write_bytes(self._entry.data_descriptor())
+
+    def write(self, data):
+        """
+        Compress *data* into the member.
+        """
+        entry = self._entry
+        entry.CRC = zlib.crc32(data, entry.CRC) & 0xFFFFFFFF
+        entry.file_size += len(data)
+        self._write_compressed(self._compressor.compress(data))
+        return len(data)
+
+    def _write_compressed(self, compressed):
+        self._entry.compress_size += len(compressed)
+        self._phys_writer._write_bytes(compressed)
+
+
+_LOCAL_HEADER = '<LHHHHHLLLHH'
+_CENTRAL_HEADER = '<LHHHHHHLLLHHHHHLL'
+_END_RECORD = '<LHHHHLLH'
+_ZIP64_END_RECORD = '<LQHHLLQQQQ'
+_ZIP64_END_LOCATOR = '<LLQL'
+_FILECOUNT_LIMIT = 0xFFFF
+_VERSION_MADE_BY = 3 << 8 | 20
+_VERSION_NEEDED = 20
+_ZIP64_VERSION = 45
+_DATA_DESCRIPTOR = 0x08
+_UTF8_NAME = 0x800
+
+
+def _compressor():
+    """
+    Return a zlib compressor producing raw deflate data, as stored in a zip
+    member.
+    """
+    return zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+
+
+def _zip64_extra(values):
+    """
+    Return the ZIP64 extended information extra field holding the 8-byte
+    *values*, or an empty bytestring when there are none.
+    """
+    if not values:
+        return b''
+    return struct.pack(
+        '<HH%dQ' % len(values), 0x0001, 8 * len(values), *values
+    )
+
+
+def _now():
+    return time.localtime(time.time())[:6]
+
+
+def _tell(fp):
+    """
+    Return the position of *fp*, or 0 if it can't tell, such as when it
+    isn't seekable.
+    """
+    try:
+        return fp.tell()
+    except (AttributeError, IOError, OSError):
+        return 0
@@ -7,6 +7,7 @@ Provides a low-level, read-only API to a serialized Open Packaging Convention
 
 from __future__ import absolute_import
 
+from ..instrument import span
 from .constants import RELATIONSHIP_TARGET_MODE as RTM
 from .oxml import parse_xml
 from .packuri import PACKAGE_URI, PackURI
@@ -19,24 +20,50 @@ class PackageReader(object):
     Provides access to the contents of a zip-format OPC package via its
     :attr:`serialized_parts` and :attr:`pkg_srels` attributes.
     """
-    def __init__(self, content_types, pkg_srels, sparts):
+    def __init__(self, content_types, pkg_srels, sparts, phys_reader=None):
         super(PackageReader, self).__init__()
         self._pkg_srels = pkg_srels
         self._sparts = sparts
+        self._phys_reader = phys_reader
 
     @staticmethod
-    def from_file(pkg_file):
+    def from_file(pkg_file, lazy=False):
         """
         Return a |PackageReader| instance loaded with contents of *pkg_file*.
-        """
-        phys_reader = PhysPkgReader(pkg_file)
-        content_types = _ContentTypeMap.from_xml(phys_reader.content_types_xml)
-        pkg_srels = PackageReader._srels_for(phys_reader, PACKAGE_URI)
-        sparts = PackageReader._load_serialized_parts(
-            phys_reader, pkg_srels, content_types
+        When *lazy* is |True|, only the content types and relationship items
+        are read; the blob of each part is left in the package file as
+        a |DeferredBlob| and *pkg_file* is kept open to read it from later,
+        until :meth:`close` is called.
+        """
+        with span('package.read', lazy=lazy) as s:
+            phys_reader = PhysPkgReader(pkg_file)
+            content_types = _ContentTypeMap.from_xml(
+                phys_reader.content_types_xml
+            )
+            pkg_srels = PackageReader._srels_for(phys_reader, PACKAGE_URI)
+            sparts = PackageReader._load_serialized_parts(
+                phys_reader, pkg_srels, content_types, lazy
+            )
+            if not lazy:
+                phys_reader.close()
+            if s:
+                s.set(parts=len(sparts), bytes=sum(
+                    len(spart.blob) for spart in sparts
+                    if not isinstance(spart.blob, DeferredBlob)
+                ))
+        return PackageReader(
+            content_types, pkg_srels, sparts, phys_reader if lazy else None
         )
-        phys_reader.close()
-        return PackageReader(content_types, pkg_srels, sparts)
+
+    def close(self):
+        """
+        Close the package file kept open by a lazy load. The blob of a part
+        can no longer be read from it afterward. Does nothing when the
+        package was not loaded lazily or is already closed.
+        """
+        if self._phys_reader is not None:
+            self._phys_reader.close()
+            self._phys_reader = None
 
     def iter_sparts(self):
         """
@@ -58,14 +85,18 @@ class PackageReader(object):
                 yield (spart.partname, srel)
 
     @staticmethod
-    def _load_serialized_parts(phys_reader, pkg_srels, content_types):
+    def _load_serialized_parts(phys_reader, pkg_srels, content_types,
+                               lazy=False):
         """
         Return a list of |_SerializedPart| instances corresponding to the
         parts in *phys_reader* accessible by walking the relationship graph
-        starting with *pkg_srels*.
+        starting with *pkg_srels*. Part blobs are deferred when *lazy* is
+        |True|.
         """
         sparts = []
-        part_walker = PackageReader._walk_phys_parts(phys_reader, pkg_srels)
+        part_walker = PackageReader._walk_phys_parts(
+            phys_reader, pkg_srels, lazy=lazy
+        )
         for partname, blob, reltype, srels in part_walker:
             content_type = content_types[partname]
             spart = _SerializedPart(
@@ -74,6 +105,20 @@ class PackageReader(object):
             sparts.append(spart)
         return tuple(sparts)
 
+    @staticmethod
+    def partname_related_by(phys_reader, source_uri, reltype):
+        """
+        Return the partname of the part to which the source at *source_uri*
+        in the package read by *phys_reader* has an internal relationship of
+        *reltype*, reading only the rels item of that source. Returns |None|
+        if the source has no such relationship.
+        """
+        srels = PackageReader._srels_for(phys_reader, source_uri)
+        for srel in srels:
+            if srel.reltype == reltype and not srel.is_external:
+                return srel.target_partname
+        return None
+
     @staticmethod
     def _srels_for(phys_reader, source_uri):
         """
@@ -85,11 +130,13 @@ class PackageReader(object):
             source_uri.baseURI, rels_xml)
 
     @staticmethod
-    def _walk_phys_parts(phys_reader, srels, visited_partnames=None):
+    def _walk_phys_parts(phys_reader, srels, visited_partnames=None,
+                         lazy=False):
         """
         Generate a 4-tuple `(partname, blob, reltype, srels)` for each of the
         parts in *phys_reader* by walking the relationship graph rooted at
-        srels.
+        srels. *blob* is a |DeferredBlob| rather than bytes when *lazy* is
+        |True|.
         """
         if visited_partnames is None:
             visited_partnames = []
@@ -102,15 +149,53 @@ class PackageReader(object):
             visited_partnames.append(partname)
             reltype = srel.reltype
             part_srels = PackageReader._srels_for(phys_reader, partname)
-            blob = phys_reader.blob_for(partname)
+            if lazy:
+                blob = DeferredBlob(phys_reader, partname)
+            else:
+                blob = phys_reader.blob_for(partname)
             yield (partname, blob, reltype, part_srels)
             next_walker = PackageReader._walk_phys_parts(
-                phys_reader, part_srels, visited_partnames
+                phys_reader, part_srels, visited_partnames, lazy
             )
             for partname, blob, reltype, srels in next_walker:
                 yield (partname, blob, reltype, srels)
 
 
+class DeferredBlob(object):
+    """
+    Stand-in for the blob of a part in a package opened in lazy mode. Holds
+    only the physical package reader and the partname; the bytes are read
+    from the package file each time :meth:`load` is called.
+    """
+    def __init__(self, phys_reader, partname):
+        super(DeferredBlob, self).__init__()
+        self._phys_reader = phys_reader
+        self._partname = partname
+
+    def load(self):
+        """
+        Return the blob of the part, read from the package file.
+        """
+        return self._phys_reader.blob_for(self._partname)
+
+    def load_compressed(self):
+        """
+        Return a `(zinfo, compressed)` 2-tuple holding the zip entry info and
+        the still-compressed bytes of the part, suitable for copying into
+        another zip archive without recompressing. Returns |None| when the
+        package file does not allow this, for example when it is a directory.
+        """
+        return self._phys_reader.compressed_blob_for(self._partname)
+
+    def open(self):
+        """
+        Return a readable file-like object streaming the blob of the part
+        from the package file, for parsing a large part without reading it
+        into memory first. The caller is responsible for closing it.
+        """
+        return self._phys_reader.open(self._partname)
+
+
 class _ContentTypeMap(object):
     """
     Value type providing dictionary semantics for looking up content type by
@@ -7,6 +7,7 @@ Convention (OPC) package, essentially an implementation of OpcPackage.save()
 
 from __future__ import absolute_import
 
+from ..instrument import span
 from .constants import CONTENT_TYPE as CT
 from .oxml import CT_Types, serialize_part_xml
 from .packuri import CONTENT_TYPES_URI, PACKAGE_URI
@@ -23,17 +24,40 @@ class PackageWriter(object):
     be instantiated.
     """
     @staticmethod
-    def write(pkg_file, pkg_rels, parts):
+    def write(pkg_file, pkg_rels, parts, streaming=False):
         """
         Write a physical package (.pptx file) to *pkg_file* containing
         *pkg_rels* and *parts* and a content types stream based on the
-        content types of the parts.
-        """
-        phys_writer = PhysPkgWriter(pkg_file)
-        PackageWriter._write_content_types_stream(phys_writer, parts)
-        PackageWriter._write_pkg_rels(phys_writer, pkg_rels)
-        PackageWriter._write_parts(phys_writer, parts)
-        phys_writer.close()
+        content types of the parts. When *streaming* is |True|, each part
+        writes itself directly to its zip member rather than producing its
+        blob in memory first.
+        """
+        with span('package.write', streaming=streaming) as s:
+            phys_writer = PhysPkgWriter(pkg_file)
+            PackageWriter._write_content_types_stream(phys_writer, parts)
+            PackageWriter._write_pkg_rels(phys_writer, pkg_rels)
+            PackageWriter._write_parts(phys_writer, parts, streaming)
+            phys_writer.close()
+            if s:
+                s.set(parts=len(parts))
+
+    @staticmethod
+    def _copy_part(phys_writer, part):
+        """
+        Copy the still-compressed bytes of *part* from the package it was
+        loaded from to the package being written, if *part* is unchanged
+        since it was loaded. Return |True| if the part was copied, |False| if
+        it must be written the usual way.
+        """
+        source_blob = part.source_blob
+        if source_blob is None:
+            return False
+        compressed = source_blob.load_compressed()
+        if compressed is None:
+            return False
+        zinfo, compressed_blob = compressed
+        phys_writer.write_compressed(part.partname, zinfo, compressed_blob)
+        return True
 
     @staticmethod
     def _write_content_types_stream(phys_writer, parts):
@@ -45,13 +69,25 @@ class PackageWriter(object):
         phys_writer.write(CONTENT_TYPES_URI, cti.blob)
 
     @staticmethod
-    def _write_parts(phys_writer, parts):
+    def _write_parts(phys_writer, parts, streaming=False):
         """
         Write the blob of each part in *parts* to the package, along with a
-        rels item for its relationships if and only if it has any.
+        rels item for its relationships if and only if it has any. Parts
+        unchanged since being loaded are copied without recompression. When
+        *streaming* is |True|, each other part is written through a zip
+        member stream using :meth:`Part.write_to`.
         """
         for part in parts:
-            phys_writer.write(part.partname, part.blob)
+            if PackageWriter._copy_part(phys_writer, part):
+                pass
+            elif streaming:
+                stream = phys_writer.open(part.partname)
+                try:
+                    part.write_to(stream)
+                finally:
+                    stream.close()
+            else:
+                phys_writer.write(part.partname, part.blob)
             if len(part._rels):
                 phys_writer.write(part.partname.rels_uri, part._rels.xml)
 
@@ -14,11 +14,36 @@ from .oxml import CT_Relationships
 class Relationships(dict):
     """
     Collection object for |_Relationship| instances, having list semantics.
+    Keeps indexes by relationship type and by type and target, along with
+    the lowest possibly-unused rId number, so lookups and rId allocation
+    don't scan the collection. The indexes are maintained on item
+    assignment and deletion.
     """
     def __init__(self, baseURI):
         super(Relationships, self).__init__()
         self._baseURI = baseURI
         self._target_parts_by_rId = {}
+        self._rels_by_reltype = {}
+        self._rels_by_target = {}
+        self._used_rId_numbers = set()
+        self._min_free_rId_number = 1
+
+    def __delitem__(self, rId):
+        self._unindex(self[rId])
+        super(Relationships, self).__delitem__(rId)
+        n = _rId_number(rId)
+        if n is not None:
+            self._used_rId_numbers.discard(n)
+            self._min_free_rId_number = min(self._min_free_rId_number, n)
+
+    def __setitem__(self, rId, rel):
+        if rId in self:
+            del self[rId]
+        super(Relationships, self).__setitem__(rId, rel)
+        self._index(rel)
+        n = _rId_number(rId)
+        if n is not None:
+            self._used_rId_numbers.add(n)
 
     def add_relationship(self, reltype, target, rId, is_external=False):
         """
@@ -89,20 +114,10 @@ class Relationships(dict):
         Return relationship of matching *reltype*, *target*, and
         *is_external* from collection, or None if not found.
         """
-        def matches(rel, reltype, target, is_external):
-            if rel.reltype != reltype:
-                return False
-            if rel.is_external != is_external:
-                return False
-            rel_target = rel.target_ref if rel.is_external else rel.target_part
-            if rel_target != target:
-                return False
-            return True
-
-        for rel in self.values():
-            if matches(rel, reltype, target, is_external):
-                return rel
-        return None
+        matching = self._rels_by_target.get((reltype, target, is_external))
+        if not matching:
+            return None
+        return matching[0]
 
     def _get_rel_of_type(self, reltype):
         """
@@ -110,7 +125,7 @@ class Relationships(dict):
         Raises |KeyError| if no matching relationship is found. Raises
         |ValueError| if more than one matching relationship is found.
         """
-        matching = [rel for rel in self.values() if rel.reltype == reltype]
+        matching = self._rels_by_reltype.get(reltype, ())
         if len(matching) == 0:
             tmpl = "no relationship of type '%s' in collection"
             raise KeyError(tmpl % reltype)
@@ -119,16 +134,61 @@ class Relationships(dict):
             raise ValueError(tmpl % reltype)
         return matching[0]
 
+    def _index(self, rel):
+        """
+        Add *rel* to the lookup indexes of this collection.
+        """
+        self._rels_by_reltype.setdefault(rel.reltype, []).append(rel)
+        key = _target_key(rel)
+        self._rels_by_target.setdefault(key, []).append(rel)
+
     @property
     def _next_rId(self):
         """
         Next available rId in collection, starting from 'rId1' and making use
         of any gaps in numbering, e.g. 'rId2' for rIds ['rId1', 'rId3'].
         """
-        for n in range(1, len(self)+2):
-            rId_candidate = 'rId%d' % n  # like 'rId19'
-            if rId_candidate not in self:
-                return rId_candidate
+        n = self._min_free_rId_number
+        while n in self._used_rId_numbers:
+            n += 1
+        self._min_free_rId_number = n
+        return 'rId%d' % n  # like 'rId19'
+
+    def _unindex(self, rel):
+        """
+        Remove *rel* from the lookup indexes of this collection.
+        """
+        for index, key in (
+                (self._rels_by_reltype, rel.reltype),
+                (self._rels_by_target, _target_key(rel))):
+            rels = index[key]
+            rels.remove(rel)
+            if not rels:
+                del index[key]
+
+
+def _rId_number(rId):
+    """
+    Return the integer part of *rId* when it has the form 'rId{n}', like
+    19 for 'rId19', or |None| otherwise.
+    """
+    try:
+        if rId.startswith('rId'):
+            return int(rId[3:])
+    except (AttributeError, ValueError):
+        pass
+    return None
+
+
+def _target_key(rel):
+    """
+    Return the key under which *rel* is indexed by target, a
+    `(reltype, target, is_external)` 3-tuple where *target* is the target
+    part for an internal relationship and the target URL for an external one.
+    """
+    if rel.is_external:
+        return (rel.reltype, rel.target_ref, True)
+    return (rel.reltype, rel.target_part, False)
 
 
 class _Relationship(object):
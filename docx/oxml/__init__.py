@@ -7,6 +7,8 @@ corresponding to Open XML elements.
 
 from __future__ import absolute_import
 
+import threading
+
 from lxml import etree # type: ignore
 
 from .ns import NamespacePrefixedTag, nsmap
@@ -17,6 +19,10 @@ element_class_lookup = etree.ElementNamespaceClassLookup()
 oxml_parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
 oxml_parser.set_element_class_lookup(element_class_lookup)
 
+# custom element classes are registered on first use of the parser
+_element_classes_registered = False
+_registration_lock = threading.RLock()
+
 
 def parse_xml(xml):
     """
@@ -25,19 +31,40 @@ def parse_xml(xml):
     parser is used, so custom element classes are produced for elements in
     *xml* that have them.
     """
+    if not _element_classes_registered:
+        _register_element_classes()
     root_element = etree.fromstring(xml, oxml_parser)
     return root_element
 
 
+def iterparse_xml(source, events=('end',), tag=None):
+    """
+    Return an lxml ``iterparse`` iterator generating `(event, element)`
+    pairs while incrementally parsing the XML read from *source*, a file
+    name or binary file-like object. *events* and *tag* select the events
+    and element tags reported, as for ``etree.iterparse()``. Elements are
+    parsed as by :func:`parse_xml`, so they are instances of their custom
+    element class.
+    """
+    if not _element_classes_registered:
+        _register_element_classes()
+    events = etree.iterparse(
+        source, events, tag=tag, remove_blank_text=True,
+        resolve_entities=False
+    )
+    events.set_element_class_lookup(element_class_lookup)
+    return events
+
+
 def register_element_cls(tag, cls):
     """
     Register *cls* to be constructed when the oxml parser encounters an
     element with matching *tag*. *tag* is a string of the form
-    ``nspfx:tagroot``, e.g. ``'w:document'``.
+    ``nspfx:tagroot``, e.g. ``'w:document'``. A class registered here takes
+    the place of the built-in custom element class for *tag*, if any.
     """
-    nspfx, tagroot = tag.split(':')
-    namespace = element_class_lookup.get_namespace(nsmap[nspfx])
-    namespace[tagroot] = cls
+    _register_element_classes()
+    _register(tag, cls)
 
 
 def OxmlElement(nsptag_str, attrs=None, nsdecls=None):
@@ -52,6 +79,8 @@ def OxmlElement(nsptag_str, attrs=None, nsdecls=None):
     a single namespace declaration is added based on the prefix on
     *nsptag_str*.
     """
+    if not _element_classes_registered:
+        _register_element_classes()
     nsptag = NamespacePrefixedTag(nsptag_str)
     if nsdecls is None:
         nsdecls = nsptag.nsmap
@@ -60,143 +89,163 @@ def OxmlElement(nsptag_str, attrs=None, nsdecls=None):
     )
 
 
+def _register(tag, cls):
+    nspfx, tagroot = tag.split(':')
+    namespace = element_class_lookup.get_namespace(nsmap[nspfx])
+    namespace[tagroot] = cls
+
+
+def _register_element_classes():
+    """
+    Register the custom element classes, importing the modules they are
+    defined in. This happens on first use of the oxml parser rather than
+    when ``docx`` is imported, so a program pays for loading these modules
+    only when it works with XML.
+    """
+    global _element_classes_registered
+    with _registration_lock:
+        if not _element_classes_registered:
+            _register_custom_element_classes()
+            _element_classes_registered = True
+
+
 # ===========================================================================
 # custom element class mappings
 # ===========================================================================
 
-from .shared import CT_DecimalNumber, CT_OnOff, CT_String
-
-
-from .coreprops import CT_CoreProperties
-register_element_cls('cp:coreProperties', CT_CoreProperties)
-
-from .document import CT_Body, CT_Document
-register_element_cls('w:body',     CT_Body)
-register_element_cls('w:document', CT_Document)
-
-from .numbering import (
-    CT_Num, CT_Numbering, CT_NumLvl, CT_NumPr
-)
-register_element_cls('w:abstractNumId', CT_DecimalNumber)
-register_element_cls('w:ilvl',          CT_DecimalNumber)
-register_element_cls('w:lvlOverride',   CT_NumLvl)
-register_element_cls('w:num',           CT_Num)
-register_element_cls('w:numId',         CT_DecimalNumber)
-register_element_cls('w:numPr',         CT_NumPr)
-register_element_cls('w:numbering',     CT_Numbering)
-register_element_cls('w:startOverride', CT_DecimalNumber)
-
-from .section import CT_PageMar, CT_PageSz, CT_SectPr, CT_SectType
-register_element_cls('w:pgMar',  CT_PageMar)
-register_element_cls('w:pgSz',   CT_PageSz)
-register_element_cls('w:sectPr', CT_SectPr)
-register_element_cls('w:type',   CT_SectType)
-
-from .shape import (
-    CT_Blip, CT_BlipFillProperties, CT_GraphicalObject,
-    CT_GraphicalObjectData, CT_Inline, CT_NonVisualDrawingProps, CT_Picture,
-    CT_PictureNonVisual, CT_Point2D, CT_PositiveSize2D, CT_ShapeProperties,
-    CT_Transform2D
-)
-register_element_cls('a:blip',        CT_Blip)
-register_element_cls('a:ext',         CT_PositiveSize2D)
-register_element_cls('a:graphic',     CT_GraphicalObject)
-register_element_cls('a:graphicData', CT_GraphicalObjectData)
-register_element_cls('a:off',         CT_Point2D)
-register_element_cls('a:xfrm',        CT_Transform2D)
-register_element_cls('pic:blipFill',  CT_BlipFillProperties)
-register_element_cls('pic:cNvPr',     CT_NonVisualDrawingProps)
-register_element_cls('pic:nvPicPr',   CT_PictureNonVisual)
-register_element_cls('pic:pic',       CT_Picture)
-register_element_cls('pic:spPr',      CT_ShapeProperties)
-register_element_cls('wp:docPr',      CT_NonVisualDrawingProps)
-register_element_cls('wp:extent',     CT_PositiveSize2D)
-register_element_cls('wp:inline',     CT_Inline)
-
-from .styles import CT_LatentStyles, CT_LsdException, CT_Style, CT_Styles
-register_element_cls('w:basedOn',        CT_String)
-register_element_cls('w:latentStyles',   CT_LatentStyles)
-register_element_cls('w:locked',         CT_OnOff)
-register_element_cls('w:lsdException',   CT_LsdException)
-register_element_cls('w:name',           CT_String)
-register_element_cls('w:next',           CT_String)
-register_element_cls('w:qFormat',        CT_OnOff)
-register_element_cls('w:semiHidden',     CT_OnOff)
-register_element_cls('w:style',          CT_Style)
-register_element_cls('w:styles',         CT_Styles)
-register_element_cls('w:uiPriority',     CT_DecimalNumber)
-register_element_cls('w:unhideWhenUsed', CT_OnOff)
-
-from .table import (
-    CT_Row, CT_Tbl, CT_TblGrid, CT_TblGridCol, CT_TblLayoutType, CT_TblPr,
-    CT_TblWidth, CT_Tc, CT_TcPr, CT_VMerge
-)
-register_element_cls('w:bidiVisual', CT_OnOff)
-register_element_cls('w:gridCol',    CT_TblGridCol)
-register_element_cls('w:gridSpan',   CT_DecimalNumber)
-register_element_cls('w:tbl',        CT_Tbl)
-register_element_cls('w:tblGrid',    CT_TblGrid)
-register_element_cls('w:tblLayout',  CT_TblLayoutType)
-register_element_cls('w:tblPr',      CT_TblPr)
-register_element_cls('w:tblStyle',   CT_String)
-register_element_cls('w:tc',         CT_Tc)
-register_element_cls('w:tcPr',       CT_TcPr)
-register_element_cls('w:tcW',        CT_TblWidth)
-register_element_cls('w:tr',         CT_Row)
-register_element_cls('w:vMerge',     CT_VMerge)
-
-from .text.font import (
-    CT_Color, CT_Fonts, CT_Highlight, CT_HpsMeasure, CT_RPr, CT_Underline,
-    CT_VerticalAlignRun
-)
-register_element_cls('w:b',          CT_OnOff)
-register_element_cls('w:bCs',        CT_OnOff)
-register_element_cls('w:caps',       CT_OnOff)
-register_element_cls('w:color',      CT_Color)
-register_element_cls('w:cs',         CT_OnOff)
-register_element_cls('w:dstrike',    CT_OnOff)
-register_element_cls('w:emboss',     CT_OnOff)
-register_element_cls('w:highlight',  CT_Highlight)
-register_element_cls('w:i',          CT_OnOff)
-register_element_cls('w:iCs',        CT_OnOff)
-register_element_cls('w:imprint',    CT_OnOff)
-register_element_cls('w:noProof',    CT_OnOff)
-register_element_cls('w:oMath',      CT_OnOff)
-register_element_cls('w:outline',    CT_OnOff)
-register_element_cls('w:rFonts',     CT_Fonts)
-register_element_cls('w:rPr',        CT_RPr)
-register_element_cls('w:rStyle',     CT_String)
-register_element_cls('w:rtl',        CT_OnOff)
-register_element_cls('w:shadow',     CT_OnOff)
-register_element_cls('w:smallCaps',  CT_OnOff)
-register_element_cls('w:snapToGrid', CT_OnOff)
-register_element_cls('w:specVanish', CT_OnOff)
-register_element_cls('w:strike',     CT_OnOff)
-register_element_cls('w:sz',         CT_HpsMeasure)
-register_element_cls('w:u',          CT_Underline)
-register_element_cls('w:vanish',     CT_OnOff)
-register_element_cls('w:vertAlign',  CT_VerticalAlignRun)
-register_element_cls('w:webHidden',  CT_OnOff)
-
-from .text.paragraph import CT_P
-register_element_cls('w:p', CT_P)
-
-from .text.parfmt import (
-    CT_Ind, CT_Jc, CT_PPr, CT_Spacing, CT_TabStop, CT_TabStops
-)
-register_element_cls('w:ind',             CT_Ind)
-register_element_cls('w:jc',              CT_Jc)
-register_element_cls('w:keepLines',       CT_OnOff)
-register_element_cls('w:keepNext',        CT_OnOff)
-register_element_cls('w:pageBreakBefore', CT_OnOff)
-register_element_cls('w:pPr',             CT_PPr)
-register_element_cls('w:pStyle',          CT_String)
-register_element_cls('w:spacing',         CT_Spacing)
-register_element_cls('w:tab',             CT_TabStop)
-register_element_cls('w:tabs',            CT_TabStops)
-register_element_cls('w:widowControl',    CT_OnOff)
-
-from .text.run import CT_Br, CT_R, CT_Text
-register_element_cls('w:br', CT_Br)
-register_element_cls('w:r',  CT_R)
-register_element_cls('w:t',  CT_Text)
+def _register_custom_element_classes():
+    from .shared import CT_DecimalNumber, CT_OnOff, CT_String
+
+    from .coreprops import CT_CoreProperties
+    _register('cp:coreProperties', CT_CoreProperties)
+
+    from .document import CT_Body, CT_Document
+    _register('w:body',     CT_Body)
+    _register('w:document', CT_Document)
+
+    from .numbering import (
+        CT_Num, CT_Numbering, CT_NumLvl, CT_NumPr
+    )
+    _register('w:abstractNumId', CT_DecimalNumber)
+    _register('w:ilvl',          CT_DecimalNumber)
+    _register('w:lvlOverride',   CT_NumLvl)
+    _register('w:num',           CT_Num)
+    _register('w:numId',         CT_DecimalNumber)
+    _register('w:numPr',         CT_NumPr)
+    _register('w:numbering',     CT_Numbering)
+    _register('w:startOverride', CT_DecimalNumber)
+
+    from .section import CT_PageMar, CT_PageSz, CT_SectPr, CT_SectType
+    _register('w:pgMar',  CT_PageMar)
+    _register('w:pgSz',   CT_PageSz)
+    _register('w:sectPr', CT_SectPr)
+    _register('w:type',   CT_SectType)
+
+    from .shape import (
+        CT_Blip, CT_BlipFillProperties, CT_GraphicalObject,
+        CT_GraphicalObjectData, CT_Inline, CT_NonVisualDrawingProps,
+        CT_Picture, CT_PictureNonVisual, CT_Point2D, CT_PositiveSize2D,
+        CT_ShapeProperties, CT_Transform2D
+    )
+    _register('a:blip',        CT_Blip)
+    _register('a:ext',         CT_PositiveSize2D)
+    _register('a:graphic',     CT_GraphicalObject)
+    _register('a:graphicData', CT_GraphicalObjectData)
+    _register('a:off',         CT_Point2D)
+    _register('a:xfrm',        CT_Transform2D)
+    _register('pic:blipFill',  CT_BlipFillProperties)
+    _register('pic:cNvPr',     CT_NonVisualDrawingProps)
+    _register('pic:nvPicPr',   CT_PictureNonVisual)
+    _register('pic:pic',       CT_Picture)
+    _register('pic:spPr',      CT_ShapeProperties)
+    _register('wp:docPr',      CT_NonVisualDrawingProps)
+    _register('wp:extent',     CT_PositiveSize2D)
+    _register('wp:inline',     CT_Inline)
+
+    from .styles import CT_LatentStyles, CT_LsdException, CT_Style, CT_Styles
+    _register('w:basedOn',        CT_String)
+    _register('w:latentStyles',   CT_LatentStyles)
+    _register('w:locked',         CT_OnOff)
+    _register('w:lsdException',   CT_LsdException)
+    _register('w:name',           CT_String)
+    _register('w:next',           CT_String)
+    _register('w:qFormat',        CT_OnOff)
+    _register('w:semiHidden',     CT_OnOff)
+    _register('w:style',          CT_Style)
+    _register('w:styles',         CT_Styles)
+    _register('w:uiPriority',     CT_DecimalNumber)
+    _register('w:unhideWhenUsed', CT_OnOff)
+
+    from .table import (
+        CT_Row, CT_Tbl, CT_TblGrid, CT_TblGridCol, CT_TblLayoutType, CT_TblPr,
+        CT_TblWidth, CT_Tc, CT_TcPr, CT_VMerge
+    )
+    _register('w:bidiVisual', CT_OnOff)
+    _register('w:gridCol',    CT_TblGridCol)
+    _register('w:gridSpan',   CT_DecimalNumber)
+    _register('w:tbl',        CT_Tbl)
+    _register('w:tblGrid',    CT_TblGrid)
+    _register('w:tblLayout',  CT_TblLayoutType)
+    _register('w:tblPr',      CT_TblPr)
+    _register('w:tblStyle',   CT_String)
+    _register('w:tc',         CT_Tc)
+    _register('w:tcPr',       CT_TcPr)
+    _register('w:tcW',        CT_TblWidth)
+    _register('w:tr',         CT_Row)
+    _register('w:vMerge',     CT_VMerge)
+
+    from .text.font import (
+        CT_Color, CT_Fonts, CT_Highlight, CT_HpsMeasure, CT_RPr, CT_Underline,
+        CT_VerticalAlignRun
+    )
+    _register('w:b',          CT_OnOff)
+    _register('w:bCs',        CT_OnOff)
+    _register('w:caps',       CT_OnOff)
+    _register('w:color',      CT_Color)
+    _register('w:cs',         CT_OnOff)
+    _register('w:dstrike',    CT_OnOff)
+    _register('w:emboss',     CT_OnOff)
+    _register('w:highlight',  CT_Highlight)
+    _register('w:i',          CT_OnOff)
+    _register('w:iCs',        CT_OnOff)
+    _register('w:imprint',    CT_OnOff)
+    _register('w:noProof',    CT_OnOff)
+    _register('w:oMath',      CT_OnOff)
+    _register('w:outline',    CT_OnOff)
+    _register('w:rFonts',     CT_Fonts)
+    _register('w:rPr',        CT_RPr)
+    _register('w:rStyle',     CT_String)
+    _register('w:rtl',        CT_OnOff)
+    _register('w:shadow',     CT_OnOff)
+    _register('w:smallCaps',  CT_OnOff)
+    _register('w:snapToGrid', CT_OnOff)
+    _register('w:specVanish', CT_OnOff)
+    _register('w:strike',     CT_OnOff)
+    _register('w:sz',         CT_HpsMeasure)
+    _register('w:u',          CT_Underline)
+    _register('w:vanish',     CT_OnOff)
+    _register('w:vertAlign',  CT_VerticalAlignRun)
+    _register('w:webHidden',  CT_OnOff)
+
+    from .text.paragraph import CT_P
+    _register('w:p', CT_P)
+
+    from .text.parfmt import (
+        CT_Ind, CT_Jc, CT_PPr, CT_Spacing, CT_TabStop, CT_TabStops
+    )
+    _register('w:ind',             CT_Ind)
+    _register('w:jc',              CT_Jc)
+    _register('w:keepLines',       CT_OnOff)
+    _register('w:keepNext',        CT_OnOff)
+    _register('w:pageBreakBefore', CT_OnOff)
+    _register('w:pPr',             CT_PPr)
+    _register('w:pStyle',          CT_String)
+    _register('w:spacing',         CT_Spacing)
+    _register('w:tab',             CT_TabStop)
+    _register('w:tabs',            CT_TabStops)
+    _register('w:widowControl',    CT_OnOff)
+
+    from .text.run import CT_Br, CT_R, CT_Text
+    _register('w:br', CT_Br)
+    _register('w:r',  CT_R)
+    _register('w:t',  CT_Text)
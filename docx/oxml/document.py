@@ -5,6 +5,7 @@ Custom element classes that correspond to the document part, e.g.
 <w:document>.
 """
 
+from .ns import qn
 from .xmlchemy import BaseOxmlElement, ZeroOrOne, ZeroOrMore
 
 
@@ -57,3 +58,23 @@ class CT_Body(BaseOxmlElement):
             content_elms = self[:]
         for content_elm in content_elms:
             self.remove(content_elm)
+
+    def _insert_p(self, p):
+        return self._insert_block_item(p)
+
+    def _insert_tbl(self, tbl):
+        return self._insert_block_item(tbl)
+
+    def _insert_block_item(self, block_item):
+        """
+        Insert *block_item* before the sentinel ``<w:sectPr>`` element and
+        return it. The sentinel sectPr is the last child of the body, so it
+        is checked for there first rather than found by searching the body
+        from the start, which would make adding each block item to a large
+        document slower than the last.
+        """
+        last_child = next(self.iterchildren(reversed=True), None)
+        if last_child is not None and last_child.tag == qn('w:sectPr'):
+            last_child.addprevious(block_item)
+            return block_item
+        return self.insert_element_before(block_item, 'w:sectPr')
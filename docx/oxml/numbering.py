@@ -110,9 +110,9 @@ class CT_Numbering(BaseOxmlElement):
         Return the ``<w:num>`` child element having ``numId`` attribute
         matching *numId*.
         """
-        xpath = './w:num[@w:numId="%d"]' % numId
+        xpath = './w:num[@w:numId=$numId]'
         try:
-            return self.xpath(xpath)[0]
+            return self.xpath(xpath, numId='%d' % numId)[0]
         except IndexError:
             raise KeyError('no <w:num> element with numId %d' % numId)
 
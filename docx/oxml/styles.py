@@ -61,7 +61,7 @@ class CT_LatentStyles(BaseOxmlElement):
         Return the `w:lsdException` child having *name*, or |None| if not
         found.
         """
-        found = self.xpath('w:lsdException[@w:name="%s"]' % name)
+        found = self.xpath('w:lsdException[@w:name=$name]', name=name)
         if not found:
             return None
         return found[0]
@@ -327,9 +327,9 @@ class CT_Styles(BaseOxmlElement):
         Return the ``<w:style>`` child element having ``styleId`` attribute
         matching *styleId*, or |None| if not found.
         """
-        xpath = 'w:style[@w:styleId="%s"]' % styleId
+        xpath = 'w:style[@w:styleId=$styleId]'
         try:
-            return self.xpath(xpath)[0]
+            return self.xpath(xpath, styleId=styleId)[0]
         except IndexError:
             return None
 
@@ -338,9 +338,9 @@ class CT_Styles(BaseOxmlElement):
         Return the ``<w:style>`` child element having ``<w:name>`` child
         element with value *name*, or |None| if not found.
         """
-        xpath = 'w:style[w:name/@w:val="%s"]' % name
+        xpath = 'w:style[w:name/@w:val=$name]'
         try:
-            return self.xpath(xpath)[0]
+            return self.xpath(xpath, name=name)[0]
         except IndexError:
             return None
 
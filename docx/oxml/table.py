@@ -8,6 +8,8 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+import re
+
 from . import parse_xml
 from ..exceptions import InvalidSpanError
 from .ns import nsdecls, qn
@@ -100,6 +102,23 @@ class CT_Tbl(BaseOxmlElement):
         """
         return len(self.tblGrid.gridCol_lst)
 
+    def note_mutation(self):
+        """
+        Record a change to the row, column or cell structure of this table,
+        so |Table| objects caching its layout grid rebuild it.
+        """
+        self._mutation_count = self.mutation_count + 1
+
+    @property
+    def mutation_count(self):
+        """
+        The number of structural changes recorded with :meth:`note_mutation`
+        while this element object was in use. lxml returns this same object
+        for the ``<w:tbl>`` element as long as a reference to it is held,
+        such as by a |Table| object, so the count is shared by all of them.
+        """
+        return getattr(self, '_mutation_count', 0)
+
     def iter_tcs(self):
         """
         Generate each of the `w:tc` elements in this table, left to right and
@@ -118,6 +137,34 @@ class CT_Tbl(BaseOxmlElement):
         """
         return parse_xml(cls._tbl_xml(rows, cols, width))
 
+    @classmethod
+    def new_tbl_from_rows(cls, rows, width, header=None):
+        """
+        Return a new `w:tbl` element holding the values in *rows*, an
+        iterable of row sequences, with *width* distributed evenly between
+        the columns. If *header* is not |None|, it is a sequence of values
+        added as a first row that repeats at the top of each page. The
+        column count is that of the longest row; shorter rows are padded
+        with empty cells. Each value is converted with ``str()`` and placed
+        in a single run, with tab and line-break characters translated as
+        for ``Run.text``. A |None| value produces an empty cell.
+        """
+        trs = [] if header is None else [(True, cls._p_xmls(header))]
+        trs.extend((False, cls._p_xmls(row)) for row in rows)
+        cols = max(len(p_xmls) for _, p_xmls in trs) if trs else 0
+        col_width = Emu(width/cols) if cols > 0 else Emu(0)
+        tc_start_xml = (
+            '<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="%d"/></w:tcPr>'
+            % col_width.twips
+        )
+        trs_xml = ''.join(
+            cls._tr_text_xml(is_header, p_xmls, cols, tc_start_xml)
+            for is_header, p_xmls in trs
+        )
+        return parse_xml(cls._tbl_xml_from_parts(
+            cls._tblGrid_xml(cols, col_width), trs_xml
+        ))
+
     @property
     def tblStyle_val(self):
         """
@@ -144,6 +191,13 @@ class CT_Tbl(BaseOxmlElement):
     @classmethod
     def _tbl_xml(cls, rows, cols, width):
         col_width = Emu(width/cols) if cols > 0 else Emu(0)
+        return cls._tbl_xml_from_parts(
+            cls._tblGrid_xml(cols, col_width),
+            cls._trs_xml(rows, cols, col_width)
+        )
+
+    @classmethod
+    def _tbl_xml_from_parts(cls, tblGrid_xml, trs_xml):
         return (
             '<w:tbl %s>\n'
             '  <w:tblPr>\n'
@@ -155,11 +209,7 @@ class CT_Tbl(BaseOxmlElement):
             '%s'  # tblGrid
             '%s'  # trs
             '</w:tbl>\n'
-        ) % (
-            nsdecls('w'),
-            cls._tblGrid_xml(cols, col_width),
-            cls._trs_xml(rows, cols, col_width)
-        )
+        ) % (nsdecls('w'), tblGrid_xml, trs_xml)
 
     @classmethod
     def _tblGrid_xml(cls, col_count, col_width):
@@ -194,6 +244,22 @@ class CT_Tbl(BaseOxmlElement):
             ) % col_width.twips
         return xml
 
+    @classmethod
+    def _p_xmls(cls, row):
+        """
+        Return a list of the `w:p` XML for each value in *row*.
+        """
+        return [_p_text_xml(value) for value in row]
+
+    @classmethod
+    def _tr_text_xml(cls, is_header, p_xmls, cols, tc_start_xml):
+        trPr_xml = '<w:trPr><w:tblHeader/></w:trPr>' if is_header else ''
+        if cols == 0:
+            return '<w:tr>%s</w:tr>' % trPr_xml
+        p_xmls = p_xmls + ['<w:p/>'] * (cols - len(p_xmls))
+        tcs_xml = tc_start_xml + ('</w:tc>' + tc_start_xml).join(p_xmls)
+        return '<w:tr>%s%s</w:tc></w:tr>' % (trPr_xml, tcs_xml)
+
 
 class CT_TblGrid(BaseOxmlElement):
     """
@@ -403,8 +469,10 @@ class CT_Tc(BaseOxmlElement):
         *other_tc* as diagonal corners.
         """
         top, left, height, width = self._span_dimensions(other_tc)
-        top_tc = self._tbl.tr_lst[top].tc_at_grid_col(left)
+        tbl = self._tbl
+        top_tc = tbl.tr_lst[top].tc_at_grid_col(left)
         top_tc._grow_to(width, height)
+        tbl.note_mutation()
         return top_tc
 
     @classmethod
@@ -781,3 +849,42 @@ class CT_VMerge(BaseOxmlElement):
     ``<w:vMerge>`` element, specifying vertical merging behavior of a cell.
     """
     val = OptionalAttribute('w:val', ST_Merge, default=ST_Merge.CONTINUE)
+
+
+def _p_text_xml(value):
+    """
+    Return the XML for a `w:p` element holding the text of *value* in
+    a single run, or an empty paragraph when *value* is |None| or empty.
+    """
+    text = '' if value is None else str(value)
+    if not text:
+        return '<w:p/>'
+    if _special_char_re.search(text) is None and text.strip() == text:
+        return '<w:p><w:r><w:t>%s</w:t></w:r></w:p>' % text
+    r_content = []
+    for piece in _run_content_re.split(text):
+        if not piece:
+            continue
+        if piece == '\t':
+            r_content.append('<w:tab/>')
+        elif piece in '\r\n':
+            r_content.append('<w:br/>')
+        elif len(piece.strip()) < len(piece):
+            r_content.append(
+                '<w:t xml:space="preserve">%s</w:t>' % _escape(piece)
+            )
+        else:
+            r_content.append('<w:t>%s</w:t>' % _escape(piece))
+    return '<w:p><w:r>%s</w:r></w:p>' % ''.join(r_content)
+
+
+def _escape(text):
+    """
+    Return *text* with ``&``, ``<`` and ``>`` escaped for use as XML
+    character data.
+    """
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+
+_run_content_re = re.compile('([\t\n\r])')
+_special_char_re = re.compile('[\t\n\r&<>]')
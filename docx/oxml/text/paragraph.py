@@ -4,6 +4,8 @@
 Custom element classes related to paragraphs (CT_P).
 """
 
+from bisect import bisect_right
+
 from ..ns import qn
 from ..xmlchemy import BaseOxmlElement, OxmlElement, ZeroOrMore, ZeroOrOne
 
@@ -52,6 +54,89 @@ class CT_P(BaseOxmlElement):
                 continue
             self.remove(child)
 
+    def isolate_matches(self, regex):
+        """
+        Rewrite the text of the runs in this paragraph so each match of the
+        compiled *regex* in their combined text occupies a ``<w:t>`` element
+        of its own, placed in the run where the match begins and so having
+        that run's formatting. A match may span runs; the text it takes from
+        later runs is removed from them and a run left empty is removed.
+        Runs nested in inline containers such as ``<w:hyperlink>``,
+        ``<w:ins>`` or ``<w:smartTag>`` are included, while deleted runs and
+        the runs of paragraphs nested in this one, as in a text box, are
+        not. Run content other than text, such as a tab, appears to *regex*
+        as a NUL character. Return a list of `(match, t)` pairs, one for
+        each match in document order.
+        """
+        pieces, chunks, offset = [], [], 0
+        for r in self.iter_runs():
+            for child in r:
+                if child.tag == qn('w:rPr'):
+                    continue
+                if child.tag == qn('w:t'):
+                    text = child.text or ''
+                    pieces.append([offset, child, text])
+                else:
+                    text = '\x00'
+                chunks.append(text)
+                offset += len(text)
+        matches = list(regex.finditer(''.join(chunks)))
+        if not matches:
+            return []
+
+        starts = [piece[0] for piece in pieces]
+        touched, isolated = set(), []
+        # right to left, so text ahead of each match is not yet rewritten
+        for match in reversed(matches):
+            start, end = match.span()
+            i = bisect_right(starts, start) - 1
+            j = bisect_right(starts, end - 1) - 1
+            t = _new_t(match.group(0), preserve=True)
+            pieces[i][1].addnext(t)
+            if i == j:
+                suffix = pieces[i][2][end - pieces[i][0]:]
+                if suffix:
+                    t.addnext(_new_t(suffix))
+            else:
+                for piece in pieces[i + 1:j]:
+                    piece[2] = ''
+                pieces[j][2] = pieces[j][2][end - pieces[j][0]:]
+            pieces[i][2] = pieces[i][2][:start - pieces[i][0]]
+            touched.update(range(i, j + 1))
+            isolated.append((match, t))
+
+        for idx in touched:
+            offset, t, text = pieces[idx]
+            _set_t_text(t, text)
+            if text:
+                continue
+            r = t.getparent()
+            r.remove(t)
+            if all(child.tag == qn('w:rPr') for child in r):
+                r.getparent().remove(r)
+        isolated.reverse()
+        return isolated
+
+    def iter_runs(self):
+        """
+        Generate each ``<w:r>`` element of this paragraph in document order,
+        including runs nested in inline containers like ``<w:hyperlink>``,
+        ``<w:ins>``, ``<w:smartTag>`` or ``<w:sdtContent>``. Deleted runs,
+        in ``<w:del>`` or ``<w:moveFrom>``, are skipped, and so are the runs
+        of paragraphs nested in a run, as in a text box.
+        """
+        containers = [iter(self)]
+        while containers:
+            for child in containers[-1]:
+                tag = child.tag
+                if tag == qn('w:r'):
+                    yield child
+                elif tag not in _NOT_RUN_CONTAINERS:
+                    containers.append(iter(child))
+                    break
+            else:
+                containers.pop()
+
     def set_sectPr(self, sectPr):
         """
         Unconditionally replace or add *sectPr* as a grandchild in the
@@ -76,3 +161,26 @@ class CT_P(BaseOxmlElement):
     def style(self, style):
         pPr = self.get_or_add_pPr()
         pPr.style = style
+
+
+# children of a paragraph or inline container holding no runs of its own
+_NOT_RUN_CONTAINERS = frozenset(
+    qn(tag) for tag in ('w:pPr', 'w:del', 'w:moveFrom', 'w:sdtPr')
+)
+
+
+def _new_t(text, preserve=False):
+    """
+    Return a new ``<w:t>`` element containing *text*, having
+    ``xml:space="preserve"`` when *preserve* is |True| or *text* has
+    leading or trailing whitespace.
+    """
+    t = OxmlElement('w:t')
+    _set_t_text(t, text, preserve)
+    return t
+
+
+def _set_t_text(t, text, preserve=False):
+    t.text = text
+    if preserve or len(text.strip()) < len(text):
+        t.set(qn('xml:space'), 'preserve')
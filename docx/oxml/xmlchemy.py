@@ -11,6 +11,8 @@ from lxml import etree
 
 import re
 
+from collections import OrderedDict
+
 from . import OxmlElement
 from ..compat import Unicode
 from .exceptions import InvalidXmlError
@@ -159,11 +161,14 @@ class OptionalAttribute(BaseAttribute):
         Return a function object suitable for the "get" side of the attribute
         property descriptor.
         """
+        clark_name, default = self._clark_name, self._default
+        simple_type = self._simple_type
+
         def get_attr_value(obj):
-            attr_str_value = obj.get(self._clark_name)
+            attr_str_value = obj.get(clark_name)
             if attr_str_value is None:
-                return self._default
-            return self._simple_type.from_xml(attr_str_value)
+                return default
+            return simple_type.from_xml(attr_str_value)
         get_attr_value.__doc__ = self._docstring
         return get_attr_value
 
@@ -186,13 +191,16 @@ class OptionalAttribute(BaseAttribute):
         Return a function object suitable for the "set" side of the attribute
         property descriptor.
         """
+        clark_name, default = self._clark_name, self._default
+        simple_type = self._simple_type
+
         def set_attr_value(obj, value):
-            if value is None or value == self._default:
-                if self._clark_name in obj.attrib:
-                    del obj.attrib[self._clark_name]
+            if value is None or value == default:
+                if clark_name in obj.attrib:
+                    del obj.attrib[clark_name]
                 return
-            str_value = self._simple_type.to_xml(value)
-            obj.set(self._clark_name, str_value)
+            str_value = simple_type.to_xml(value)
+            obj.set(clark_name, str_value)
         return set_attr_value
 
 
@@ -211,14 +219,16 @@ class RequiredAttribute(BaseAttribute):
         Return a function object suitable for the "get" side of the attribute
         property descriptor.
         """
+        clark_name, simple_type = self._clark_name, self._simple_type
+
         def get_attr_value(obj):
-            attr_str_value = obj.get(self._clark_name)
+            attr_str_value = obj.get(clark_name)
             if attr_str_value is None:
                 raise InvalidXmlError(
                     "required '%s' attribute not present on element %s" %
                     (self._attr_name, obj.tag)
                 )
-            return self._simple_type.from_xml(attr_str_value)
+            return simple_type.from_xml(attr_str_value)
         get_attr_value.__doc__ = self._docstring
         return get_attr_value
 
@@ -239,9 +249,11 @@ class RequiredAttribute(BaseAttribute):
         Return a function object suitable for the "set" side of the attribute
         property descriptor.
         """
+        clark_name, simple_type = self._clark_name, self._simple_type
+
         def set_attr_value(obj, value):
-            str_value = self._simple_type.to_xml(value)
-            obj.set(self._clark_name, str_value)
+            str_value = simple_type.to_xml(value)
+            obj.set(clark_name, str_value)
         return set_attr_value
 
 
@@ -309,8 +321,15 @@ class _BaseChildElement(object):
         Add an ``_insert_x()`` method to the element class for this child
         element.
         """
+        successors = tuple(qn(tagname) for tagname in self._successors)
+
         def _insert_child(obj, child):
-            obj.insert_element_before(child, *self._successors)
+            for successor_tag in successors:
+                successor = obj.find(successor_tag)
+                if successor is not None:
+                    successor.addprevious(child)
+                    return child
+            obj.append(child)
             return child
 
         _insert_child.__doc__ = (
@@ -373,8 +392,10 @@ class _BaseChildElement(object):
         descriptor. This default getter returns the child element with
         matching tag name or |None| if not present.
         """
+        tag = qn(self._nsptagname)
+
         def get_child_element(obj):
-            return obj.find(qn(self._nsptagname))
+            return obj.find(tag)
         get_child_element.__doc__ = (
             '``<%s>`` child element or |None| if not present.'
             % self._nsptagname
@@ -391,8 +412,10 @@ class _BaseChildElement(object):
         Return a function object suitable for the "get" side of a list
         property descriptor.
         """
+        tag = qn(self._nsptagname)
+
         def get_child_element_list(obj):
-            return obj.findall(qn(self._nsptagname))
+            return obj.findall(tag)
         get_child_element_list.__doc__ = (
             'A list containing each of the ``<%s>`` child elements, in the o'
             'rder they appear.' % self._nsptagname
@@ -509,8 +532,10 @@ class OneAndOnlyOne(_BaseChildElement):
         Return a function object suitable for the "get" side of the property
         descriptor.
         """
+        tag = qn(self._nsptagname)
+
         def get_child_element(obj):
-            child = obj.find(qn(self._nsptagname))
+            child = obj.find(tag)
             if child is None:
                 raise InvalidXmlError(
                     "required ``<%s>`` child element not present" %
@@ -601,8 +626,11 @@ class ZeroOrOne(_BaseChildElement):
         Add a ``_remove_x()`` method to the element class for this child
         element.
         """
+        tag = qn(self._nsptagname)
+
         def _remove_child(obj):
-            obj.remove_all(self._nsptagname)
+            for child in obj.findall(tag):
+                obj.remove(child)
         _remove_child.__doc__ = (
             'Remove all ``<%s>`` child elements.'
         ) % self._nsptagname
@@ -668,8 +696,14 @@ class ZeroOrOneChoice(_BaseChildElement):
         Return a function object suitable for the "get" side of the property
         descriptor.
         """
+        tags = [qn(tagname) for tagname in self._member_nsptagnames]
+
         def get_group_member_element(obj):
-            return obj.first_child_found_in(*self._member_nsptagnames)
+            for tag in tags:
+                child = obj.find(tag)
+                if child is not None:
+                    return child
+            return None
         get_group_member_element.__doc__ = (
             'Return the child element belonging to this element group, or '
             '|None| if no member child is present.'
@@ -742,14 +776,15 @@ class _OxmlElementBase(etree.ElementBase):
         """
         return serialize_for_reading(self)
 
-    def xpath(self, xpath_str):
+    def xpath(self, xpath_str, **variables):
         """
         Override of ``lxml`` _Element.xpath() method to provide standard Open
-        XML namespace mapping (``nsmap``) in centralized location.
+        XML namespace mapping (``nsmap``) in centralized location. The
+        expression is compiled on first use and the compiled form reused.
+        Values for ``$name`` variables in *xpath_str* are passed as keyword
+        arguments, so an expression need not be formatted for each call.
         """
-        return super(BaseOxmlElement, self).xpath(
-            xpath_str, namespaces=nsmap
-        )
+        return _compiled_xpath(xpath_str)(self, **variables)
 
     @property
     def _nsptag(self):
@@ -759,3 +794,26 @@ class _OxmlElementBase(etree.ElementBase):
 BaseOxmlElement = MetaOxmlElement(
     'BaseOxmlElement', (etree.ElementBase,), dict(_OxmlElementBase.__dict__)
 )
+
+
+def _compiled_xpath(xpath_str):
+    """
+    Return the compiled ``etree.XPath`` object for *xpath_str*, compiling it
+    with the standard namespace mapping the first time it is seen. At most
+    _XPATH_CACHE_SIZE expressions are kept, the one cached first being
+    evicted to make room for a new one, so a caller formatting a new
+    expression for each call cannot grow the cache without bound nor keep
+    later expressions from being cached. A hit is not reordered, to keep it
+    a single lookup.
+    """
+    xpath = _xpath_cache.get(xpath_str)
+    if xpath is None:
+        xpath = etree.XPath(xpath_str, namespaces=nsmap)
+        _xpath_cache[xpath_str] = xpath
+        while len(_xpath_cache) > _XPATH_CACHE_SIZE:
+            _xpath_cache.popitem(last=False)
+    return xpath
+
+
+_XPATH_CACHE_SIZE = 512
+_xpath_cache = OrderedDict()
@@ -6,7 +6,10 @@ WordprocessingML Package class and related objects
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+import hashlib
+
 from docx.image.image import Image
+from docx.instrument import span
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.opc.package import OpcPackage
 from docx.opc.packuri import PackURI
@@ -54,6 +57,7 @@ class ImageParts(object):
     def __init__(self):
         super(ImageParts, self).__init__()
         self._image_parts = []
+        self._image_parts_by_sha1 = None
 
     def __contains__(self, item):
         return self._image_parts.__contains__(item)
@@ -66,18 +70,26 @@ class ImageParts(object):
 
     def append(self, item):
         self._image_parts.append(item)
+        if self._image_parts_by_sha1 is not None:
+            self._image_parts_by_sha1.setdefault(item.sha1, item)
 
     def get_or_add_image_part(self, image_descriptor):
         """
         Return an |ImagePart| instance containing the image identified by
         *image_descriptor*, newly created if a matching one is not present in
-        the collection.
+        the collection. The image bytes are hashed before the image header is
+        parsed, so an image already in the collection is not parsed again.
+        *image_descriptor* may also be an |Image| instance already loaded,
+        for example by :func:`.load_images`.
         """
-        image = Image.from_file(image_descriptor)
-        matching_image_part = self._get_by_sha1(image.sha1)
-        if matching_image_part is not None:
-            return matching_image_part
-        return self._add_image_part(image)
+        with span('image.ingest') as s:
+            image_part = self._get_or_add_image_part(image_descriptor)
+            if s:
+                s.set(
+                    partname=image_part.partname, bytes=len(image_part.blob),
+                    content_type=image_part.content_type
+                )
+        return image_part
 
     def _add_image_part(self, image):
         """
@@ -92,12 +104,34 @@ class ImageParts(object):
     def _get_by_sha1(self, sha1):
         """
         Return the image part in this collection having a SHA1 hash matching
-        *sha1*, or |None| if not found.
+        *sha1*, or |None| if not found. The sha1 index is built on first use
+        so opening a document doesn't hash the images it already contains.
+        """
+        if self._image_parts_by_sha1 is None:
+            image_parts_by_sha1 = {}
+            for image_part in self._image_parts:
+                image_parts_by_sha1.setdefault(image_part.sha1, image_part)
+            self._image_parts_by_sha1 = image_parts_by_sha1
+        return self._image_parts_by_sha1.get(sha1)
+
+    def _get_or_add_image_part(self, image_descriptor):
         """
-        for image_part in self._image_parts:
-            if image_part.sha1 == sha1:
-                return image_part
-        return None
+        Return the |ImagePart| for *image_descriptor* as described for
+        :meth:`get_or_add_image_part`.
+        """
+        if isinstance(image_descriptor, Image):
+            image = image_descriptor
+            matching_image_part = self._get_by_sha1(image.sha1)
+            if matching_image_part is not None:
+                return matching_image_part
+            return self._add_image_part(image)
+        blob, filename = Image.read_blob(image_descriptor)
+        sha1 = hashlib.sha1(blob).hexdigest()
+        matching_image_part = self._get_by_sha1(sha1)
+        if matching_image_part is not None:
+            return matching_image_part
+        image = Image.from_blob(blob, filename)
+        return self._add_image_part(image)
 
     def _next_image_partname(self, ext):
         """
@@ -113,3 +147,4 @@ class ImageParts(object):
             if n not in used_numbers:
                 return image_partname(n)
         return image_partname(len(self)+1)
+
@@ -9,10 +9,11 @@ from __future__ import (
 )
 
 from ..document import Document
+from ..instrument import count_elements, span
 from .numbering import NumberingPart
 from ..opc.constants import RELATIONSHIP_TYPE as RT
+from ..opc.oxml import stream_part_xml
 from ..opc.part import XmlPart
-from ..oxml.shape import CT_Inline
 from ..shape import InlineShapes
 from ..shared import lazyproperty
 from .settings import SettingsPart
@@ -28,6 +29,13 @@ class DocumentPart(XmlPart):
     inherited by many content objects provides access to this part object for
     that purpose.
     """
+    def __init__(self, partname, content_type, element, package):
+        super(DocumentPart, self).__init__(
+            partname, content_type, element, package
+        )
+        self._ids_in_use = None
+        self._lowest_free_id = 1
+
     @property
     def core_properties(self):
         """
@@ -92,20 +100,62 @@ class DocumentPart(XmlPart):
         rId, image = self.get_or_add_image(image_descriptor)
         cx, cy = image.scaled_dimensions(width, height)
         shape_id, filename = self.next_id, image.filename
+        from ..oxml.shape import CT_Inline
         return CT_Inline.new_pic_inline(shape_id, rId, filename, cx, cy)
 
     @property
     def next_id(self):
         """
-        The next available positive integer id value in this document. Gaps
+        The next available positive integer id value in this document,
+        reserved for the caller, so each access returns a different id. Gaps
         in id sequence are filled. The id attribute value is unique in the
-        document, without regard to the element type it appears on.
-        """
-        id_str_lst = self._element.xpath('//@id')
-        used_ids = [int(id_str) for id_str in id_str_lst if id_str.isdigit()]
-        for n in range(1, len(used_ids)+2):
-            if n not in used_ids:
-                return n
+        document, without regard to the element type it appears on. The ids
+        in use are found by a scan of the document the first time this
+        property is accessed and are tracked from then on. Copying content
+        already in the document, such as a paragraph holding a picture, adds
+        no id not already tracked, and clearing a paragraph, run or the
+        document body through its proxy object has the document scanned
+        again. An id freed by removing an element directly is only skipped
+        until :meth:`release_id` is called for it, but an id added to the
+        XML other than through this property or :meth:`reserve_id`, such as
+        by inserting content from another document, must be followed by
+        a call to :meth:`rescan_ids`.
+        """
+        used_ids = self._used_ids
+        n = self._lowest_free_id
+        while n in used_ids:
+            n += 1
+        used_ids.add(n)
+        self._lowest_free_id = n + 1
+        return n
+
+    def release_id(self, id_):
+        """
+        Make id *id_* available again to :attr:`next_id`, for use after the
+        element carrying it has been removed from the document.
+        """
+        if self._ids_in_use is None:
+            return
+        self._ids_in_use.discard(id_)
+        self._lowest_free_id = min(self._lowest_free_id, id_)
+
+    def rescan_ids(self):
+        """
+        Forget the ids tracked by :attr:`next_id`, so the document is scanned
+        for them again the next time one is needed, after ids have been
+        added or removed other than through this part.
+        """
+        self._ids_in_use = None
+
+    def reserve_id(self, id_):
+        """
+        Record id *id_* as used, so it is not returned by :attr:`next_id`,
+        for example because it is assigned to an element about to be added
+        to the document.
+        """
+        if self._ids_in_use is None:
+            return
+        self._ids_in_use.add(id_)
 
     @lazyproperty
     def numbering_part(self):
@@ -121,12 +171,13 @@ class DocumentPart(XmlPart):
             self.relate_to(numbering_part, RT.NUMBERING)
             return numbering_part
 
-    def save(self, path_or_stream):
+    def save(self, path_or_stream, streaming=False):
         """
         Save this document to *path_or_stream*, which can be either a path to
-        a filesystem location (a string) or a file-like object.
+        a filesystem location (a string) or a file-like object. See
+        :meth:`Document.save` for the meaning of *streaming*.
         """
-        self.package.save(path_or_stream)
+        self.package.save(path_or_stream, streaming)
 
     @property
     def settings(self):
@@ -144,6 +195,30 @@ class DocumentPart(XmlPart):
         """
         return self._styles_part.styles
 
+    def write_to(self, stream):
+        """
+        Write the XML of this part to *stream*, serializing the block items
+        in the document body one at a time. The document is left unchanged.
+        """
+        with span('part.serialize', partname=self._partname) as s:
+            if s:
+                s.set(elements=count_elements(self._element), streamed=True)
+            stream_part_xml(self._element, stream, self._element.body)
+
+    @property
+    def _used_ids(self):
+        """
+        The set of integer id values in use in this document, found by
+        scanning the document the first time it is needed.
+        """
+        if self._ids_in_use is None:
+            id_str_lst = self._element.xpath('//@id')
+            self._ids_in_use = set(
+                int(id_str) for id_str in id_str_lst if id_str.isdigit()
+            )
+            self._lowest_free_id = 1
+        return self._ids_in_use
+
     @property
     def _settings_part(self):
         """
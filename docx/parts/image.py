@@ -12,7 +12,7 @@ import hashlib
 
 from docx.image.image import Image
 from docx.opc.part import Part
-from docx.shared import Emu, Inches
+from docx.shared import Emu, Inches, lazyproperty
 
 
 class ImagePart(Part):
@@ -81,9 +81,11 @@ class ImagePart(Part):
         """
         return cls(partname, content_type, blob)
 
-    @property
+    @lazyproperty
     def sha1(self):
         """
         SHA1 hash digest of the blob of this image part.
         """
-        return hashlib.sha1(self._blob).hexdigest()
+        if self._image is not None:
+            return self._image.sha1
+        return hashlib.sha1(self.blob).hexdigest()
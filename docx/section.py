@@ -14,6 +14,9 @@ class Sections(Sequence):
     Sequence of |Section| objects corresponding to the sections in the
     document. Supports ``len()``, iteration, and indexed access.
     """
+
+    __slots__ = ('_document_elm',)
+
     def __init__(self, document_elm):
         super(Sections, self).__init__()
         self._document_elm = document_elm
@@ -37,6 +40,9 @@ class Section(object):
     """
     Document section, providing access to section and page setup settings.
     """
+
+    __slots__ = ('_sectPr',)
+
     def __init__(self, sectPr):
         super(Section, self).__init__()
         self._sectPr = sectPr
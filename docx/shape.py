@@ -19,6 +19,9 @@ class InlineShapes(Parented):
     Sequence of |InlineShape| instances, supporting len(), iteration, and
     indexed access.
     """
+
+    __slots__ = ('_body',)
+
     def __init__(self, body_elm, parent):
         super(InlineShapes, self).__init__(parent)
         self._body = body_elm
@@ -52,6 +55,9 @@ class InlineShape(object):
     Proxy for an ``<wp:inline>`` element, representing the container for an
     inline graphical object.
     """
+
+    __slots__ = ('_inline',)
+
     def __init__(self, inline):
         super(InlineShape, self).__init__()
         self._inline = inline
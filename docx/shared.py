@@ -6,6 +6,10 @@ Objects shared by docx modules.
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+import weakref
+
+from .compat import Sequence
+
 
 class Length(int):
     """
@@ -238,6 +242,9 @@ class Parented(object):
     such as add or drop a relationship. Provides ``self._parent`` attribute
     to subclasses.
     """
+
+    __slots__ = ('_parent',)
+
     def __init__(self, parent):
         super(Parented, self).__init__()
         self._parent = parent
@@ -248,3 +255,110 @@ class Parented(object):
         The package part containing this object
         """
         return self._parent.part
+
+
+class ProxySequence(Sequence):
+    """
+    Read-only sequence of the proxy objects for the child elements of
+    *element* having namespace-prefixed tag *nsptag*, such as ``'w:p'``.
+    Each proxy is a *proxy_cls* instance having *parent*, created only when
+    it is accessed, so ``len()`` and indexed access do not make a proxy for
+    every child. Slicing returns a list. Like the list it replaces, it
+    compares equal to any sequence having equal items in the same order,
+    and concatenates with ``+`` to a new list.
+    """
+
+    __slots__ = ('_element', '_nsptag', '_proxy_cls', '_parent')
+
+    __hash__ = None
+
+    def __init__(self, element, nsptag, proxy_cls, parent):
+        super(ProxySequence, self).__init__()
+        self._element = element
+        self._nsptag = nsptag
+        self._proxy_cls = proxy_cls
+        self._parent = parent
+
+    def __add__(self, other):
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return list(self) + list(other)
+
+    def __eq__(self, other):
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __getitem__(self, idx):
+        """
+        Provide indexed access, e.g. ``paragraphs[0]`` or ``runs[-1]``. Only
+        the child element at *idx* is located and proxied.
+        """
+        if isinstance(idx, slice):
+            return [self._proxy(child) for child in self._children()[idx]]
+        position = '[last() + $n]' if idx < 0 else '[$n]'
+        children = self._element.xpath(self._nsptag + position, n=idx + 1)
+        if not children:
+            raise IndexError('%s index out of range' % self._nsptag)
+        return self._proxy(children[0])
+
+    def __iter__(self):
+        for child in self._children():
+            yield self._proxy(child)
+
+    def __len__(self):
+        return int(self._element.xpath('count(%s)' % self._nsptag))
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        if equal is NotImplemented:
+            return equal
+        return not equal
+
+    def __radd__(self, other):
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return list(other) + list(self)
+
+    def _children(self):
+        """
+        List of the child elements in this sequence, taken at the time of
+        the call so changes to the XML do not upset an iteration underway.
+        """
+        return self._element.xpath(self._nsptag)
+
+    def _proxy(self, child):
+        return proxy_for(self._proxy_cls, child, self._parent)
+
+
+def enable_proxy_cache(enabled=True):
+    """
+    Turn on reuse of proxy objects, or turn it off when *enabled* is
+    |False|. While it is on, getting the same paragraph, run, table or cell
+    again, for example with ``document.paragraphs[0]`` in a loop, returns
+    the proxy object already made for its element as long as that object is
+    still in use, rather than a new one. Proxy equality is unaffected. Off
+    by default.
+    """
+    global _proxy_cache
+    _proxy_cache = weakref.WeakValueDictionary() if enabled else None
+
+
+def proxy_for(proxy_cls, element, parent):
+    """
+    Return a *proxy_cls* instance for *element* having *parent*, the one
+    already made for *element* when the proxy cache is on and that object
+    is still in use.
+    """
+    proxy_cache = _proxy_cache
+    if proxy_cache is None:
+        return proxy_cls(element, parent)
+    key = (proxy_cls, element)
+    proxy = proxy_cache.get(key)
+    if proxy is None:
+        proxy = proxy_cache[key] = proxy_cls(element, parent)
+    return proxy
+
+
+# weakly holds each proxy, keyed by proxy class and element, when enabled
+_proxy_cache = None
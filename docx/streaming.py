@@ -0,0 +1,167 @@
+# encoding: utf-8
+
+"""
+Functions that read the content of a ``.docx`` package by stream-parsing its
+main document part, without loading the whole of it into memory.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+from lxml import etree
+
+from .opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from .opc.packuri import PACKAGE_URI
+from .opc.phys_pkg import PhysPkgReader
+from .opc.pkgreader import PackageReader
+from .oxml import iterparse_xml
+from .oxml.ns import qn
+from .package import Package
+from .table import Table
+from .text.paragraph import Paragraph
+
+
+def extract_text(docx):
+    """
+    Generate the text of each paragraph in *docx*, a path to a ``.docx``
+    file or a file-like object, in document order. Paragraphs in tables,
+    including nested tables, are generated in cell order. Run text is
+    translated as for :attr:`.Run.text`, a ``<w:tab/>`` becoming ``\\t`` and
+    a ``<w:br/>`` or ``<w:cr/>`` becoming ``\\n``, and the text of runs in
+    hyperlinks is included. A paragraph in a text box is generated before
+    the paragraph containing the text box.
+
+    Only the main document part is read, and it is parsed incrementally and
+    discarded as it goes, so memory use does not grow with the size of the
+    document.
+    """
+    phys_reader = PhysPkgReader(docx)
+    try:
+        with phys_reader.open(_main_document_partname(phys_reader)) as f:
+            for text in iter_paragraph_text(f):
+                yield text
+    finally:
+        phys_reader.close()
+
+
+def iter_blocks(docx):
+    """
+    Generate a |Paragraph| or |Table| object for each paragraph and table in
+    the body of *docx*, a path to a ``.docx`` file or a file-like object, in
+    document order.
+
+    The main document part is parsed incrementally, and each paragraph or
+    table is removed from the document tree once it is parsed, so it is
+    freed when the caller no longer references the object generated for it.
+    Memory use grows with the size of the largest paragraph or table rather
+    than with the size of the document. The rest of the package is opened
+    as by ``Document(docx, lazy=True)``, so properties like
+    :attr:`.Paragraph.style` that depend on other parts work as usual while
+    iterating. The package file is closed once the last block has been
+    generated or the iteration is abandoned. After that, a part not loaded
+    by then can no longer be reached from these objects. An example is the
+    styles part when no style was looked up. Raises |ValueError| if *docx*
+    is not a Word file.
+    """
+    package = Package.open(docx, lazy=True)
+    try:
+        document_part = package.main_document_part
+        if document_part.content_type != CT.WML_DOCUMENT_MAIN:
+            tmpl = "file '%s' is not a Word file, content type is '%s'"
+            raise ValueError(tmpl % (docx, document_part.content_type))
+        with document_part.source_blob.open() as f:
+            for block in _iter_body_blocks(f):
+                if block.tag == _P:
+                    yield Paragraph(block, document_part)
+                else:
+                    yield Table(block, document_part)
+    finally:
+        package.close()
+
+
+def iter_paragraph_text(stream, style_counts=None):
+    """
+    Generate the text of each ``<w:p>`` element in the WordprocessingML
+    document XML read from *stream*, a binary file-like object such as the
+    open member of a main document part, as described for
+    :func:`extract_text`. Each paragraph and table is cleared once it ends.
+    If *style_counts* is not |None|, it is a mapping like
+    :class:`collections.Counter` in which the number of references to each
+    paragraph, character and table style id is accumulated in the same
+    pass.
+    """
+    tags = (_P, _T, _TAB, _BR, _CR, _TBL)
+    if style_counts is not None:
+        tags += _STYLE_REFS
+    # one text buffer for each open paragraph, innermost last
+    buffers = []
+    events = etree.iterparse(stream, ('start', 'end'), tag=tags)
+    for event, elm in events:
+        tag = elm.tag
+        if event == 'start':
+            if tag == _P:
+                buffers.append([])
+        elif tag in _STYLE_REFS:
+            style_counts[elm.get(_VAL)] += 1
+        elif tag == _P:
+            yield ''.join(buffers.pop())
+            _discard(elm)
+        elif tag == _TBL:
+            _discard(elm)
+        elif buffers and elm.getparent().tag == _R:
+            buffers[-1].append(_RUN_TEXT.get(tag, elm.text) or '')
+
+
+def _iter_body_blocks(stream):
+    """
+    Generate each ``<w:p>`` and ``<w:tbl>`` child of the ``<w:body>``
+    element in the WordprocessingML document XML read from *stream*, as
+    a custom element detached from the document tree. Other body children
+    preceding it, such as bookmarks, are discarded.
+    """
+    for event, elm in iterparse_xml(stream, tag=(_P, _TBL)):
+        body = elm.getparent()
+        if body is None or body.tag != _BODY:
+            continue
+        while elm.getprevious() is not None:
+            del body[0]
+        body.remove(elm)
+        yield elm
+
+
+def _discard(elm):
+    """
+    Release the memory held by *elm* and by its preceding siblings, all of
+    which have been fully processed.
+    """
+    elm.clear()
+    parent = elm.getparent()
+    if parent is None:
+        return
+    while elm.getprevious() is not None:
+        del parent[0]
+
+
+def _main_document_partname(phys_reader):
+    """
+    Return the partname of the main document part of the package read by
+    *phys_reader*, found from the package relationships. Raises
+    |ValueError| if the package has no main document part.
+    """
+    partname = PackageReader.partname_related_by(
+        phys_reader, PACKAGE_URI, RT.OFFICE_DOCUMENT
+    )
+    if partname is None:
+        raise ValueError('package has no main document part')
+    return partname
+
+
+_BODY = qn('w:body')
+_P, _R, _T, _TBL = qn('w:p'), qn('w:r'), qn('w:t'), qn('w:tbl')
+_TAB, _BR, _CR = qn('w:tab'), qn('w:br'), qn('w:cr')
+_STYLE_REFS = (qn('w:pStyle'), qn('w:rStyle'), qn('w:tblStyle'))
+_VAL = qn('w:val')
+
+# text equivalent of each run content element other than w:t
+_RUN_TEXT = {_TAB: '\t', _BR: '\n', _CR: '\n'}
@@ -57,8 +57,10 @@ class BaseStyle(ElementProxy):
         rendered using the default style, as is any content with a style not
         defined in the document.
         """
+        styles_elm = self._element.getparent()
         self._element.delete()
         self._element = None
+        self._drop_index(styles_elm)
 
     @property
     def hidden(self):
@@ -102,6 +104,7 @@ class BaseStyle(ElementProxy):
     @name.setter
     def name(self, value):
         self._element.name_val = value
+        self._drop_index(self._element.getparent())
 
     @property
     def priority(self):
@@ -141,6 +144,7 @@ class BaseStyle(ElementProxy):
     @style_id.setter
     def style_id(self, value):
         self._element.styleId = value
+        self._drop_index(self._element.getparent())
 
     @property
     def type(self):
@@ -167,6 +171,18 @@ class BaseStyle(ElementProxy):
     def unhide_when_used(self, value):
         self._element.unhideWhenUsed_val = value
 
+    @staticmethod
+    def _drop_index(styles_elm):
+        """
+        Discard the style lookup index of *styles_elm*, the ``<w:styles>``
+        element this style belongs to, after a change to its name, id or
+        presence. *styles_elm* is |None| for a style not in a document.
+        """
+        if styles_elm is None:
+            return
+        from .styles import _drop_index
+        _drop_index(styles_elm)
+
 
 class _CharacterStyle(BaseStyle):
     """
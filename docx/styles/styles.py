@@ -9,6 +9,7 @@ from __future__ import (
 )
 
 from warnings import warn
+from weakref import WeakKeyDictionary
 
 from . import BabelFish
 from .latent import LatentStyles
@@ -30,10 +31,7 @@ class Styles(ElementProxy):
         Enables `in` operator on style name.
         """
         internal_name = BabelFish.ui2internal(name)
-        for style in self._element.style_lst:
-            if style.name_val == internal_name:
-                return True
-        return False
+        return internal_name in self._index.styles_by_name
 
     def __getitem__(self, key):
         """
@@ -41,11 +39,12 @@ class Styles(ElementProxy):
         deprecated, triggers a warning, and will be removed in a near-future
         release.
         """
-        style_elm = self._element.get_by_name(BabelFish.ui2internal(key))
+        index = self._index
+        style_elm = index.styles_by_name.get(BabelFish.ui2internal(key))
         if style_elm is not None:
             return StyleFactory(style_elm)
 
-        style_elm = self._element.get_by_id(key)
+        style_elm = index.styles_by_id.get(key)
         if style_elm is not None:
             msg = (
                 'style lookup by style_id is deprecated. Use style name as '
@@ -74,6 +73,7 @@ class Styles(ElementProxy):
         style = self._element.add_style_of_type(
             style_name, style_type, builtin
         )
+        _drop_index(self._element)
         return StyleFactory(style)
 
     def default(self, style_type):
@@ -81,7 +81,7 @@ class Styles(ElementProxy):
         Return the default style for *style_type* or |None| if no default is
         defined for that type (not common).
         """
-        style = self._element.default_for(style_type)
+        style = self._index.defaults_by_type.get(style_type)
         if style is None:
             return None
         return StyleFactory(style)
@@ -122,13 +122,27 @@ class Styles(ElementProxy):
         """
         return LatentStyles(self._element.get_or_add_latentStyles())
 
+    @property
+    def _index(self):
+        """
+        The |_StyleIndex| for the ``<w:styles>`` element of this object,
+        built on first use and shared by every |Styles| object on that
+        element. It is rebuilt after a style is added, deleted or renamed
+        through this API, or when the number of child elements changes.
+        """
+        styles_elm = self._element
+        index = _style_indexes.get(styles_elm)
+        if index is None or index.child_count != len(styles_elm):
+            index = _style_indexes[styles_elm] = _StyleIndex(styles_elm)
+        return index
+
     def _get_by_id(self, style_id, style_type):
         """
         Return the style of *style_type* matching *style_id*. Returns the
         default for *style_type* if *style_id* is not found or if the style
         having *style_id* is not of *style_type*.
         """
-        style = self._element.get_by_id(style_id)
+        style = self._index.styles_by_id.get(style_id)
         if style is None or style.type != style_type:
             return self.default(style_type)
         return StyleFactory(style)
@@ -155,3 +169,33 @@ class Styles(ElementProxy):
         if style == self.default(style_type):
             return None
         return style.style_id
+
+
+class _StyleIndex(object):
+    """
+    Lookup tables for the ``<w:style>`` children of a ``<w:styles>``
+    element, replacing an XPath query per style lookup with a dict access.
+    """
+    def __init__(self, styles_elm):
+        super(_StyleIndex, self).__init__()
+        self.child_count = len(styles_elm)
+        self.styles_by_name = {}
+        self.styles_by_id = {}
+        self.defaults_by_type = {}
+        for style in styles_elm.style_lst:
+            self.styles_by_name.setdefault(style.name_val, style)
+            self.styles_by_id.setdefault(style.styleId, style)
+            if style.default:
+                # spec calls for last default in document order
+                self.defaults_by_type[style.type] = style
+
+
+_style_indexes = WeakKeyDictionary()
+
+
+def _drop_index(styles_elm):
+    """
+    Discard the |_StyleIndex| of *styles_elm*, if any, so it is rebuilt on
+    next use. Called when a style is added, deleted or renamed.
+    """
+    _style_indexes.pop(styles_elm, None)
@@ -9,16 +9,22 @@ from __future__ import absolute_import, print_function, unicode_literals
 from .blkcntnr import BlockItemContainer # type: ignore
 from .enum.style import WD_STYLE_TYPE # type: ignore
 from .oxml.simpletypes import ST_Merge # type: ignore
-from .shared import Inches, lazyproperty, Parented # type: ignore
+from .shared import Inches, lazyproperty, Parented, proxy_for # type: ignore
 from typing import Tuple, List, cast
 
 class Table(Parented):
     """
     Proxy class for a WordprocessingML ``<w:tbl>`` element.
     """
+
+    __slots__ = (
+        '_tbl', '_element', '_cell_grid', '_columns', '_rows', '__weakref__'
+    )
+
     def __init__(self, tbl, parent):
         super(Table, self).__init__(parent)
         self._element = self._tbl = tbl
+        self._cell_grid = None
 
     def add_column(self, width):
         """
@@ -31,6 +37,8 @@ class Table(Parented):
         for tr in self._tbl.tr_lst:
             tc = tr.add_tc()
             tc.width = width
+        self._tbl.note_mutation()
+        self._reset_cells()
         return _Column(gridCol, self)
 
     def add_row(self) -> '_Row':
@@ -42,6 +50,8 @@ class Table(Parented):
         for gridCol in tbl.tblGrid.gridCol_lst:
             tc = tr.add_tc()
             tc.width = gridCol.w
+        tbl.note_mutation()
+        self._reset_cells()
         return _Row(tr, self)
 
     @property
@@ -163,9 +173,39 @@ class Table(Parented):
         """
         A sequence of |_Cell| objects, one for each cell of the layout grid.
         If the table contains a span, one or more |_Cell| object references
-        are repeated.
+        are repeated. The sequence is built once and reused until the table
+        is changed by :meth:`add_row`, :meth:`add_column` or a cell merge,
+        through this or any other |Table| object, or a row is added or
+        removed directly in the XML.
+        """
+        return self._grid[2]
+
+    @property
+    def _column_count(self):
+        """
+        The number of grid columns in this table.
+        """
+        return self._grid[1]
+
+    @property
+    def _grid(self):
+        """
+        A `(stamp, column_count, cells)` 3-tuple describing the layout grid
+        of this table, built on first access and again whenever the table is
+        seen to have changed.
+        """
+        stamp = self._grid_stamp
+        if self._cell_grid is None or self._cell_grid[0] != stamp:
+            col_count = self._tbl.col_count
+            cells = self._build_cells(col_count)
+            self._cell_grid = (stamp, col_count, cells)
+        return self._cell_grid
+
+    def _build_cells(self, col_count):
+        """
+        Return a newly built list of the |_Cell| objects in the layout grid
+        of this table, as described for :attr:`_cells`.
         """
-        col_count = self._column_count
         cells = []
         for tc in self._tbl.iter_tcs():
             for grid_span_idx in range(tc.grid_span):
@@ -174,15 +214,29 @@ class Table(Parented):
                 elif grid_span_idx > 0:
                     cells.append(cells[-1])
                 else:
-                    cells.append(_Cell(tc, self))
+                    cells.append(proxy_for(_Cell, tc, self))
         return cells
 
     @property
-    def _column_count(self):
+    def _grid_stamp(self):
         """
-        The number of grid columns in this table.
+        A `(mutation_count, child_count, last_child, last_grandchild)`
+        4-tuple identifying the structure of this table, cheap to compute no
+        matter how large the table. *mutation_count* changes with each row,
+        column or merge made through any |Table| object on the same
+        ``<w:tbl>`` element. The others change when a row is added or
+        removed anywhere in the XML, or a cell added to the last row.
+        """
+        tbl = self._tbl
+        last_child = tbl[-1]
+        last_grandchild = last_child[-1] if len(last_child) else None
+        return tbl.mutation_count, len(tbl), last_child, last_grandchild
+
+    def _reset_cells(self):
         """
-        return self._tbl.col_count
+        Discard the cached cell grid so it is rebuilt on next access.
+        """
+        self._cell_grid = None
 
     @property
     def _tblPr(self):
@@ -193,6 +247,9 @@ class _Cell(BlockItemContainer):
     """
     Table cell
     """
+
+    __slots__ = ('_tc', '__weakref__')
+
     def __init__(self, tc, parent):
         super(_Cell, self).__init__(tc, parent)
         self._tc = tc
@@ -231,21 +288,22 @@ class _Cell(BlockItemContainer):
         """
         tc, tc_2 = self._tc, other_cell._tc
         merged_tc = tc.merge(tc_2)
+        self._parent.table._reset_cells()
         return _Cell(merged_tc, self._parent)
 
     @property
     def paragraphs(self):
         """
-        List of paragraphs in the cell. A table cell is required to contain
-        at least one block-level element and end with a paragraph. By
-        default, a new cell contains a single paragraph. Read-only
+        Sequence of paragraphs in the cell. A table cell is required to
+        contain at least one block-level element and end with a paragraph.
+        By default, a new cell contains a single paragraph. Read-only
         """
         return super(_Cell, self).paragraphs
 
     @property
     def tables(self):
         """
-        List of tables in the cell, in the order they appear. Read-only.
+        Sequence of tables in the cell, in the order they appear. Read-only.
         """
         return super(_Cell, self).tables
 
@@ -286,6 +344,9 @@ class _Column(Parented):
     """
     Table column
     """
+
+    __slots__ = ('_gridCol',)
+
     def __init__(self, gridCol, parent):
         super(_Column, self).__init__(parent)
         self._gridCol = gridCol
@@ -329,6 +390,9 @@ class _Columns(Parented):
     Sequence of |_Column| instances corresponding to the columns in a table.
     Supports ``len()``, iteration and indexed access.
     """
+
+    __slots__ = ('_tbl',)
+
     def __init__(self, tbl, parent):
         super(_Columns, self).__init__(parent)
         self._tbl = tbl
@@ -372,6 +436,9 @@ class _Row(Parented):
     """
     Table row
     """
+
+    __slots__ = ('_tr',)
+
     def __init__(self, tr, parent):
         super(_Row, self).__init__(parent)
         self._tr = tr
@@ -403,6 +470,9 @@ class _Rows(Parented):
     Sequence of |_Row| objects corresponding to the rows in a table.
     Supports ``len()``, iteration, indexed access, and slicing.
     """
+
+    __slots__ = ('_tbl',)
+
     def __init__(self, tbl, parent):
         super(_Rows, self).__init__(parent)
         self._tbl = tbl
@@ -0,0 +1,145 @@
+# encoding: utf-8
+
+"""
+|TemplateCache| object, providing fast creation of new documents from
+frequently used templates.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import os
+
+from collections import OrderedDict
+from zipfile import ZipFile
+
+from .api import _default_docx_path
+from .opc.constants import CONTENT_TYPE as CT
+from .package import Package
+
+
+class TemplateCache(object):
+    """
+    Keeps the parsed package of each template it is asked for, so a new
+    document based on a template comes from a copy of the template's element
+    trees and part graph rather than from opening and parsing the template
+    file again.
+
+    Templates are evicted least-recently-used first once more than
+    *max_templates* are cached or their combined size exceeds *max_bytes*.
+    The size of a template is estimated as the uncompressed size of its
+    parts. This is a proxy measure, not the memory used by the template:
+    the parsed element trees of its XML parts commonly take several times
+    their size in bytes, so *max_bytes* bounds memory use only within that
+    factor. A template file that changes on disk is reloaded on next use.
+    """
+    def __init__(self, max_templates=16, max_bytes=256 * 1024 * 1024):
+        super(TemplateCache, self).__init__()
+        self._max_templates = max_templates
+        self._max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._nbytes = 0
+
+    def __contains__(self, path):
+        return os.path.abspath(path) in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """
+        Remove all templates from this cache.
+        """
+        self._entries.clear()
+        self._nbytes = 0
+
+    def document(self, path=None):
+        """
+        Return a new |Document| object holding a copy of the template at
+        *path*, a path to a ``.docx`` file. If *path* is |None|, the
+        built-in default template is used. Changes to the returned document
+        do not affect the cached template.
+        """
+        path = _default_docx_path() if path is None else path
+        package = self._package_for(path)
+        return package.copy().main_document_part.document
+
+    @property
+    def nbytes(self):
+        """
+        Estimated size in bytes of the templates held in this cache, the
+        combined uncompressed size of their parts rather than the memory
+        their parsed trees take.
+        """
+        return self._nbytes
+
+    def _evict(self):
+        """
+        Drop least-recently-used templates until this cache is within its
+        limits. The most recently used template is always kept.
+        """
+        while len(self._entries) > 1 and (
+                len(self._entries) > self._max_templates or
+                self._nbytes > self._max_bytes):
+            _, entry = self._entries.popitem(last=False)
+            self._nbytes -= entry.nbytes
+
+    def _package_for(self, path):
+        """
+        Return the cached |Package| for the template at *path*, loading it
+        first if it is not cached or has changed since it was cached.
+        """
+        key = os.path.abspath(path)
+        stat = os.stat(key)
+        stamp = (stat.st_mtime, stat.st_size)
+        entry = self._entries.pop(key, None)
+        if entry is not None and entry.stamp != stamp:
+            self._nbytes -= entry.nbytes
+            entry = None
+        if entry is None:
+            entry = _CachedTemplate.load(key, stamp)
+            self._nbytes += entry.nbytes
+        self._entries[key] = entry
+        self._evict()
+        return entry.package
+
+
+class _CachedTemplate(object):
+    """
+    Value object holding a template package along with the file stamp and
+    estimated size used to manage it in a |TemplateCache|.
+    """
+    def __init__(self, package, stamp, nbytes):
+        super(_CachedTemplate, self).__init__()
+        self.package = package
+        self.stamp = stamp
+        self.nbytes = nbytes
+
+    @classmethod
+    def load(cls, path, stamp):
+        """
+        Return a new |_CachedTemplate| instance holding the package parsed
+        from the ``.docx`` file at *path*.
+        """
+        package = Package.open(path)
+        content_type = package.main_document_part.content_type
+        if content_type != CT.WML_DOCUMENT_MAIN:
+            tmpl = "file '%s' is not a Word file, content type is '%s'"
+            raise ValueError(tmpl % (path, content_type))
+        return cls(package, stamp, _package_size(path))
+
+
+def _package_size(path):
+    """
+    Return the combined uncompressed size of the members of the package at
+    *path*, either a zip file or a directory holding an expanded package.
+    """
+    if os.path.isdir(path):
+        return sum(
+            os.path.getsize(os.path.join(dirpath, filename))
+            for dirpath, _, filenames in os.walk(path)
+            for filename in filenames
+        )
+    with ZipFile(path) as zipf:
+        return sum(zinfo.file_size for zinfo in zipf.infolist())
@@ -11,13 +11,16 @@ from __future__ import (
 from ..enum.style import WD_STYLE_TYPE
 from .parfmt import ParagraphFormat
 from .run import Run
-from ..shared import Parented
+from ..shared import Parented, ProxySequence
 
 
 class Paragraph(Parented):
     """
     Proxy object wrapping ``<w:p>`` element.
     """
+
+    __slots__ = ('_p', '_element', '__weakref__')
+
     def __init__(self, p, parent):
         super(Paragraph, self).__init__(parent)
         self._p = self._element = p
@@ -59,7 +62,10 @@ class Paragraph(Parented):
         Return this same paragraph after removing all its content.
         Paragraph-level formatting, such as style, is preserved.
         """
+        had_ids = bool(self._p.xpath('.//@id'))
         self._p.clear_content()
+        if had_ids:
+            self.part.rescan_ids()
         return self
 
     def insert_paragraph_before(self, text=None, style=None):
@@ -88,9 +94,9 @@ class Paragraph(Parented):
     def runs(self):
         """
         Sequence of |Run| instances corresponding to the <w:r> elements in
-        this paragraph.
+        this paragraph, each created only as it is accessed.
         """
-        return [Run(r, self) for r in self._p.r_lst]
+        return ProxySequence(self._p, 'w:r', Run, self)
 
     @property
     def style(self):
@@ -21,6 +21,9 @@ class Run(Parented):
     not specified directly on the run and its effective value is taken from
     the style hierarchy.
     """
+
+    __slots__ = ('_r', '_element', 'element', '__weakref__')
+
     def __init__(self, r, parent):
         super(Run, self).__init__(parent)
         self._r = self._element = self.element = r
@@ -46,19 +49,32 @@ class Run(Parented):
         if clear is not None:
             br.clear = clear
 
-    def add_picture(self, image_path_or_stream, width=None, height=None):
+    def add_picture(self, image_path_or_stream, width=None, height=None,
+                    downscaler=None):
         """
         Return an |InlineShape| instance containing the image identified by
         *image_path_or_stream*, added to the end of this run.
-        *image_path_or_stream* can be a path (a string) or a file-like object
-        containing a binary image. If neither width nor height is specified,
-        the picture appears at its native size. If only one is specified, it
-        is used to compute a scaling factor that is then applied to the
-        unspecified dimension, preserving the aspect ratio of the image. The
-        native size of the picture is calculated using the dots-per-inch
-        (dpi) value specified in the image file, defaulting to 72 dpi if no
-        value is specified, as is often the case.
-        """
+        *image_path_or_stream* can be a path (a string), a file-like object
+        containing a binary image, or the image bytes themselves in any
+        buffer such as |bytes|, a |memoryview| or an ``mmap``. A buffer is
+        used in place, without being copied, and so must not change or be
+        closed until the document is saved. If neither width nor height is
+        specified, the picture appears at its native size. If only one is
+        specified, it is used to compute a scaling factor that is then
+        applied to the unspecified dimension, preserving the aspect ratio of
+        the image. The native size of the picture is calculated using the
+        dots-per-inch (dpi) value specified in the image file, defaulting to
+        72 dpi if no value is specified, as is often the case.
+
+        If *downscaler*, a |Downscaler| instance, is given, an image larger
+        than needed for the picture's size is resampled by it before being
+        embedded, reducing the size of the saved document. The picture's
+        size is unchanged.
+        """
+        if downscaler is not None:
+            image_path_or_stream, width, height = downscaler.prepare(
+                image_path_or_stream, width, height
+            )
         inline = self.part.new_pic_inline(image_path_or_stream, width, height)
         self._r.add_drawing(inline)
         return InlineShape(inline)
@@ -96,7 +112,10 @@ class Run(Parented):
         Return reference to this run after removing all its content. All run
         formatting is preserved.
         """
+        had_ids = bool(self._r.xpath('.//@id'))
         self._r.clear_content()
+        if had_ids:
+            self.part.rescan_ids()
         return self
 
     @property
@@ -186,6 +205,9 @@ class _Text(object):
     """
     Proxy object wrapping ``<w:t>`` element.
     """
+
+    __slots__ = ('_t',)
+
     def __init__(self, t_elm):
         super(_Text, self).__init__()
         self._t = t_elm
@@ -11,7 +11,7 @@ Feature: Access document collections
 
   Scenario: Access the paragraphs in the document body as a list
      Given a document containing three paragraphs
-      Then document.paragraphs is a list containing three paragraphs
+      Then document.paragraphs is a sequence containing three paragraphs
 
 
   Scenario: Access the section collection of a document
@@ -26,4 +26,4 @@ Feature: Access document collections
 
   Scenario: Access the tables collection of a document
     Given a document having three tables
-     Then document.tables is a list containing three tables
+     Then document.tables is a sequence containing three tables
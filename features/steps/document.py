@@ -9,6 +9,7 @@ from __future__ import absolute_import, print_function, unicode_literals
 from behave import given, then, when
 
 from docx import Document
+from docx.compat import Sequence
 from docx.enum.section import WD_ORIENT, WD_SECTION
 from docx.shape import InlineShapes
 from docx.shared import Inches
@@ -169,11 +170,11 @@ def then_document_inline_shapes_is_an_InlineShapes_object(context):
     assert isinstance(inline_shapes, InlineShapes)
 
 
-@then('document.paragraphs is a list containing three paragraphs')
-def then_document_paragraphs_is_a_list_containing_three_paragraphs(context):
+@then('document.paragraphs is a sequence containing three paragraphs')
+def then_document_paragraphs_is_a_sequence_of_three_paragraphs(context):
     document = context.document
     paragraphs = document.paragraphs
-    assert isinstance(paragraphs, list)
+    assert isinstance(paragraphs, Sequence)
     assert len(paragraphs) == 3
     for paragraph in paragraphs:
         assert isinstance(paragraph, Paragraph)
@@ -192,11 +193,11 @@ def then_document_styles_is_a_Styles_object(context):
     assert isinstance(styles, Styles)
 
 
-@then('document.tables is a list containing three tables')
-def then_document_tables_is_a_list_containing_three_tables(context):
+@then('document.tables is a sequence containing three tables')
+def then_document_tables_is_a_sequence_of_three_tables(context):
     document = context.document
     tables = document.tables
-    assert isinstance(tables, list)
+    assert isinstance(tables, Sequence)
     assert len(tables) == 3
     for table in tables:
         assert isinstance(table, Table)
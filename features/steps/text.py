@@ -33,7 +33,7 @@ def given_a_run(context):
 @given('a run having {bool_prop_name} set on')
 def given_a_run_having_bool_prop_set_on(context, bool_prop_name):
     run = Document().add_paragraph().add_run()
-    setattr(run, bool_prop_name, True)
+    setattr(run.font, bool_prop_name, True)
     context.run = run
 
 
@@ -155,7 +155,7 @@ def when_I_assign_mixed_text_to_the_text_property(context):
 def when_assign_true_to_bool_run_prop(context, value_str, bool_prop_name):
     value = {'True': True, 'False': False, 'None': None}[value_str]
     run = context.run
-    setattr(run, bool_prop_name, value)
+    setattr(run.font, bool_prop_name, value)
 
 
 @when('I assign {value} to run.style')
@@ -249,19 +249,19 @@ def then_the_picture_appears_at_the_end_of_the_run(context):
 @then('the run appears in {boolean_prop_name} unconditionally')
 def then_run_appears_in_boolean_prop_name(context, boolean_prop_name):
     run = context.run
-    assert getattr(run, boolean_prop_name) is True
+    assert getattr(run.font, boolean_prop_name) is True
 
 
 @then('the run appears with its inherited {boolean_prop_name} setting')
 def then_run_inherits_bool_prop_value(context, boolean_prop_name):
     run = context.run
-    assert getattr(run, boolean_prop_name) is None
+    assert getattr(run.font, boolean_prop_name) is None
 
 
 @then('the run appears without {boolean_prop_name} unconditionally')
 def then_run_appears_without_bool_prop(context, boolean_prop_name):
     run = context.run
-    assert getattr(run, boolean_prop_name) is False
+    assert getattr(run.font, boolean_prop_name) is False
 
 
 @then('the run contains no text')
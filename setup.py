@@ -37,6 +37,7 @@ PACKAGES = find_packages(exclude=['tests', 'tests.*'])
 PACKAGE_DATA = {'docx': ['templates/*']}
 
 INSTALL_REQUIRES = ['lxml>=2.3.2']
+EXTRAS_REQUIRE = {'downscale': ['Pillow']}
 TEST_SUITE = 'tests'
 TESTS_REQUIRE = ['behave', 'mock', 'pyparsing', 'pytest']
 
@@ -73,6 +74,7 @@ params = {
     'packages':         PACKAGES,
     'package_data':     PACKAGE_DATA,
     'install_requires': INSTALL_REQUIRES,
+    'extras_require':   EXTRAS_REQUIRE,
     'tests_require':    TESTS_REQUIRE,
     'test_suite':       TEST_SUITE,
     'classifiers':      CLASSIFIERS,
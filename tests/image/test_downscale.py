@@ -0,0 +1,159 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.image.downscale module
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import pytest
+
+from docx.compat import BytesIO
+from docx.image.constants import MIME_TYPE
+from docx.image.downscale import Downscaler
+from docx.image.image import Image
+from docx.shared import Inches
+
+from ..unitutil.file import test_file
+from ..unitutil.mock import Mock, function_mock, instance_mock, method_mock
+
+
+class DescribeDownscaler(object):
+
+    def it_prepares_a_picture_at_its_original_size(self, request):
+        image = Image.from_file(test_file('python-icon.png'))
+        downscale_ = method_mock(
+            request, Downscaler, 'downscale', return_value='small'
+        )
+        downscaler = Downscaler(dpi=100)
+
+        prepared = downscaler.prepare(image, Inches(2))
+
+        assert prepared == ('small', Inches(2), Inches(2))
+        downscale_.assert_called_once_with(image, Inches(2), Inches(2))
+
+    def it_leaves_an_image_small_enough_unchanged(self, image_, _resample_):
+        downscaler = Downscaler(dpi=100)
+        assert downscaler.downscale(image_, Inches(5), Inches(2)) is image_
+        assert _resample_.call_count == 0
+
+    def it_resamples_each_image_and_size_once(self, image_, _resample_):
+        downscaler = Downscaler(dpi=100)
+
+        downscaled = downscaler.downscale(image_, Inches(2), Inches(1))
+        again = downscaler.downscale(image_, Inches(2), Inches(1))
+        downscaler.downscale(image_, Inches(3), Inches(1))
+
+        assert downscaled is _resample_.return_value
+        assert again is downscaled
+        assert _resample_.call_args_list[0][0][1:] == (image_, 200, 100)
+        assert _resample_.call_args_list[1][0][1:] == (image_, 300, 100)
+
+    def it_resamples_again_once_a_result_is_evicted(
+            self, image_, _resample_):
+        downscaler = Downscaler(dpi=100, max_cached=2)
+
+        for width in (1, 2, 1, 3, 1, 2):
+            downscaler.downscale(image_, Inches(width), Inches(1))
+
+        px_widths = [c[0][2] for c in _resample_.call_args_list]
+        assert px_widths == [100, 200, 300, 200]
+
+    def it_caches_what_it_resamples_with_pillow(self, PILImage_):
+        image = Image.from_file(test_file('monty-truth.png'))
+        downscaler = Downscaler(dpi=10, max_cached=2)
+
+        downscaled = [
+            downscaler.downscale(image, Inches(width), Inches(1))
+            for width in (1, 2, 1, 3, 1, 2)
+        ]
+
+        resize_ = PILImage_.open.return_value.resize
+        sizes = [c[0][0] for c in resize_.call_args_list]
+        assert sizes == [(10, 10), (20, 10), (30, 10), (20, 10)]
+        assert downscaled[2] is downscaled[0]
+        assert downscaled[4] is downscaled[0]
+        assert downscaled[5] is not downscaled[1]
+
+    def it_prepares_images_in_order_on_a_thread_pool(self, PILImage_):
+        downscaler = Downscaler(dpi=10)
+        filenames = [
+            'python-icon.png', 'python-icon.jpeg', 'sonic.gif',
+            'monty-truth.png',
+        ]
+        paths = [test_file(filename) for filename in filenames]
+
+        prepared = list(
+            downscaler.prepare_all(paths, Inches(1), max_workers=3)
+        )
+
+        assert [image.filename for image, cx, cy in prepared] == [
+            'python-icon.png', 'python-icon.jpg', 'sonic.gif',
+            'monty-truth.png',
+        ]
+        assert [image.content_type for image, cx, cy in prepared] == [
+            MIME_TYPE.PNG, MIME_TYPE.JPEG, MIME_TYPE.GIF, MIME_TYPE.PNG
+        ]
+        assert [cx for image, cx, cy in prepared] == [Inches(1)] * 4
+
+    @pytest.mark.parametrize('format_, content_type', [
+        ('JPEG', MIME_TYPE.JPEG), ('PNG', MIME_TYPE.PNG),
+        ('TIFF', MIME_TYPE.PNG),
+    ])
+    def it_resamples_and_reencodes_an_image(self, format_, content_type):
+        PILImage = pytest.importorskip('PIL.Image')
+        stream = BytesIO()
+        PILImage.new('RGB', (800, 400), 'red').save(stream, format_)
+        image = Image.from_blob(stream.getvalue(), 'photo.foo')
+
+        downscaled, width, height = Downscaler(dpi=50).prepare(
+            image, Inches(4)
+        )
+
+        assert (downscaled.px_width, downscaled.px_height) == (200, 100)
+        assert downscaled.content_type == content_type
+        assert downscaled.horz_dpi == 50
+        assert downscaled.filename.startswith('photo.')
+        assert (width, height) == (Inches(4), Inches(2))
+
+    def it_prepares_images_on_a_thread_pool(self):
+        downscaler = Downscaler(dpi=1000)
+        paths = [test_file('python-icon.png'), test_file('sonic.gif')]
+
+        prepared = list(downscaler.prepare_all(paths, Inches(1)))
+
+        assert [image.content_type for image, cx, cy in prepared] == [
+            MIME_TYPE.PNG, MIME_TYPE.GIF
+        ]
+        assert [cx for image, cx, cy in prepared] == [Inches(1), Inches(1)]
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def image_(self, request):
+        return instance_mock(
+            request, Image, content_type=MIME_TYPE.PNG, px_width=400,
+            px_height=400, sha1='5ha1'
+        )
+
+    @pytest.fixture
+    def PILImage_(self, request):
+        def save(stream, format_, **options):
+            filename = 'python-icon.%s' % (
+                'jpeg' if format_ == 'JPEG' else 'png'
+            )
+            with open(test_file(filename), 'rb') as f:
+                stream.write(f.read())
+
+        PILImage_ = Mock(name='PILImage')
+        pil_image_ = PILImage_.open.return_value
+        pil_image_.mode, pil_image_.info = 'RGB', {}
+        pil_image_.resize.return_value.save.side_effect = save
+        function_mock(
+            request, 'docx.image.downscale._pil_image', return_value=PILImage_
+        )
+        return PILImage_
+
+    @pytest.fixture
+    def _resample_(self, request):
+        return method_mock(request, Downscaler, '_resample', autospec=True)
@@ -8,9 +8,35 @@ from __future__ import absolute_import, print_function
 
 import pytest
 
+from struct import Struct
+
 from docx.compat import BytesIO
 from docx.image.exceptions import UnexpectedEndOfFileError
-from docx.image.helpers import BIG_ENDIAN, LITTLE_ENDIAN, StreamReader
+from docx.image.helpers import (
+    BIG_ENDIAN, LITTLE_ENDIAN, BufferStream, StreamReader
+)
+
+
+class DescribeBufferStream(object):
+
+    def it_reads_from_the_buffer_like_a_file(self):
+        stream = BufferStream(bytearray(b'foobarbaz'))
+        assert stream.read(3) == b'foo'
+        assert stream.tell() == 3
+        stream.seek(6)
+        assert stream.read() == b'baz'
+        assert stream.read(1) == b''
+        stream.seek(-3, 2)
+        assert stream.read(2) == b'ba'
+        stream.seek(-4, 1)
+        assert stream.read(2) == b'ar'
+
+    def it_can_unpack_a_struct_in_place(self):
+        stream = BufferStream(memoryview(b'\x00\x2A\x01'))
+        assert stream.unpack(Struct('>H')) == (42,)
+        assert stream.tell() == 2
+        with pytest.raises(UnexpectedEndOfFileError):
+            stream.unpack(Struct('>H'))
 
 
 class DescribeStreamReader(object):
@@ -34,18 +60,20 @@ class DescribeStreamReader(object):
     # fixtures -------------------------------------------------------
 
     @pytest.fixture(params=[
-        (BIG_ENDIAN,    b'\xBE\x00\x00\x00\x2A\xEF', 1, 42),
-        (LITTLE_ENDIAN, b'\xBE\xEF\x2A\x00\x00\x00', 2, 42),
+        (BIG_ENDIAN,    b'\xBE\x00\x00\x00\x2A\xEF', 1, 42, BytesIO),
+        (LITTLE_ENDIAN, b'\xBE\xEF\x2A\x00\x00\x00', 2, 42, BytesIO),
+        (BIG_ENDIAN,    b'\xBE\x00\x00\x00\x2A\xEF', 1, 42, BufferStream),
     ])
     def read_long_fixture(self, request):
-        byte_order, bytes_, offset, expected_int = request.param
-        stream = BytesIO(bytes_)
+        byte_order, bytes_, offset, expected_int, Stream = request.param
+        stream = Stream(bytes_)
         stream_rdr = StreamReader(stream, byte_order)
         return stream_rdr, offset, expected_int
 
-    @pytest.fixture
-    def read_str_fixture(self):
-        stream = BytesIO(b'\x01\x02foobar\x03\x04')
+    @pytest.fixture(params=[BytesIO, BufferStream])
+    def read_str_fixture(self, request):
+        Stream = request.param
+        stream = Stream(b'\x01\x02foobar\x03\x04')
         stream_rdr = StreamReader(stream, BIG_ENDIAN)
         expected_string = 'foobar'
         return stream_rdr, expected_string
@@ -6,13 +6,18 @@ Test suite for docx.image package
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+import os
+import shutil
+
 import pytest
 
 from docx.compat import BytesIO
 from docx.image.bmp import Bmp
 from docx.image.exceptions import UnrecognizedImageError
 from docx.image.gif import Gif
-from docx.image.image import BaseImageHeader, Image, _ImageHeaderFactory
+from docx.image.image import (
+    BaseImageHeader, Image, _ImageHeaderFactory, _probe_cache, probe
+)
 from docx.image.jpeg import Exif, Jfif
 from docx.image.png import Png
 from docx.image.tiff import Tiff
@@ -22,19 +27,73 @@ from docx.shared import Emu, Length
 from ..unitutil.file import test_file
 from ..unitutil.mock import (
     function_mock, class_mock, initializer_mock, instance_mock, method_mock,
-    property_mock
+    property_mock, var_mock
 )
 
 
+class DescribeImagePackage(object):
+
+    def it_loads_the_image_header_classes_on_first_use(self):
+        import docx.image
+        assert (Png, 0, b'\x89PNG\x0D\x0A\x1A\x0A') in docx.image.SIGNATURES
+        assert docx.image.probe is probe
+        with pytest.raises(AttributeError):
+            docx.image.foobar
+
+
+class Describe_probe(object):
+
+    def it_reads_the_image_header_of_an_image_file(self):
+        image_header = probe(test_file('python-icon.png'))
+        assert isinstance(image_header, Png)
+        assert image_header.content_type == CT.PNG
+        assert (image_header.px_width, image_header.px_height) == (24, 24)
+
+    def it_memoizes_the_header_until_the_file_changes(self, tmpdir):
+        path = str(tmpdir.join('image'))
+        shutil.copyfile(test_file('python-icon.png'), path)
+        image_header = probe(path)
+        assert probe(path) is image_header
+
+        shutil.copyfile(test_file('sonic.gif'), path)
+        os.utime(path, (0, 0))
+
+        assert isinstance(probe(path), Gif)
+
+    def it_forgets_the_least_recently_probed_file(self, tmpdir, request):
+        var_mock(request, 'docx.image.image._PROBE_CACHE_SIZE', new=2)
+        paths = [str(tmpdir.join('image%d' % n)) for n in range(3)]
+        for path in paths:
+            shutil.copyfile(test_file('python-icon.png'), path)
+        image_header = probe(paths[0])
+
+        probe(paths[1])
+        assert probe(paths[0]) is image_header
+        probe(paths[2])
+
+        assert paths[0] in _probe_cache
+        assert paths[1] not in _probe_cache
+
+
 class DescribeImage(object):
 
     def it_can_construct_from_an_image_blob(self, from_blob_fixture):
         blob_, BytesIO_, _from_stream_, stream_, image_ = from_blob_fixture
         image = Image.from_blob(blob_)
         BytesIO_.assert_called_once_with(blob_)
-        _from_stream_.assert_called_once_with(stream_, blob_)
+        _from_stream_.assert_called_once_with(stream_, blob_, None)
         assert image is image_
 
+    def it_can_construct_from_an_image_buffer_in_place(self):
+        with open(test_file('python-icon.png'), 'rb') as f:
+            buffer = bytearray(f.read())
+
+        image = Image.from_file(memoryview(buffer))
+
+        assert image.blob.obj is buffer
+        assert image.content_type == 'image/png'
+        assert (image.px_width, image.px_height) == (24, 24)
+
     def it_can_construct_from_an_image_path(self, from_path_fixture):
         image_path, _from_stream_, stream_, blob, filename, image_ = (
             from_path_fixture
@@ -46,9 +105,22 @@ class DescribeImage(object):
     def it_can_construct_from_an_image_file_like(self, from_filelike_fixture):
         image_stream, _from_stream_, blob, image_ = from_filelike_fixture
         image = Image.from_file(image_stream)
-        _from_stream_.assert_called_once_with(image_stream, blob, None)
+        stream, blob_arg, filename = _from_stream_.call_args[0]
+        assert (stream.getvalue(), blob_arg, filename) == (blob, blob, None)
         assert image is image_
 
+    def it_can_read_the_bytes_of_an_image(self, read_fixture):
+        image_descriptor, expected_blob, expected_filename = read_fixture
+        blob, filename = Image.read_blob(image_descriptor)
+        assert blob == expected_blob
+        assert filename == expected_filename
+
+    def it_uses_an_image_buffer_in_place(self):
+        buffer = bytearray(b'foobar')
+        blob, filename = Image.read_blob(buffer)
+        assert isinstance(blob, memoryview)
+        assert blob.obj is buffer
+
     def it_can_construct_from_an_image_stream(self, from_stream_fixture):
         # fixture ----------------------
         stream_, blob_, filename_in = from_stream_fixture[:3]
@@ -171,6 +243,21 @@ class DescribeImage(object):
             blob = f.read()
         return image_path, _from_stream_, stream_, blob, filename, image_
 
+    @pytest.fixture(params=['path', 'stream', 'bytes', 'buffer'])
+    def read_fixture(self, request):
+        path = test_file('python-icon.png')
+        with open(path, 'rb') as f:
+            blob = f.read()
+        if request.param == 'path':
+            return path, blob, 'python-icon.png'
+        if request.param == 'bytes':
+            return blob, blob, None
+        if request.param == 'buffer':
+            return memoryview(bytearray(blob)), blob, None
+        stream = BytesIO(blob)
+        stream.seek(42)
+        return stream, blob, None
+
     @pytest.fixture(params=['foobar.png', None])
     def from_stream_fixture(
             self, request, stream_, blob_, _ImageHeaderFactory_,
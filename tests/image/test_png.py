@@ -334,14 +334,21 @@ class Describe_ChunkParser(object):
             offsets, chunk_lst
         )
 
-    @pytest.fixture
-    def iter_offsets_fixture(self):
-        bytes_ = b'-filler-\x00\x00\x00\x00IHDRxxxx\x00\x00\x00\x00IEND'
+    @pytest.fixture(params=[
+        (b'IEND', PNG_CHUNK_TYPE.IEND),
+        (b'IDAT', PNG_CHUNK_TYPE.IDAT),
+    ])
+    def iter_offsets_fixture(self, request):
+        last_chunk_type, expected_last_chunk_type = request.param
+        bytes_ = (
+            b'-filler-\x00\x00\x00\x00IHDRxxxx\x00\x00\x00\x00' +
+            last_chunk_type + b'xxxx\x00\x00\x00\x00IEND'
+        )
         stream_rdr = StreamReader(BytesIO(bytes_), BIG_ENDIAN)
         chunk_parser = _ChunkParser(stream_rdr)
         expected_chunk_offsets = [
             (PNG_CHUNK_TYPE.IHDR, 16),
-            (PNG_CHUNK_TYPE.IEND, 28),
+            (expected_last_chunk_type, 28),
         ]
         return chunk_parser, expected_chunk_offsets
 
@@ -0,0 +1,75 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.image.pool module
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import itertools
+
+import pytest
+
+from docx.compat import BytesIO
+from docx.image.pool import imap_ordered, load_images
+from docx.opc.constants import CONTENT_TYPE as CT
+
+from ..unitutil.file import test_file
+from ..unitutil.mock import var_mock
+
+
+class Describe_imap_ordered(object):
+
+    def it_generates_the_results_in_order(self):
+        results = imap_ordered(lambda n: n * n, range(20), max_workers=3)
+        assert list(results) == [n * n for n in range(20)]
+
+    def it_keeps_a_bounded_number_of_items_in_flight(self, request):
+        var_mock(request, 'docx.image.pool._IN_FLIGHT_PER_WORKER', new=2)
+        taken = []
+
+        def items():
+            for n in itertools.count():
+                taken.append(n)
+                yield n
+
+        results = imap_ordered(lambda n: n, items(), max_workers=3)
+
+        assert next(results) == 0
+        assert len(taken) == 6
+        assert next(results) == 1
+        assert len(taken) == 7
+        results.close()
+
+    def it_raises_the_error_of_an_item_when_reached(self):
+        def func(n):
+            if n == 1:
+                raise ValueError('bad item')
+            return n
+
+        results = imap_ordered(func, range(5), max_workers=2)
+
+        assert next(results) == 0
+        with pytest.raises(ValueError):
+            next(results)
+
+
+class Describe_load_images(object):
+
+    def it_loads_images_in_order_on_a_thread_pool(self):
+        paths = [test_file('python-icon.png'), test_file('sonic.gif')]
+        with open(paths[0], 'rb') as f:
+            blob = f.read()
+
+        images = list(load_images(paths + [BytesIO(blob)], max_workers=2))
+
+        assert [image.content_type for image in images] == [
+            CT.PNG, CT.GIF, CT.PNG
+        ]
+        assert images[2].sha1 == images[0].sha1
+
+    def it_raises_the_error_loading_an_image_when_reached(self):
+        images = load_images([test_file('sonic.gif'), 'no/such/file.png'])
+        assert next(images).content_type == CT.GIF
+        with pytest.raises(IOError):
+            next(images)
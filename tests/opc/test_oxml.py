@@ -4,17 +4,80 @@
 Test suite for opc.oxml module
 """
 
+import pytest
+
+from lxml import etree
+
+from docx.compat import BytesIO
 from docx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
 from docx.opc.oxml import (
-    CT_Default, CT_Override, CT_Relationship, CT_Relationships, CT_Types
+    CT_Default, CT_Override, CT_Relationship, CT_Relationships, CT_Types,
+    serialize_part_xml, stream_part_xml
 )
+from docx.oxml import parse_xml
 from docx.oxml.xmlchemy import serialize_for_reading
 
+from ..unitutil.cxml import element
 from .unitdata.rels import (
     a_Default, an_Override, a_Relationship, a_Relationships, a_Types
 )
 
 
+class Describe_stream_part_xml(object):
+
+    def it_can_write_a_part_element_to_a_stream(self):
+        document = element('w:document/w:body/(w:p/w:r/w:t"foo",w:sectPr)')
+        stream = BytesIO()
+
+        stream_part_xml(document, stream)
+
+        assert stream.getvalue() == serialize_part_xml(document)
+        assert len(document[0]) == 2
+
+    def it_writes_the_container_children_one_at_a_time(self):
+        document = element(
+            'w:document/(w:background,w:body/(w:p/w:r/w:t"foo",w:tbl,w:p))'
+        )
+        expected_c14n = etree.tostring(document, method='c14n')
+        body = document[1]
+        stream = BytesIO()
+
+        stream_part_xml(document, stream, body)
+
+        blob = stream.getvalue()
+        assert blob.startswith(b"<?xml version='1.0' encoding='UTF-8' stan")
+        assert etree.tostring(parse_xml(blob), method='c14n') == expected_c14n
+        assert etree.tostring(document, method='c14n') == expected_c14n
+
+    def it_does_not_repeat_namespace_declarations_on_each_child(self):
+        document = parse_xml(
+            '<w:document xmlns:w="%s" xmlns:r="%s" xmlns:x="urn:x"><w:body>'
+            '<w:p><w:r><w:t>foo</w:t></w:r></w:p><w:p x:a="1"/>'
+            '<w:p xmlns:x="urn:y" x:a="2"/></w:body></w:document>' % (
+                'http://schemas.openxmlformats.org/wordprocessingml/2006/'
+                'main',
+                'http://schemas.openxmlformats.org/officeDocument/2006/'
+                'relationships'
+            )
+        )
+        stream = BytesIO()
+
+        stream_part_xml(document, stream, document[0])
+
+        blob, expected_blob = stream.getvalue(), serialize_part_xml(document)
+        assert len(blob) == len(expected_blob)
+        assert blob.count(b'xmlns') == expected_blob.count(b'xmlns') == 4
+        assert (
+            etree.tostring(parse_xml(blob), method='c14n') ==
+            etree.tostring(document, method='c14n')
+        )
+
+    def it_raises_on_a_container_outside_the_part(self):
+        document = element('w:document/w:body')
+        with pytest.raises(ValueError):
+            stream_part_xml(document, BytesIO(), element('w:body'))
+
+
 class DescribeCT_Default(object):
 
     def it_provides_read_access_to_xml_values(self):
@@ -11,7 +11,7 @@ import pytest
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.opc.coreprops import CoreProperties
 from docx.opc.package import OpcPackage, Unmarshaller
-from docx.opc.packuri import PACKAGE_URI
+from docx.opc.packuri import PACKAGE_URI, PackURI
 from docx.opc.part import Part
 from docx.opc.parts.coreprops import CorePropertiesPart
 from docx.opc.pkgreader import PackageReader
@@ -33,11 +33,28 @@ class DescribeOpcPackage(object):
         # exercise ---------------------
         pkg = OpcPackage.open(pkg_file)
         # verify -----------------------
-        PackageReader_.from_file.assert_called_once_with(pkg_file)
+        PackageReader_.from_file.assert_called_once_with(pkg_file, False)
         Unmarshaller_.unmarshal.assert_called_once_with(pkg_reader, pkg,
                                                         PartFactory_)
         assert isinstance(pkg, OpcPackage)
 
+    def it_closes_the_package_file_of_a_lazy_open(
+            self, PackageReader_, PartFactory_, Unmarshaller_):
+        pkg_reader = PackageReader_.from_file.return_value
+
+        with OpcPackage.open('foo.docx', lazy=True) as pkg:
+            assert pkg_reader.close.call_count == 0
+        pkg.close()
+
+        pkg_reader.close.assert_called_once_with()
+
+    def it_has_nothing_to_close_when_not_opened_lazily(
+            self, PackageReader_, PartFactory_, Unmarshaller_):
+        pkg_reader = PackageReader_.from_file.return_value
+        with OpcPackage.open('foo.docx'):
+            pass
+        assert pkg_reader.close.call_count == 0
+
     def it_initializes_its_rels_collection_on_first_reference(
             self, Relationships_):
         pkg = OpcPackage()
@@ -96,6 +113,32 @@ class DescribeOpcPackage(object):
         assert part2 in pkg.iter_parts()
         assert len([p for p in pkg.iter_parts()]) == 2
 
+    def it_can_copy_itself(self):
+        # +----------+       +--------+       +--------+
+        # | pkg_rels |-----> | part_1 |-----> | part_2 |
+        # +----------+       +--------+       +--------+
+        #                        |
+        #                        v
+        #                     external
+        pkg = OpcPackage()
+        part_1 = Part(PackURI('/part1.xml'), 'ct1', b'blob1', pkg)
+        part_2 = Part(PackURI('/part2.xml'), 'ct2', b'blob2', pkg)
+        pkg.load_rel('reltype1', part_1, 'rId1')
+        part_1.load_rel('reltype2', part_2, 'rId1')
+        part_1.load_rel('reltype3', 'http://foo', 'rId2', True)
+
+        pkg_copy = pkg.copy()
+
+        part_1_copy = pkg_copy.part_related_by('reltype1')
+        part_2_copy = part_1_copy.part_related_by('reltype2')
+        assert type(pkg_copy) is OpcPackage
+        assert part_1_copy is not part_1
+        assert part_1_copy.package is pkg_copy
+        assert part_1_copy.partname == '/part1.xml'
+        assert part_2_copy.blob == b'blob2'
+        assert part_1_copy.target_ref('rId2') == 'http://foo'
+        assert part_1.rels['rId1'].target_part is part_2
+
     def it_can_find_a_part_related_by_reltype(self, related_part_fixture_):
         pkg, reltype, related_part_ = related_part_fixture_
         related_part = pkg.part_related_by(reltype)
@@ -108,10 +151,19 @@ class DescribeOpcPackage(object):
         pkg.save(pkg_file_)
         for part in parts_:
             part.before_marshal.assert_called_once_with()
+            assert part.materialize.call_count == 0
         PackageWriter_.write.assert_called_once_with(
-            pkg_file_, pkg._rels, parts_
+            pkg_file_, pkg._rels, parts_, False
         )
 
+    def it_reads_deferred_parts_before_saving_over_its_source(
+            self, pkg_file_, PackageWriter_, parts, parts_):
+        pkg = OpcPackage()
+        pkg._lazy_source = pkg_file_
+        pkg.save(pkg_file_)
+        for part in parts_:
+            part.materialize.assert_called_once_with()
+
     def it_provides_access_to_the_core_properties(self, core_props_fixture):
         opc_package, core_properties_ = core_props_fixture
         core_properties = opc_package.core_properties
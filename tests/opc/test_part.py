@@ -13,6 +13,7 @@ import pytest
 from docx.opc.package import OpcPackage
 from docx.opc.packuri import PackURI
 from docx.opc.part import Part, PartFactory, XmlPart
+from docx.opc.pkgreader import DeferredBlob
 from docx.opc.rel import _Relationship, Relationships
 from docx.oxml.xmlchemy import BaseOxmlElement
 
@@ -60,6 +61,41 @@ class DescribePart(object):
         part, load_blob = blob_fixture
         assert part.blob is load_blob
 
+    def it_reads_a_deferred_blob_on_first_access(self, request):
+        deferred_blob_ = instance_mock(request, DeferredBlob)
+        part = Part.load(None, None, deferred_blob_, None)
+
+        blob = part.blob
+
+        deferred_blob_.load.assert_called_once_with()
+        assert blob is deferred_blob_.load.return_value
+        assert part.blob is blob
+
+    def it_knows_the_blob_it_was_loaded_from(self, request):
+        deferred_blob_ = instance_mock(request, DeferredBlob)
+        part = Part.load(None, None, deferred_blob_, None)
+        part.blob
+        assert part.source_blob is deferred_blob_
+        part.materialize()
+        assert part.source_blob is None
+        assert Part(None, None, b'foo').source_blob is None
+
+    def it_can_copy_itself_to_another_package(self, request, package_):
+        part = Part.load(PackURI('/part.bin'), 'app/foo', b'foo', None)
+        part_copy = part.copy_to(package_)
+        assert type(part_copy) is Part
+        assert part_copy is not part
+        assert part_copy.partname == part.partname
+        assert part_copy.content_type == 'app/foo'
+        assert part_copy.blob == b'foo'
+        assert part_copy.package is package_
+
+    def it_can_write_its_blob_to_a_stream(self, blob_fixture):
+        part, load_blob = blob_fixture
+        stream = Mock(name='stream')
+        part.write_to(stream)
+        stream.write.assert_called_once_with(load_blob)
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -459,6 +495,47 @@ class DescribeXmlPart(object):
         xml_part = part_fixture
         assert xml_part.part is xml_part
 
+    def it_defers_parsing_when_loaded_from_a_deferred_blob(
+            self, request, parse_xml_, serialize_part_xml_, element_):
+        deferred_blob_ = instance_mock(request, DeferredBlob)
+        xml_part = XmlPart.load(None, None, deferred_blob_, None)
+        assert parse_xml_.call_count == 0
+
+        blob = xml_part.blob
+        assert blob is deferred_blob_.load.return_value
+        assert serialize_part_xml_.call_count == 0
+
+        assert xml_part.source_blob is deferred_blob_
+
+        element = xml_part.element
+        parse_xml_.assert_called_once_with(deferred_blob_.load.return_value)
+        assert element is element_
+        assert xml_part.element is element_
+        assert xml_part.source_blob is None
+
+    def it_can_copy_itself_to_another_package(self, package_):
+        p = element('w:p/w:r')
+        xml_part = XmlPart(PackURI('/part.xml'), 'app/foo', p, None)
+
+        xml_part_copy = xml_part.copy_to(package_)
+
+        assert type(xml_part_copy) is XmlPart
+        assert xml_part_copy.package is package_
+        assert xml_part_copy.partname == '/part.xml'
+        assert xml_part_copy.element is not p
+        assert xml_part_copy.element.xml == p.xml
+
+    def it_can_write_its_xml_to_a_stream(self, request, element_):
+        stream_part_xml_ = function_mock(
+            request, 'docx.opc.part.stream_part_xml'
+        )
+        xml_part = XmlPart(None, None, element_, None)
+        stream = Mock(name='stream')
+
+        xml_part.write_to(stream)
+
+        stream_part_xml_.assert_called_once_with(element_, stream)
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
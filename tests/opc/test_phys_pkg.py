@@ -13,8 +13,10 @@ except ImportError:
 
 import hashlib
 import pytest
+import zlib
 
-from zipfile import ZIP_DEFLATED, ZipFile
+from multiprocessing.pool import ThreadPool
+from zipfile import ZIP_BZIP2, ZIP_DEFLATED, ZipFile
 
 from docx.opc.exceptions import PackageNotFoundError
 from docx.opc.packuri import PACKAGE_URI, PackURI
@@ -23,7 +25,7 @@ from docx.opc.phys_pkg import (
 )
 
 from ..unitutil.file import absjoin, test_file_dir
-from ..unitutil.mock import class_mock, loose_mock, Mock
+from ..unitutil.mock import class_mock, loose_mock, Mock, var_mock
 
 
 test_docx_path = absjoin(test_file_dir, 'test.docx')
@@ -61,6 +63,16 @@ class DescribeDirPkgReader(object):
         rels_xml = dir_reader.rels_xml_for(partname)
         assert rels_xml is None
 
+    def it_can_open_the_file_for_a_pack_uri(self, dir_reader):
+        pack_uri = PackURI('/word/document.xml')
+        with dir_reader.open(pack_uri) as f:
+            blob = f.read()
+        assert blob == dir_reader.blob_for(pack_uri)
+
+    def it_has_no_compressed_blobs(self, dir_reader):
+        pack_uri = PackURI('/word/document.xml')
+        assert dir_reader.compressed_blob_for(pack_uri) is None
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -118,6 +130,54 @@ class DescribeZipPkgReader(object):
         sha1 = hashlib.sha1(rels_xml).hexdigest()
         assert sha1 == '90965123ed2c79af07a6963e7cfb50a6e2638565'
 
+    def it_can_open_the_member_for_a_pack_uri(self, phys_reader):
+        pack_uri = PackURI('/word/document.xml')
+        with phys_reader.open(pack_uri) as f:
+            blob = f.read()
+        assert blob == phys_reader.blob_for(pack_uri)
+
+    def it_can_retrieve_the_compressed_blob_for_a_pack_uri(
+            self, phys_reader):
+        pack_uri = PackURI('/word/document.xml')
+        zinfo, compressed = phys_reader.compressed_blob_for(pack_uri)
+        assert zinfo.filename == 'word/document.xml'
+        assert zinfo.compress_type == ZIP_DEFLATED
+        assert len(compressed) == zinfo.compress_size
+        assert zlib.decompress(compressed, -15) == (
+            phys_reader.blob_for(pack_uri)
+        )
+
+    def it_can_be_read_from_several_threads_at_once(self, phys_reader):
+        pack_uris = [
+            PackURI('/word/document.xml'), PackURI('/word/styles.xml')
+        ]
+        expected = [phys_reader.compressed_blob_for(u) for u in pack_uris]
+
+        def read(n):
+            pack_uri = pack_uris[n % 2]
+            if n % 3:
+                return phys_reader.compressed_blob_for(pack_uri)
+            return phys_reader.blob_for(pack_uri)
+
+        pool = ThreadPool(4)
+        try:
+            results = pool.map(read, range(60))
+        finally:
+            pool.terminate()
+
+        for n, result in enumerate(results):
+            pack_uri = pack_uris[n % 2]
+            if n % 3:
+                assert result == expected[n % 2]
+            else:
+                assert result == phys_reader.blob_for(pack_uri)
+
+    def it_closes_the_file_it_opened(self):
+        phys_reader = _ZipPkgReader(zip_pkg_path)
+        fp = phys_reader._fp
+        phys_reader.close()
+        assert fp.closed
+
     def it_returns_none_when_part_has_no_rels_xml(self, phys_reader):
         partname = PackURI('/ppt/viewProps.xml')
         rels_xml = phys_reader.rels_xml_for(partname)
@@ -142,21 +202,21 @@ class DescribeZipPkgWriter(object):
         phys_writer = PhysPkgWriter(tmp_docx_path)
         assert isinstance(phys_writer, _ZipPkgWriter)
 
-    def it_opens_pkg_file_zip_on_construction(self, ZipFile_):
-        pkg_file = Mock(name='pkg_file')
-        _ZipPkgWriter(pkg_file)
-        ZipFile_.assert_called_once_with(
-            pkg_file, 'w', compression=ZIP_DEFLATED
-        )
+    def it_writes_the_central_directory_when_closed(self, pkg_file):
+        pkg_writer = PhysPkgWriter(pkg_file)
+        pkg_writer.close()
+        assert not pkg_file.closed
+        assert ZipFile(pkg_file, 'r').namelist() == []
 
-    def it_can_be_closed(self, ZipFile_):
-        # mockery ----------------------
-        zipf = ZipFile_.return_value
-        zip_pkg_writer = _ZipPkgWriter(None)
-        # exercise ---------------------
-        zip_pkg_writer.close()
-        # verify -----------------------
-        zipf.close.assert_called_once_with()
+    def it_can_write_a_package_at_a_path(self, tmp_docx_path):
+        pkg_writer = PhysPkgWriter(tmp_docx_path)
+        pkg_writer.write(PackURI('/part/name.xml'), b'<Blob/>')
+        pkg_writer.close()
+
+        zipf = ZipFile(tmp_docx_path, 'r')
+        assert zipf.testzip() is None
+        assert zipf.read('part/name.xml') == b'<Blob/>'
+        zipf.close()
 
     def it_can_write_a_blob(self, pkg_file):
         # setup ------------------------
@@ -174,6 +234,99 @@ class DescribeZipPkgWriter(object):
         retrieved_blob_sha1 = hashlib.sha1(retrieved_blob).hexdigest()
         assert retrieved_blob_sha1 == written_blob_sha1
 
+    def it_can_copy_a_compressed_member(self, pkg_file):
+        pack_uri = PackURI('/word/document.xml')
+        phys_reader = PhysPkgReader(zip_pkg_path)
+        zinfo, compressed = phys_reader.compressed_blob_for(pack_uri)
+
+        pkg_writer = PhysPkgWriter(pkg_file)
+        pkg_writer.write(PackURI('/first.xml'), b'<First/>')
+        pkg_writer.write_compressed(
+            PackURI('/word/copy.xml'), zinfo, compressed
+        )
+        pkg_writer.write(PackURI('/last.xml'), b'<Last/>')
+        pkg_writer.close()
+
+        zipf = ZipFile(pkg_file, 'r')
+        assert zipf.testzip() is None
+        assert zipf.read('word/copy.xml') == phys_reader.blob_for(pack_uri)
+        assert zipf.read('last.xml') == b'<Last/>'
+        assert zipf.getinfo('word/copy.xml').compress_size == len(compressed)
+        zipf.close()
+        phys_reader.close()
+
+    def it_copies_the_version_needed_by_a_member(self, pkg_file):
+        src_file = BytesIO()
+        with ZipFile(src_file, 'w', ZIP_BZIP2) as zipf:
+            zipf.writestr('bzip2.xml', b'<Bzip2/>')
+        phys_reader = PhysPkgReader(src_file)
+        pack_uri = PackURI('/bzip2.xml')
+        zinfo, compressed = phys_reader.compressed_blob_for(pack_uri)
+
+        pkg_writer = PhysPkgWriter(pkg_file)
+        pkg_writer.write_compressed(pack_uri, zinfo, compressed)
+        pkg_writer.close()
+
+        zipf = ZipFile(pkg_file, 'r')
+        assert zipf.getinfo('bzip2.xml').extract_version == 46
+        assert zipf.read('bzip2.xml') == b'<Bzip2/>'
+
+    def it_uses_ZIP64_where_needed(self, request, pkg_file):
+        var_mock(request, 'docx.opc.phys_pkg.ZIP64_LIMIT', new=64)
+        var_mock(request, 'docx.opc.phys_pkg._FILECOUNT_LIMIT', new=3)
+        big_blob = bytes(bytearray(range(256))) * 2
+        phys_reader = PhysPkgReader(zip_pkg_path)
+        pack_uri = PackURI('/word/document.xml')
+        zinfo, compressed = phys_reader.compressed_blob_for(pack_uri)
+
+        pkg_writer = PhysPkgWriter(pkg_file)
+        pkg_writer.write(PackURI('/big.bin'), big_blob)
+        pkg_writer.write_compressed(pack_uri, zinfo, compressed)
+        with pkg_writer.open(PackURI('/small.xml')) as stream:
+            stream.write(b'<Small/>')
+        pkg_writer.close()
+
+        blob = pkg_file.getvalue()
+        assert blob.count(b'PK\x06\x06') == 1
+        zipf = ZipFile(pkg_file, 'r')
+        assert zipf.testzip() is None
+        assert zipf.read('big.bin') == big_blob
+        assert zipf.read('word/document.xml') == phys_reader.blob_for(pack_uri)
+        assert zipf.read('small.xml') == b'<Small/>'
+        assert [i.extract_version for i in zipf.infolist()] == [45, 45, 45]
+        phys_reader.close()
+
+    def it_can_open_a_member_stream(self, pkg_file):
+        pack_uri = PackURI('/part/name.xml')
+        pkg_writer = PhysPkgWriter(pkg_file)
+
+        stream = pkg_writer.open(pack_uri)
+        stream.write(b'<Blobbity')
+        stream.write(b'FooBlob/>')
+        stream.close()
+        pkg_writer.close()
+
+        zipf = ZipFile(pkg_file, 'r')
+        retrieved_blob = zipf.read(pack_uri.membername)
+        zipf.close()
+        assert retrieved_blob == b'<BlobbityFooBlob/>'
+
+    def it_can_write_to_a_stream_it_cannot_seek(self):
+        chunks = []
+        pkg_file = Mock(name='pkg_file', spec=['write'])
+        pkg_file.write.side_effect = chunks.append
+        pkg_writer = PhysPkgWriter(pkg_file)
+
+        pkg_writer.write(PackURI('/first.xml'), b'<First/>')
+        with pkg_writer.open(PackURI('/second.xml')) as stream:
+            stream.write(b'<Second/>')
+        pkg_writer.close()
+
+        zipf = ZipFile(BytesIO(b''.join(chunks)), 'r')
+        assert zipf.testzip() is None
+        assert zipf.read('first.xml') == b'<First/>'
+        assert zipf.read('second.xml') == b'<Second/>'
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
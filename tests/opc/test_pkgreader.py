@@ -8,23 +8,29 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 import pytest
 
+from zipfile import ZipFile
+
 from docx.opc.constants import (
     CONTENT_TYPE as CT, RELATIONSHIP_TARGET_MODE as RTM
 )
 from docx.opc.packuri import PackURI
 from docx.opc.phys_pkg import _ZipPkgReader
 from docx.opc.pkgreader import (
-    _ContentTypeMap, PackageReader, _SerializedPart, _SerializedRelationship,
-    _SerializedRelationships
+    _ContentTypeMap, DeferredBlob, PackageReader, _SerializedPart,
+    _SerializedRelationship, _SerializedRelationships
 )
 
 from .unitdata.types import a_Default, a_Types, an_Override
+from ..unitutil.file import absjoin, test_file_dir
 from ..unitutil.mock import (
     call, class_mock, function_mock, initializer_mock, instance_mock,
     loose_mock, method_mock, Mock, patch
 )
 
 
+test_docx_path = absjoin(test_file_dir, 'test.docx')
+
+
 class DescribePackageReader(object):
 
     def it_can_construct_from_pkg_file(
@@ -43,11 +49,29 @@ class DescribePackageReader(object):
         from_xml.assert_called_once_with(phys_reader.content_types_xml)
         _srels_for.assert_called_once_with(phys_reader, '/')
         _load_serialized_parts.assert_called_once_with(phys_reader, pkg_srels,
-                                                       content_types)
+                                                       content_types, False)
         phys_reader.close.assert_called_once_with()
-        init.assert_called_once_with(content_types, pkg_srels, sparts)
+        init.assert_called_once_with(content_types, pkg_srels, sparts, None)
         assert isinstance(pkg_reader, PackageReader)
 
+    def it_can_defer_reading_part_blobs(self):
+        pkg_reader = PackageReader.from_file(test_docx_path, lazy=True)
+        for partname, content_type, reltype, blob in pkg_reader.iter_sparts():
+            assert isinstance(blob, DeferredBlob)
+        zipf = ZipFile(test_docx_path)
+        assert blob.load() == zipf.read(partname.membername)
+        zipf.close()
+
+    def it_closes_the_package_file_of_a_lazy_load(self):
+        pkg_reader = PackageReader.from_file(test_docx_path, lazy=True)
+        blob = list(pkg_reader.iter_sparts())[0][3]
+
+        pkg_reader.close()
+        pkg_reader.close()
+
+        with pytest.raises(ValueError):
+            blob.load()
+
     def it_can_iterate_over_the_serialized_parts(self, iter_sparts_fixture):
         pkg_reader, expected_iter_spart_items = iter_sparts_fixture
         iter_spart_items = list(pkg_reader.iter_sparts())
@@ -105,6 +129,24 @@ class DescribePackageReader(object):
         assert _SerializedPart_.call_args_list == expected_calls
         assert retval == expected_sparts
 
+    def it_defers_part_blobs_when_walking_lazily(self, _srels_for):
+        srel = Mock(name='rId1', is_external=False, reltype='reltype1',
+                    target_partname='/part/name1.xml')
+        phys_reader = Mock(name='phys_reader')
+        _srels_for.return_value = []
+
+        generated_tuples = list(
+            PackageReader._walk_phys_parts(phys_reader, [srel], lazy=True)
+        )
+
+        (partname, blob, reltype, srels), = generated_tuples
+        assert isinstance(blob, DeferredBlob)
+        assert phys_reader.blob_for.call_count == 0
+        assert blob.load() is phys_reader.blob_for.return_value
+        phys_reader.blob_for.assert_called_once_with('/part/name1.xml')
+        assert blob.open() is phys_reader.open.return_value
+        phys_reader.open.assert_called_once_with('/part/name1.xml')
+
     def it_can_walk_phys_pkg_parts(self, _srels_for):
         # test data --------------------
         # +----------+       +--------+
@@ -155,6 +197,24 @@ class DescribePackageReader(object):
         ]
         assert generated_tuples == expected_tuples
 
+    def it_finds_the_partname_a_source_is_related_to(self, _srels_for):
+        phys_reader, source_uri = Mock(name='phys_reader'), Mock(name='uri')
+        _srels_for.return_value = [
+            Mock(reltype='foo', is_external=False, target_partname='/a'),
+            Mock(reltype='bar', is_external=True, target_partname='/b'),
+            Mock(reltype='bar', is_external=False, target_partname='/c'),
+        ]
+
+        partname = PackageReader.partname_related_by(
+            phys_reader, source_uri, 'bar'
+        )
+
+        _srels_for.assert_called_once_with(phys_reader, source_uri)
+        assert partname == '/c'
+        assert PackageReader.partname_related_by(
+            phys_reader, source_uri, 'baz'
+        ) is None
+
     def it_can_retrieve_srels_for_a_source_uri(
             self, _SerializedRelationships_):
         # mockery ----------------------
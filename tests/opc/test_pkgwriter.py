@@ -32,7 +32,7 @@ class DescribePackageWriter(object):
         expected_calls = [
             call._write_content_types_stream(phys_writer, parts),
             call._write_pkg_rels(phys_writer, pkg_rels),
-            call._write_parts(phys_writer, parts),
+            call._write_parts(phys_writer, parts, False),
         ]
         PhysPkgWriter_.assert_called_once_with(pkg_file)
         assert _write_methods.mock_calls == expected_calls
@@ -63,8 +63,8 @@ class DescribePackageWriter(object):
         phys_writer = Mock(name='phys_writer')
         rels = MagicMock(name='rels')
         rels.__len__.return_value = 1
-        part1 = Mock(name='part1', _rels=rels)
-        part2 = Mock(name='part2', _rels=[])
+        part1 = Mock(name='part1', _rels=rels, source_blob=None)
+        part2 = Mock(name='part2', _rels=[], source_blob=None)
         # exercise ---------------------
         PackageWriter._write_parts(phys_writer, [part1, part2])
         # verify -----------------------
@@ -75,6 +75,47 @@ class DescribePackageWriter(object):
         ]
         assert phys_writer.write.mock_calls == expected_calls
 
+    def it_can_stream_a_list_of_parts(self):
+        phys_writer = Mock(name='phys_writer')
+        stream = phys_writer.open.return_value
+        part1 = Mock(name='part1', _rels=[], source_blob=None)
+        part2 = Mock(name='part2', _rels=[], source_blob=None)
+
+        PackageWriter._write_parts(phys_writer, [part1, part2], True)
+
+        assert phys_writer.open.call_args_list == [
+            call(part1.partname), call(part2.partname)
+        ]
+        part1.write_to.assert_called_once_with(stream)
+        part2.write_to.assert_called_once_with(stream)
+        assert stream.close.call_count == 2
+        assert phys_writer.write.mock_calls == []
+
+    def it_copies_unchanged_parts_without_recompressing(self):
+        phys_writer = Mock(name='phys_writer')
+        source_blob = Mock(name='source_blob')
+        zinfo, compressed_blob = 'zinfo', b'compressed'
+        source_blob.load_compressed.return_value = (zinfo, compressed_blob)
+        part = Mock(name='part', _rels=[], source_blob=source_blob)
+
+        PackageWriter._write_parts(phys_writer, [part])
+
+        phys_writer.write_compressed.assert_called_once_with(
+            part.partname, zinfo, compressed_blob
+        )
+        assert phys_writer.write.mock_calls == []
+
+    def it_writes_an_unchanged_part_it_cannot_copy(self):
+        phys_writer = Mock(name='phys_writer')
+        source_blob = Mock(name='source_blob')
+        source_blob.load_compressed.return_value = None
+        part = Mock(name='part', _rels=[], source_blob=source_blob)
+
+        PackageWriter._write_parts(phys_writer, [part])
+
+        phys_writer.write.assert_called_once_with(part.partname, part.blob)
+        assert phys_writer.write_compressed.mock_calls == []
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
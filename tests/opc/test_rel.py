@@ -138,6 +138,22 @@ class DescribeRelationships(object):
         next_rId = rels._next_rId
         assert next_rId == expected_next_rId
 
+    def it_reuses_the_rId_of_a_deleted_relationship(self, rels_with_rId_gap):
+        rels, _ = rels_with_rId_gap
+        del rels['rId1']
+        assert rels._next_rId == 'rId1'
+
+    def it_keeps_its_lookup_indexes_current(self, reltype, url):
+        rels = Relationships(None)
+        rId = rels.get_or_add_ext_rel(reltype, url)
+        assert rels._get_matching(reltype, url, is_external=True) is rels[rId]
+
+        del rels[rId]
+
+        assert rels._get_matching(reltype, url, is_external=True) is None
+        with pytest.raises(KeyError):
+            rels._get_rel_of_type(reltype)
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
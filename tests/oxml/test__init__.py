@@ -10,11 +10,17 @@ import pytest
 
 from lxml import etree
 
+import docx.oxml
+
+from docx.compat import BytesIO
 from docx.oxml import (
-    OxmlElement, oxml_parser, parse_xml, register_element_cls
+    OxmlElement, iterparse_xml, oxml_parser, parse_xml, register_element_cls
 )
-from docx.oxml.ns import qn
+from docx.oxml.ns import nsdecls, qn
 from docx.oxml.shared import BaseOxmlElement
+from docx.oxml.text.paragraph import CT_P
+
+from ..unitutil.mock import function_mock, var_mock
 
 
 class DescribeOxmlElement(object):
@@ -87,6 +93,28 @@ class DescribeParseXml(object):
         element = parse_xml(xml_bytes)
         assert isinstance(element, CustElmCls)
 
+    def it_registers_the_custom_element_classes_on_first_use(
+            self, registration_fixture):
+        _register_custom_element_classes_ = registration_fixture
+        parse_xml('<w:p %s/>' % nsdecls('w'))
+        parse_xml('<w:p %s/>' % nsdecls('w'))
+        OxmlElement('w:p')
+        _register_custom_element_classes_.assert_called_once_with()
+        assert docx.oxml._element_classes_registered is True
+
+    def it_produces_the_custom_element_class_for_a_known_tag(self):
+        p = parse_xml('<w:p %s/>' % nsdecls('w'))
+        assert type(p) is CT_P
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def registration_fixture(self, request):
+        var_mock(request, 'docx.oxml._element_classes_registered', new=False)
+        return function_mock(
+            request, 'docx.oxml._register_custom_element_classes'
+        )
+
     # fixture components ---------------------------------------------
 
     @pytest.fixture
@@ -99,6 +127,25 @@ class DescribeParseXml(object):
         ).encode('utf-8')
 
 
+class DescribeIterparseXml(object):
+
+    def it_generates_custom_elements_as_they_are_parsed(self):
+        stream = BytesIO((
+            '<w:body %s>\n  <w:p><w:r/></w:p>\n  <w:p/>\n</w:body>' %
+            nsdecls('w')
+        ).encode('utf-8'))
+
+        events = list(iterparse_xml(stream, tag=qn('w:p')))
+
+        assert [event for event, elm in events] == ['end', 'end']
+        assert all(type(elm) is CT_P for event, elm in events)
+        body = events[0][1].getparent()
+        assert body.xml == (
+            '<w:body %s>\n  <w:p>\n    <w:r/>\n  </w:p>\n  <w:p/>\n</w:bo'
+            'dy>\n' % nsdecls('w')
+        )
+
+
 class DescribeRegisterElementCls(object):
 
     def it_determines_class_used_for_elements_with_matching_tagname(
@@ -0,0 +1,38 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.oxml.document module.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import pytest
+
+from ..unitutil.cxml import element, xml
+
+
+class DescribeCT_Body(object):
+
+    def it_inserts_a_block_item_before_the_sentinel_sectPr(
+            self, insert_fixture):
+        body, add_method, expected_xml = insert_fixture
+        block_item = getattr(body, add_method)()
+        assert body.xml == expected_xml
+        assert block_item.getparent() is body
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ('w:body', 'add_p', 'w:body/w:p'),
+        ('w:body/w:p', 'add_tbl', 'w:body/(w:p,w:tbl)'),
+        ('w:body/(w:p,w:sectPr)', 'add_p', 'w:body/(w:p,w:p,w:sectPr)'),
+        ('w:body/(w:tbl,w:sectPr)', 'add_tbl',
+         'w:body/(w:tbl,w:tbl,w:sectPr)'),
+        ('w:body/(w:p,w:sectPr,w:p)', 'add_p',
+         'w:body/(w:p,w:p,w:sectPr,w:p)'),
+    ])
+    def insert_fixture(self, request):
+        body_cxml, add_method, expected_cxml = request.param
+        return element(body_cxml), add_method, xml(expected_cxml)
@@ -11,6 +11,8 @@ from __future__ import (
 import pytest
 
 from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
 
 from ..unitutil.cxml import element, xml
 
@@ -23,6 +25,18 @@ class DescribeCT_Styles(object):
         assert styles.xml == expected_xml
         assert style is styles[-1]
 
+    def it_can_get_a_style_by_id_or_by_name(self):
+        styles = parse_xml(
+            '<w:styles %s><w:style w:styleId="Foo"><w:name w:val="Say &quot;'
+            'hi&quot;"/></w:style><w:style w:styleId="Bar"/></w:styles>' %
+            nsdecls('w')
+        )
+        foo, bar = styles
+        assert styles.get_by_id('Bar') is bar
+        assert styles.get_by_id('Baz') is None
+        assert styles.get_by_name('Say "hi"') is foo
+        assert styles.get_by_name('Foo') is None
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture(params=[
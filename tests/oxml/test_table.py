@@ -12,7 +12,8 @@ import pytest
 
 from docx.exceptions import InvalidSpanError
 from docx.oxml import parse_xml
-from docx.oxml.table import CT_Row, CT_Tc
+from docx.oxml.table import CT_Row, CT_Tbl, CT_Tc
+from docx.shared import Inches
 
 from ..unitutil.cxml import element, xml
 from ..unitutil.file import snippet_seq
@@ -53,6 +54,43 @@ class DescribeCT_Row(object):
         return tr, col_idx
 
 
+class DescribeCT_Tbl(object):
+
+    def it_can_create_a_table_from_rows(self, from_rows_fixture):
+        rows, header, expected_p_xmls = from_rows_fixture
+        tbl = CT_Tbl.new_tbl_from_rows(rows, Inches(2), header)
+        p_xmls = [[tc.p_lst[0].xml for tc in tr.tc_lst] for tr in tbl.tr_lst]
+        assert p_xmls == expected_p_xmls
+        assert tbl.col_count == len(expected_p_xmls[0])
+        assert all(tc.width == Inches(1) for tc in tbl.iter_tcs())
+
+    def it_marks_the_header_row_to_repeat(self):
+        tbl = CT_Tbl.new_tbl_from_rows([('1', '2')], Inches(2), ('a', 'b'))
+        header_tr, tr = tbl.tr_lst
+        assert header_tr.xpath('./w:trPr/w:tblHeader')
+        assert tr.trPr is None
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ([('foo', 'bar')], None,
+         [['w:p/w:r/w:t"foo"', 'w:p/w:r/w:t"bar"']]),
+        ([(None, '')], ('a', 7),
+         [['w:p/w:r/w:t"a"', 'w:p/w:r/w:t"7"'], ['w:p', 'w:p']]),
+        ([('a\tb', 'c\nd')], None,
+         [['w:p/w:r/(w:t"a",w:tab,w:t"b")',
+           'w:p/w:r/(w:t"c",w:br,w:t"d")']]),
+        ([(' x ', '<&>')], None,
+         [['w:p/w:r/w:t{xml:space=preserve}" x "', 'w:p/w:r/w:t"&lt;&amp;&gt;"']]),
+        ([('a',), ('b', 'c')], None,
+         [['w:p/w:r/w:t"a"', 'w:p'], ['w:p/w:r/w:t"b"', 'w:p/w:r/w:t"c"']]),
+    ])
+    def from_rows_fixture(self, request):
+        rows, header, p_cxmls = request.param
+        expected_p_xmls = [[xml(cxml) for cxml in tr] for tr in p_cxmls]
+        return rows, header, expected_p_xmls
+
+
 class DescribeCT_Tc(object):
 
     def it_can_merge_to_another_tc(self, merge_fixture):
@@ -8,6 +8,9 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 import pytest
 
+from collections import OrderedDict
+from lxml import etree
+
 from docx.compat import Unicode
 from docx.oxml import parse_xml, register_element_cls
 from docx.oxml.exceptions import InvalidXmlError
@@ -16,10 +19,11 @@ from docx.oxml.simpletypes import BaseIntType
 from docx.oxml.xmlchemy import (
     BaseOxmlElement, Choice, serialize_for_reading, OneOrMore, OneAndOnlyOne,
     OptionalAttribute, RequiredAttribute, ZeroOrMore, ZeroOrOne,
-    ZeroOrOneChoice, XmlString
+    ZeroOrOneChoice, XmlString, _compiled_xpath
 )
 
 from ..unitdata import BaseBuilder
+from ..unitutil.mock import var_mock
 from .unitdata.text import a_b, a_u, an_i, an_rPr
 
 
@@ -42,6 +46,29 @@ class DescribeBaseOxmlElement(object):
         element.remove_all(*tagnames)
         assert element.xml == expected_xml
 
+    def it_can_evaluate_an_xpath_expression_with_variables(self):
+        element = self.rPr_bldr('biu').element
+        found = element.xpath('*[local-name() = $name]', name='i')
+        assert found == [element.find(qn('w:i'))]
+        assert element.xpath('count(w:b) + $n', n=1) == 2.0
+
+    def it_reuses_the_compiled_form_of_an_xpath_expression(self):
+        xpath_str = 'w:b | w:u'
+        xpath = _compiled_xpath(xpath_str)
+        assert isinstance(xpath, etree.XPath)
+        assert _compiled_xpath(xpath_str) is xpath
+
+    def it_evicts_the_oldest_xpath_expression_when_full(self, request):
+        var_mock(request, 'docx.oxml.xmlchemy._XPATH_CACHE_SIZE', new=2)
+        var_mock(request, 'docx.oxml.xmlchemy._xpath_cache', new=OrderedDict())
+        first, second = _compiled_xpath('w:i'), _compiled_xpath('w:u')
+
+        third = _compiled_xpath('w:i | w:u')
+
+        assert _compiled_xpath('w:i | w:u') is third
+        assert _compiled_xpath('w:u') is second
+        assert _compiled_xpath('w:i') is not first
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture(params=[
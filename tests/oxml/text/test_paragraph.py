@@ -0,0 +1,60 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.oxml.text.paragraph module.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import re
+
+import pytest
+
+from ...unitutil.cxml import element, xml
+
+
+class DescribeCT_P(object):
+
+    def it_can_isolate_matches_in_a_t_of_their_own(self, isolate_fixture):
+        p, regex, expected_xml, expected_texts = isolate_fixture
+
+        isolated = p.isolate_matches(regex)
+
+        assert p.xml == expected_xml
+        assert [t.text for match, t in isolated] == expected_texts
+        assert [m.group(0) for m, t in isolated] == expected_texts
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ('w:p/w:r/w:t"foo"', 'w:p/w:r/w:t"foo"', []),
+        ('w:p/w:r/w:t"{x}"',
+         'w:p/w:r/w:t{xml:space=preserve}"{x}"', ['{x}']),
+        ('w:p/w:r/w:t"a{x}b{y}c"',
+         'w:p/w:r/(w:t"a",w:t{xml:space=preserve}"{x}",w:t"b",'
+         'w:t{xml:space=preserve}"{y}",w:t"c")', ['{x}', '{y}']),
+        ('w:p/(w:r/(w:rPr/w:b,w:t"a{"),w:r/w:t"x",w:r/w:t"}b")',
+         'w:p/(w:r/(w:rPr/w:b,w:t"a",w:t{xml:space=preserve}"{x}"),w:r/w:t'
+         '"b")', ['{x}']),
+        ('w:p/(w:r/w:t"{x",w:r/(w:rPr/w:i,w:t"}"),w:r/w:t"{y}")',
+         'w:p/(w:r/w:t{xml:space=preserve}"{x}",w:r/w:t{xml:space=preserve'
+         '}"{y}")', ['{x}', '{y}']),
+        ('w:p/w:r/(w:t"{x",w:tab,w:t"}")',
+         'w:p/w:r/(w:t"{x",w:tab,w:t"}")', []),
+        ('w:p/(w:r/w:t"{",w:hyperlink/(w:r/w:t"x",w:r/w:t"}"))',
+         'w:p/(w:r/w:t{xml:space=preserve}"{x}",w:hyperlink)', ['{x}']),
+        ('w:p/(w:ins/w:r/w:t"a{x}",w:smartTag/w:r/w:t"{y}")',
+         'w:p/(w:ins/w:r/(w:t"a",w:t{xml:space=preserve}"{x}"),w:smartTag'
+         '/w:r/w:t{xml:space=preserve}"{y}")', ['{x}', '{y}']),
+        ('w:p/(w:r/w:t"{",w:del/w:r/w:delText"z",w:r/w:t"x}")',
+         'w:p/(w:r/w:t{xml:space=preserve}"{x}",w:del/w:r/w:delText"z")',
+         ['{x}']),
+    ])
+    def isolate_fixture(self, request):
+        p_cxml, expected_cxml, expected_texts = request.param
+        p = element(p_cxml)
+        regex = re.compile(r'\{\w+\}')
+        expected_xml = xml(expected_cxml)
+        return p, regex, expected_xml, expected_texts
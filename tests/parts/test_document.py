@@ -8,9 +8,16 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 import pytest
 
+from copy import deepcopy
+
+from lxml import etree
+
+from docx.api import Document
+from docx.compat import BytesIO
 from docx.image.image import Image
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.opc.coreprops import CoreProperties
+from docx.oxml import parse_xml
 from docx.package import Package
 from docx.parts.document import DocumentPart
 from docx.parts.image import ImagePart
@@ -24,7 +31,8 @@ from docx.text.paragraph import Paragraph
 
 from ..oxml.parts.unitdata.document import a_body, a_document
 from ..oxml.unitdata.text import a_p
-from ..unitutil.file import snippet_text
+from ..unitutil.cxml import element
+from ..unitutil.file import docx_path, snippet_text, test_file
 from ..unitutil.mock import (
     instance_mock, class_mock, method_mock, property_mock
 )
@@ -35,7 +43,26 @@ class DescribeDocumentPart(object):
     def it_can_save_the_package_to_a_file(self, save_fixture):
         document, file_ = save_fixture
         document.save(file_)
-        document._package.save.assert_called_once_with(file_)
+        document._package.save.assert_called_once_with(file_, False)
+
+    def it_can_stream_its_xml_block_by_block(self):
+        document_elm = element('w:document/w:body/(w:p,w:tbl,w:sectPr)')
+        document_part = DocumentPart(None, None, document_elm, None)
+        stream = BytesIO()
+
+        document_part.write_to(stream)
+
+        blob = stream.getvalue()
+        assert etree.tostring(parse_xml(blob), method='c14n') == (
+            etree.tostring(
+                element('w:document/w:body/(w:p,w:tbl,w:sectPr)'),
+                method='c14n'
+            )
+        )
+        assert len(document_elm.body) == 3
+        second_stream = BytesIO()
+        document_part.write_to(second_stream)
+        assert second_stream.getvalue() == blob
 
     def it_can_get_or_add_an_image(self, get_image_fixture):
         document_part, path, image_part_, rId_, image_ = get_image_fixture
@@ -88,6 +115,70 @@ class DescribeDocumentPart(object):
         document, expected_id = next_id_fixture
         assert document.next_id == expected_id
 
+    def it_tracks_ids_reserved_and_released(self, next_id_fixture):
+        document, expected_id = next_id_fixture
+        assert document.next_id == expected_id
+        next_id = document.next_id
+        assert next_id > expected_id
+        document.reserve_id(next_id + 1)
+        assert document.next_id > next_id + 1
+        document.release_id(expected_id)
+        assert document.next_id == expected_id
+
+    def it_reserves_the_id_it_returns(self, next_id_fixture):
+        document, expected_id = next_id_fixture
+        p = a_p().with_nsdecls().element
+        p.set('id', str(document.next_id))
+        document.element.append(p)
+
+        next_id = document.next_id
+
+        assert next_id != expected_id
+        assert str(next_id) not in document.element.xpath('//@id')
+
+    def it_scans_the_document_for_ids_only_once(self, next_id_fixture):
+        document, expected_id = next_id_fixture
+        document.next_id
+        p = a_p().with_nsdecls().element
+        p.set('id', '999')
+        document.element.append(p)
+        document.next_id
+        assert 999 not in document._ids_in_use
+
+    def it_reuses_the_id_of_a_picture_cleared_from_the_document(self):
+        document = Document(docx_path('test'))
+        document.add_picture(test_file('monty-truth.png'))
+        picture_id = document.inline_shapes[0]._inline.docPr.id
+        document.paragraphs[-1].clear()
+
+        shape = document.add_picture(test_file('monty-truth.png'))
+
+        assert shape._inline.docPr.id == picture_id
+
+    def it_scans_the_document_again_when_asked(self, next_id_fixture):
+        document, expected_id = next_id_fixture
+        document.next_id
+        p = a_p().with_nsdecls().element
+        p.set('id', str(expected_id))
+        document.element.append(p)
+        document.rescan_ids()
+        assert document.next_id != expected_id
+
+    def it_gives_a_new_picture_an_id_of_its_own_after_copies(self):
+        document = Document(docx_path('test'))
+        document.add_picture(test_file('monty-truth.png'))
+        picture_p = document.paragraphs[-1]._p
+        picture_p.addnext(deepcopy(picture_p))
+        other = Document(docx_path('having-images'))
+        for inline in other.element.body.xpath('.//wp:inline'):
+            document.paragraphs[0]._p.append(deepcopy(inline.getparent()))
+        document.part.rescan_ids()
+
+        shape = document.add_picture(test_file('monty-truth.png'))
+
+        ids = document.element.body.xpath('.//wp:docPr/@id')
+        assert ids.count(str(shape._inline.docPr.id)) == 1
+
     def it_can_create_a_new_pic_inline(self, new_pic_fixture):
         document_part, path, width, height = new_pic_fixture[:4]
         image_, expected_xml = new_pic_fixture[4:]
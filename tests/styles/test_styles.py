@@ -28,6 +28,31 @@ class DescribeStyles(object):
         styles, name, expected_value = in_fixture
         assert (name in styles) is expected_value
 
+    def it_keeps_its_style_index_current(self):
+        styles = Styles(element(
+            'w:styles/('
+            'w:style{w:type=paragraph,w:styleId=Foo}/w:name{w:val=Foo},'
+            'w:style{w:type=paragraph,w:default=1,w:styleId=Normal})'
+        ))
+        index = styles._index
+        assert Styles(styles.element)._index is index
+        assert 'Foo' in styles
+
+        styles.add_style('Bar', WD_STYLE_TYPE.PARAGRAPH)
+        assert 'Bar' in styles
+
+        foo = styles['Foo']
+        foo.name = 'Baz'
+        assert 'Foo' not in styles
+        assert styles['Baz'] == foo
+
+        foo.style_id = 'Baz'
+        assert styles.get_by_id('Baz', WD_STYLE_TYPE.PARAGRAPH) == foo
+
+        styles['Bar'].delete()
+        assert 'Bar' not in styles
+        assert styles.default(WD_STYLE_TYPE.PARAGRAPH).style_id == 'Normal'
+
     def it_knows_its_length(self, len_fixture):
         styles, expected_value = len_fixture
         assert len(styles) == expected_value
@@ -18,18 +18,40 @@ from docx.opc.constants import CONTENT_TYPE as CT
 from .unitutil.mock import function_mock, instance_mock, class_mock
 
 
+class DescribePackageNames(object):
+
+    def it_loads_the_other_entry_points_on_first_use(self):
+        from docx.merge import MergeTemplate
+        from docx.streaming import extract_text, iter_blocks
+        from docx.template import TemplateCache
+        assert docx.MergeTemplate is MergeTemplate
+        assert docx.TemplateCache is TemplateCache
+        assert docx.extract_text is extract_text
+        assert docx.iter_blocks is iter_blocks
+
+    def it_raises_on_a_name_it_does_not_have(self):
+        with pytest.raises(AttributeError):
+            docx.foobar
+
+
 class DescribeDocument(object):
 
     def it_opens_a_docx_file(self, open_fixture):
         docx, Package_, document_ = open_fixture
         document = Document(docx)
-        Package_.open.assert_called_once_with(docx)
+        Package_.open.assert_called_once_with(docx, False)
+        assert document is document_
+
+    def it_can_open_a_docx_file_lazily(self, open_fixture):
+        docx, Package_, document_ = open_fixture
+        document = Document(docx, lazy=True)
+        Package_.open.assert_called_once_with(docx, True)
         assert document is document_
 
     def it_opens_the_default_docx_if_none_specified(self, default_fixture):
         docx, Package_, document_ = default_fixture
         document = Document()
-        Package_.open.assert_called_once_with(docx)
+        Package_.open.assert_called_once_with(docx, False)
         assert document is document_
 
     def it_raises_on_not_a_Word_file(self, raise_fixture):
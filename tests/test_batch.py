@@ -0,0 +1,148 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.batch module
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import os
+
+import pytest
+
+from docx import batch
+from docx.batch import DocxJobResult, _run_job, open_template, save_many
+
+from .unitutil.file import docx_path
+
+
+class Describe_save_many(object):
+
+    def it_saves_each_job_in_a_worker_process(self, tmpdir):
+        targets = [str(tmpdir.join('%d.docx' % n)) for n in range(6)]
+        jobs = [(_Job(docx_path('test'), n), t) for n, t in enumerate(targets)]
+
+        results = save_many(jobs, workers=2)
+
+        assert [r.index for r in results] == list(range(6))
+        assert [r.target for r in results] == targets
+        assert all(r.ok for r in results)
+        for n, target in enumerate(targets):
+            with open(target) as f:
+                pid, paragraph_count = f.read().split()
+            assert pid != str(os.getpid())
+            assert paragraph_count == '3'
+
+    def it_reports_a_failing_job_without_stopping_the_others(self, tmpdir):
+        targets = [str(tmpdir.join('%d.docx' % n)) for n in range(3)]
+        jobs = [
+            (_Job(None, 0), targets[0]),
+            (_Job(None, 1, fail=True), targets[1]),
+            (_Job(None, 2), targets[2]),
+        ]
+
+        results = save_many(jobs, workers=2)
+
+        assert [r.ok for r in results] == [True, False, True]
+        assert 'ValueError: job 1 failed' in results[1].error
+        assert not os.path.exists(targets[1])
+        assert os.path.exists(targets[2])
+
+    def it_reports_a_job_that_cannot_be_pickled(self, tmpdir):
+        targets = [str(tmpdir.join('%d.docx' % n)) for n in range(3)]
+        bad_job = _Job(None, 1)
+        bad_job.callback = lambda: None
+        jobs = [
+            (_Job(None, 0), targets[0]), (bad_job, targets[1]),
+            (_Job(None, 2), targets[2]),
+        ]
+
+        results = save_many(jobs, workers=2)
+
+        assert [r.ok for r in results] == [True, False, True]
+        assert [r.index for r in results] == [0, 1, 2]
+        assert 'pickle' in results[1].error
+        assert not os.path.exists(targets[1])
+        assert os.path.exists(targets[2])
+
+    def it_reports_the_jobs_lost_when_a_worker_dies(self, tmpdir):
+        targets = [str(tmpdir.join('%d.docx' % n)) for n in range(3)]
+        jobs = [(_Job(None, n, exit=n == 1), t) for n, t in enumerate(targets)]
+
+        results = save_many(jobs, workers=1)
+
+        assert [r.index for r in results] == [0, 1, 2]
+        assert results[1].ok is False
+        assert 'BrokenProcessPool' in results[1].error
+
+    def it_has_nothing_to_do_without_jobs(self):
+        assert save_many([]) == []
+
+
+class Describe_run_job(object):
+
+    def it_times_the_job(self, tmpdir):
+        target = str(tmpdir.join('0.docx'))
+        result = _run_job((7, _Job(None, 7), target))
+        assert isinstance(result, DocxJobResult)
+        assert (result.index, result.target, result.error) == (7, target, None)
+        assert result.seconds >= 0
+        assert repr(result).startswith('<DocxJobResult #7 %s ok' % target)
+
+    def it_catches_the_error_of_a_failing_job(self):
+        result = _run_job((1, _Job(None, 1, fail=True), 'foo.docx'))
+        assert result.ok is False
+        assert result.error.startswith('Traceback')
+        assert 'failed in' in repr(result)
+
+
+class Describe_open_template(object):
+
+    def it_opens_the_template_when_not_in_a_worker(self):
+        document = open_template(docx_path('test'))
+        assert len(document.paragraphs) == 2
+
+    def it_copies_the_template_parsed_by_the_worker(self):
+        path = docx_path('test')
+        batch._init_worker([path])
+        assert path in batch._template_cache
+
+        document = open_template(path)
+        document.add_paragraph()
+
+        assert len(open_template(path).paragraphs) == 2
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(autouse=True)
+    def no_template_cache(self, request):
+        def reset():
+            batch._template_cache = None
+        request.addfinalizer(reset)
+
+
+class _Job(object):
+    """
+    Picklable stand-in for a document description, saving the pid of the
+    process it was saved in and its paragraph count as text.
+    """
+    def __init__(self, filename, number, fail=False, exit=False):
+        self.filename = filename
+        self.number = number
+        self.fail = fail
+        self.exit = exit
+
+    def save(self, target):
+        if self.exit:
+            os._exit(1)
+        if self.fail:
+            raise ValueError('job %d failed' % self.number)
+        paragraph_count = 0
+        if self.filename is not None:
+            document = open_template(self.filename)
+            document.add_paragraph('job %d' % self.number)
+            paragraph_count = len(document.paragraphs)
+        with open(target, 'w') as f:
+            f.write('%d %d' % (os.getpid(), paragraph_count))
@@ -38,6 +38,15 @@ class DescribeBlockItemContainer(object):
         assert table._element.xml == expected_xml
         assert table._parent is blkcntnr
 
+    def it_can_add_a_table_from_rows(self, add_table_from_rows_fixture):
+        blkcntnr, rows, header, expected_texts = add_table_from_rows_fixture
+        table = blkcntnr.add_table_from_rows(rows, Inches(2), header)
+        assert isinstance(table, Table)
+        assert table._parent is blkcntnr
+        assert blkcntnr._element[-1] is table._element
+        texts = [[cell.text for cell in row.cells] for row in table.rows]
+        assert texts == expected_texts
+
     def it_provides_access_to_the_paragraphs_it_contains(
             self, paragraphs_fixture):
         # test len(), iterable, and indexed access
@@ -47,7 +56,7 @@ class DescribeBlockItemContainer(object):
         count = 0
         for idx, paragraph in enumerate(paragraphs):
             assert isinstance(paragraph, Paragraph)
-            assert paragraphs[idx] is paragraph
+            assert paragraphs[idx]._p is paragraph._p
             count += 1
         assert count == expected_count
 
@@ -59,7 +68,7 @@ class DescribeBlockItemContainer(object):
         count = 0
         for idx, table in enumerate(tables):
             assert isinstance(table, Table)
-            assert tables[idx] is table
+            assert tables[idx]._tbl is table._tbl
             count += 1
         assert count == expected_count
 
@@ -101,6 +110,19 @@ class DescribeBlockItemContainer(object):
         expected_xml = snippet_seq('new-tbl')[0]
         return blkcntnr, rows, cols, width, expected_xml
 
+    @pytest.fixture(params=[
+        ([(1, 2), (3, 4)], None, [['1', '2'], ['3', '4']]),
+        ([(1, 2)], ('a', 'b'), [['a', 'b'], ['1', '2']]),
+        ({'a': [1, 3], 'b': [2, 4]}, None,
+         [['a', 'b'], ['1', '2'], ['3', '4']]),
+        ({'a': [1], 'b': [2]}, ('x', 'y'), [['x', 'y'], ['1', '2']]),
+        ({'a': [1, 3], 'b': [2]}, None, [['a', 'b'], ['1', '2'], ['3', '']]),
+    ])
+    def add_table_from_rows_fixture(self, request):
+        rows, header, expected_texts = request.param
+        blkcntnr = BlockItemContainer(element('w:body'), None)
+        return blkcntnr, rows, header, expected_texts
+
     @pytest.fixture(params=[
         ('w:body',                 0),
         ('w:body/w:p',             1),
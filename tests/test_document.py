@@ -13,6 +13,7 @@ import pytest
 from docx.document import _Body, Document
 from docx.enum.section import WD_SECTION
 from docx.enum.text import WD_BREAK
+from docx.image.downscale import Downscaler
 from docx.opc.coreprops import CoreProperties
 from docx.parts.document import DocumentPart
 from docx.section import Section, Sections
@@ -26,7 +27,8 @@ from docx.text.run import Run
 
 from .unitutil.cxml import element, xml
 from .unitutil.mock import (
-    class_mock, instance_mock, method_mock, property_mock
+    call, class_mock, function_mock, instance_mock, method_mock,
+    property_mock
 )
 
 
@@ -62,9 +64,45 @@ class DescribeDocument(object):
     def it_can_add_a_picture(self, add_picture_fixture):
         document, path, width, height, run_, picture_ = add_picture_fixture
         picture = document.add_picture(path, width, height)
-        run_.add_picture.assert_called_once_with(path, width, height)
+        run_.add_picture.assert_called_once_with(path, width, height, None)
         assert picture is picture_
 
+    def it_can_add_pictures_loaded_ahead(self, request, picture_):
+        document = Document(None, None)
+        load_images_ = function_mock(
+            request, 'docx.image.load_images',
+            return_value=iter(['image1', 'image2'])
+        )
+        add_picture_ = method_mock(
+            request, Document, 'add_picture', return_value=picture_
+        )
+
+        pictures = document.add_pictures(['a.png', 'b.png'], 100, 200, 3)
+
+        load_images_.assert_called_once_with(['a.png', 'b.png'], 3)
+        assert add_picture_.call_args_list == [
+            call('image1', 100, 200), call('image2', 100, 200)
+        ]
+        assert pictures == [picture_, picture_]
+
+    def it_can_add_pictures_downscaled_ahead(self, request, picture_):
+        document = Document(None, None)
+        downscaler_ = instance_mock(request, Downscaler)
+        downscaler_.prepare_all.return_value = iter([('image1', 10, 20)])
+        add_picture_ = method_mock(
+            request, Document, 'add_picture', return_value=picture_
+        )
+
+        pictures = document.add_pictures(
+            ['a.png'], 100, None, 3, downscaler_
+        )
+
+        downscaler_.prepare_all.assert_called_once_with(
+            ['a.png'], 100, None, 3
+        )
+        add_picture_.assert_called_once_with('image1', 10, 20)
+        assert pictures == [picture_]
+
     def it_can_add_a_section(self, add_section_fixture):
         document, start_type, Section_ = add_section_fixture[:3]
         section_, expected_xml = add_section_fixture[3:]
@@ -83,10 +121,32 @@ class DescribeDocument(object):
         assert table == table_
         assert table.style == style
 
+    def it_can_add_a_table_from_rows(self, add_table_from_rows_fixture):
+        document, rows, style, header, width, table_ = (
+            add_table_from_rows_fixture
+        )
+        table = document.add_table_from_rows(rows, style, header)
+        document._body.add_table_from_rows.assert_called_once_with(
+            rows, width, header
+        )
+        assert table == table_
+        assert table.style == style
+
     def it_can_save_the_document_to_a_file(self, save_fixture):
         document, file_ = save_fixture
         document.save(file_)
-        document._part.save.assert_called_once_with(file_)
+        document._part.save.assert_called_once_with(file_, False)
+
+    def it_can_save_the_document_in_streaming_mode(self, save_fixture):
+        document, file_ = save_fixture
+        document.save(file_, streaming=True)
+        document._part.save.assert_called_once_with(file_, True)
+
+    def it_can_close_its_package_file(self, document_part_):
+        with Document(None, document_part_) as document:
+            assert document_part_.package.close.call_count == 0
+        document.close()
+        assert document_part_.package.close.call_count == 2
 
     def it_provides_access_to_its_core_properties(self, core_props_fixture):
         document, core_properties_ = core_props_fixture
@@ -205,6 +265,15 @@ class DescribeDocument(object):
         _block_width_prop_.return_value = width = 42
         return document, rows, cols, style, width, table_
 
+    @pytest.fixture
+    def add_table_from_rows_fixture(
+            self, _block_width_prop_, body_prop_, table_):
+        document = Document(None, None)
+        rows, style, header = [(1, 2), (3, 4)], 'Light Shading', ('a', 'b')
+        body_prop_.return_value.add_table_from_rows.return_value = table_
+        _block_width_prop_.return_value = width = 42
+        return document, rows, style, header, width, table_
+
     @pytest.fixture
     def block_width_fixture(self, sections_prop_, section_):
         document = Document(None, None)
@@ -77,6 +77,16 @@ class DescribeEnumeration(object):
     def it_can_be_referred_to_by_a_convenience_alias_if_defined(self):
         assert BARFOO is FOOBAR  # noqa
 
+    def it_generates_its_docs_page_on_first_access(self):
+        assert '_docs_rst' not in vars(FOOBAR)
+        docs_rst = FOOBAR.__docs_rst__
+        assert docs_rst.startswith(
+            '.. _MsoFoobar:\n\n``FOOBAR``\n==========\n\n'
+            'Enumeration docstring\n\n----\n\n'
+        )
+        assert 'READ_WRITE\n    Readable and settable\n' in docs_rst
+        assert FOOBAR.__docs_rst__ is docs_rst
+
 
 class DescribeEnumValue(object):
 
@@ -0,0 +1,99 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.extract module
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import json
+import os
+
+import pytest
+
+from docx.extract import _iter_docx_paths, _iter_records, extract_file, main
+
+from .unitutil.file import docx_path
+from .unitutil.mock import var_mock
+
+
+class Describe_extract_file(object):
+
+    def it_extracts_text_and_metadata_from_a_docx_file(self):
+        path = docx_path('test')
+
+        record = extract_file(path)
+
+        assert record['path'] == path
+        assert record['text'] == (
+            'python-docx was here!\npython-docx was here too!'
+        )
+        assert record['paragraphs'] == 2
+        assert record['images'] == 0
+        assert record['styles'] == {'Heading 1': 1}
+        assert record['core_properties']['author'] == 'Cisco Employee'
+        assert record['core_properties']['created'] == '2013-12-15T10:40:00'
+        assert 'title' not in record['core_properties']
+        json.dumps(record)
+
+    def it_counts_the_images_in_the_package(self):
+        record = extract_file(docx_path('having-images'), include_text=False)
+        assert record['images'] == 3
+        assert 'text' not in record
+
+    def it_records_an_error_for_a_file_it_cannot_read(self, tmpdir):
+        path = str(tmpdir.join('bad.docx'))
+        with open(path, 'wb') as f:
+            f.write(b'not a zip file')
+
+        record = extract_file(path)
+
+        assert record['path'] == path
+        assert record['error'].startswith('BadZipFile')
+
+
+class Describe_main(object):
+
+    def it_writes_a_json_record_for_each_file(self, tmpdir, capsys):
+        good, bad = docx_path('test'), str(tmpdir.join('missing.docx'))
+
+        status = main(['-j', '1', '--no-text', good, bad])
+
+        out, err = capsys.readouterr()
+        records = [json.loads(line) for line in out.splitlines()]
+        assert [r['path'] for r in records] == [good, bad]
+        assert 'error' not in records[0]
+        assert 'error' in records[1]
+        assert '2 files, 1 errors' in err
+        assert 'files/s' in err
+        assert status == 1
+
+    def it_extracts_files_in_a_process_pool(self):
+        paths = [docx_path('test'), docx_path('having-images')]
+        records = list(_iter_records(iter(paths), 2, False))
+        assert records == [extract_file(p, False) for p in paths]
+
+    def it_keeps_a_bounded_number_of_files_in_flight(self, request):
+        var_mock(request, 'docx.extract._IN_FLIGHT_PER_JOB', new=1)
+        paths = [docx_path('test'), docx_path('having-images')] * 3
+        records = list(_iter_records(iter(paths), 2, False))
+        assert [r['path'] for r in records] == paths
+        assert [r['images'] for r in records] == [0, 3] * 3
+
+    def it_expands_directories_and_globs(self, tmpdir):
+        for relpath in ('a.docx', 'b.txt', '~$a.docx', 'sub/c.DOCX'):
+            path = tmpdir.join(*relpath.split('/'))
+            path.ensure()
+        root = str(tmpdir)
+        pattern = os.path.join(root, '*.docx')
+
+        paths = list(_iter_docx_paths([root, pattern, 'plain.docx']))
+
+        assert paths == [
+            os.path.join(root, 'a.docx'),
+            os.path.join(root, 'sub', 'c.DOCX'),
+            os.path.join(root, 'a.docx'),
+            'plain.docx',
+        ]
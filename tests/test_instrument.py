@@ -0,0 +1,161 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.instrument module
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import json
+
+import pytest
+
+from docx import instrument
+from docx.api import Document
+from docx.compat import BytesIO
+from docx.instrument import Recorder, Span, span
+
+from .unitutil.file import test_file
+
+
+class DescribeSpan(object):
+
+    def it_does_nothing_when_instrumentation_is_disabled(self):
+        with span('work', size=1) as s:
+            s.set(elements=2)
+        assert not s
+        assert instrument.is_enabled() is False
+
+    def it_reports_each_span_as_it_ends(self, recorder):
+        with span('outer', size=1) as outer:
+            with span('inner') as inner:
+                inner.set(elements=2)
+            assert recorder.spans == [inner]
+
+        assert recorder.spans == [inner, outer]
+        assert isinstance(outer, Span)
+        assert outer.attrs == {'size': 1}
+        assert inner.attrs == {'elements': 2}
+        assert outer.start <= inner.start <= inner.end <= outer.end
+        assert outer.duration >= inner.duration >= 0
+
+    def it_knows_the_spans_enclosing_it(self, recorder):
+        with span('outer') as outer:
+            with span('inner') as inner:
+                pass
+        with span('next') as next_:
+            pass
+
+        assert inner.parent is outer
+        assert outer.parent is None
+        assert next_.parent is None
+        assert inner.path == ('outer', 'inner')
+
+    def it_notes_an_error_raised_in_its_block(self, recorder):
+        with pytest.raises(KeyError):
+            with span('work') as s:
+                raise KeyError('foo')
+        assert recorder.spans == [s]
+        assert s.attrs == {'error': 'KeyError'}
+
+    def it_stops_reporting_once_disabled(self, recorder):
+        instrument.disable()
+        with span('work'):
+            pass
+        assert recorder.spans == []
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def recorder(self, request):
+        recorder = Recorder()
+        instrument.enable(recorder)
+        request.addfinalizer(instrument.disable)
+        return recorder
+
+
+class DescribeRecorder(object):
+
+    def it_can_export_its_spans_as_folded_stacks(self, recorder):
+        assert recorder.folded() == (
+            'open 2000\n'
+            'open;parse 2500\n'
+            'save 500\n'
+        )
+
+    def it_can_export_its_spans_as_a_trace(self, recorder):
+        trace = recorder.trace()
+        assert [
+            (e['name'], e['ts'], e['dur'], e['args'])
+            for e in trace['traceEvents']
+        ] == [
+            ('open', 0.0, 4500.0, {}),
+            ('parse', 500.0, 2000.0, {'bytes': 10}),
+            ('parse', 2500.0, 500.0, {'bytes': 20}),
+            ('save', 5000.0, 500.0, {}),
+        ]
+        assert trace['traceEvents'][0]['ph'] == 'X'
+
+    def it_can_write_its_spans_as_json(self, recorder, tmpdir):
+        path = str(tmpdir.join('trace.json'))
+        recorder.write_json(path)
+        with open(path) as f:
+            assert json.load(f) == recorder.trace()
+
+    def it_can_forget_its_spans(self, recorder):
+        recorder.clear()
+        assert recorder.spans == []
+        assert recorder.folded() == ''
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def recorder(self):
+        def add(name, start, end, parent=None, **attrs):
+            s = Span(name, attrs, recorder)
+            s.start, s.end, s.parent, s.thread_id = start, end, parent, 1
+            recorder(s)
+            return s
+
+        recorder = Recorder()
+        open_ = Span('open', {}, recorder)
+        open_.start, open_.end, open_.thread_id = 1.0, 1.0045, 1
+        add('parse', 1.0005, 1.0025, open_, bytes=10)
+        add('parse', 1.0025, 1.003, open_, bytes=20)
+        recorder(open_)
+        add('save', 1.005, 1.0055)
+        return recorder
+
+
+class DescribeInstrumentedOperations(object):
+
+    def they_report_opening_and_saving_a_package(self, recorder):
+        document = Document(test_file('test.docx'))
+        document.add_picture(test_file('monty-truth.png'))
+        document.save(BytesIO())
+
+        paths = set(s.path for s in recorder.spans)
+        assert ('package.open', 'package.read') in paths
+        assert ('package.open', 'part.parse') in paths
+        assert ('image.ingest',) in paths
+        assert ('package.write', 'part.serialize') in paths
+        assert ('package.write', 'zip.write') in paths
+
+        parse = next(
+            s for s in recorder.spans if s.attrs.get('partname') ==
+            '/word/document.xml' and s.name == 'part.parse'
+        )
+        assert parse.attrs['bytes'] > 0
+        assert parse.attrs['elements'] > 0
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def recorder(self, request):
+        recorder = Recorder()
+        instrument.enable(recorder)
+        request.addfinalizer(instrument.disable)
+        return recorder
+
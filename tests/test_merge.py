@@ -0,0 +1,140 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.merge module
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import pytest
+
+from docx.api import Document
+from docx.compat import BytesIO
+from docx.merge import MergeTemplate
+from docx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from docx.opc.packuri import PackURI
+from docx.opc.part import Part, XmlPart
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+
+from .unitutil.file import docx_path
+
+
+class DescribeMergeTemplate(object):
+
+    def it_knows_its_field_names(self, template):
+        assert template.field_names == ('name', 'city', 'total')
+
+    def it_renders_a_record_into_a_new_document(self, template):
+        document = template.render(
+            {'name': 'Ann', 'city': 'Oslo', 'total': 42}
+        )
+
+        paragraphs = document.paragraphs
+        assert paragraphs[0].text == 'Dear Ann of Oslo,'
+        assert [r.bold for r in paragraphs[0].runs] == [True, None, None]
+        assert paragraphs[1].text == 'You owe 42, Ann.'
+        assert document.tables[0].cell(0, 0).text == 'City: Oslo'
+
+    def it_leaves_the_template_unchanged(self, template):
+        template.render({'name': 'Ann', 'city': 'Oslo', 'total': 1})
+        records = [
+            {'name': 'Bob', 'city': 'Rome', 'total': 2},
+            {'name': 'Cy', 'city': 'Lima', 'total': 3},
+        ]
+
+        documents = list(template.render_all(records))
+
+        texts = [d.paragraphs[0].text for d in documents]
+        assert texts == ['Dear Bob of Rome,', 'Dear Cy of Lima,']
+
+    def it_renders_a_document_that_can_be_saved(self, template):
+        document = template.render({'name': 'A', 'city': 'B', 'total': 'C'})
+        stream = BytesIO()
+
+        document.save(stream)
+
+        assert Document(stream).paragraphs[0].text == 'Dear A of B,'
+
+    def it_raises_on_a_missing_field_value(self, template):
+        with pytest.raises(KeyError):
+            template.render({'name': 'Ann'})
+
+    def it_merges_placeholders_in_hyperlinks_and_headers(self, template_2):
+        assert template_2.field_names == ('city', 'name')
+
+        document = template_2.render({'name': 'Ann', 'city': 'Oslo'})
+
+        p = document.paragraphs[0]._p
+        assert ''.join(p.xpath('.//w:t/text()')) == 'Visit Oslo'
+        header = document.part.part_related_by(RT.HEADER)
+        assert header.element.xpath('string(.)') == 'For Ann'
+
+    def it_leaves_the_headers_of_other_documents_unparsed(self, header_docx):
+        MergeTemplate(header_docx)
+
+        header = Document(header_docx).part.part_related_by(RT.HEADER)
+
+        assert type(header) is Part
+        assert b'{{name}}' in header.blob
+
+    def it_writes_tabs_and_line_breaks_in_a_value(self, template_2):
+        document = template_2.render(
+            {'name': 'Ann\tLee\n', 'city': 'Oslo\nNorway'}
+        )
+
+        r = document.paragraphs[0]._p.xpath('./w:hyperlink/w:r')[0]
+        assert [child.tag.split('}')[1] for child in r] == [
+            't', 'br', 't'
+        ]
+        assert [t.text for t in r.xpath('./w:t')] == ['Oslo', 'Norway']
+        header = document.part.part_related_by(RT.HEADER)
+        r = next(header.element.iter(qn('w:r')))
+        assert [child.tag.split('}')[1] for child in r] == [
+            't', 't', 'tab', 't', 'br'
+        ]
+        assert r[3].text == 'Lee'
+
+    def it_can_be_created_from_a_path(self):
+        template = MergeTemplate(docx_path('test'))
+        assert template.field_names == ()
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def template(self):
+        document = Document()
+        paragraph = document.add_paragraph()
+        for text in ('Dear {', '{name}} of {{ ci', 'ty }},'):
+            paragraph.add_run(text)
+        paragraph.runs[0].bold = True
+        document.add_paragraph('You owe {{total}}, {{name}}.')
+        document.add_table(1, 1).cell(0, 0).text = 'City: {{city}}'
+        stream = BytesIO()
+        document.save(stream)
+        return MergeTemplate(stream)
+
+    @pytest.fixture
+    def template_2(self, header_docx):
+        return MergeTemplate(header_docx)
+
+    @pytest.fixture
+    def header_docx(self):
+        document = Document()
+        paragraph = document.add_paragraph('Visit ')
+        paragraph._p.append(parse_xml(
+            '<w:hyperlink %s><w:r><w:t>{{ci</w:t></w:r><w:r><w:t>ty}}</w:t>'
+            '</w:r></w:hyperlink>' % nsdecls('w')
+        ))
+        header = XmlPart(
+            PackURI('/word/header1.xml'), CT.WML_HEADER, parse_xml(
+                '<w:hdr %s><w:p><w:r><w:t xml:space="preserve">For </w:t>'
+                '<w:t>{{name}}</w:t></w:r></w:p></w:hdr>' % nsdecls('w')
+            ), document.part.package
+        )
+        document.part.relate_to(header, RT.HEADER)
+        stream = BytesIO()
+        document.save(stream)
+        return stream
@@ -6,6 +6,8 @@ Test suite for docx.package module
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+import hashlib
+
 import pytest
 
 from docx.image.image import Image
@@ -33,15 +35,47 @@ class DescribeImageParts(object):
         image_parts, image_descriptor, image_part_ = get_image_part_fixture
         image_part = image_parts.get_or_add_image_part(image_descriptor)
         assert image_part is image_part_
+        assert image_parts._image_parts_by_sha1 is not None
+
+    def it_does_not_parse_an_image_it_already_has(
+            self, get_image_part_fixture, Image_):
+        image_parts, image_descriptor, image_part_ = get_image_part_fixture
+        image_parts.get_or_add_image_part(image_descriptor)
+        assert Image_.from_blob.call_count == 0
+        assert Image_.from_file.call_count == 0
 
     def it_can_add_a_new_image_part(self, add_image_part_fixture):
-        image_parts, image_descriptor, image_, image_part_ = (
+        image_parts, image_descriptor, Image_, image_, image_part_ = (
             add_image_part_fixture
         )
         image_part = image_parts.get_or_add_image_part(image_descriptor)
+        Image_.from_blob.assert_called_once_with(b'n3w', 'new.png')
         image_parts._add_image_part.assert_called_once_with(image_)
         assert image_part is image_part_
 
+    def it_can_get_or_add_a_part_for_a_loaded_image(
+            self, request, image_part_, image_, sha1, new_image_part_,
+            _add_image_part_, read_blob_):
+        image_parts = ImageParts()
+        image_parts.append(image_part_)
+        other_image_ = instance_mock(request, Image, sha1='f00')
+
+        assert image_parts.get_or_add_image_part(image_) is image_part_
+        image_part = image_parts.get_or_add_image_part(other_image_)
+
+        _add_image_part_.assert_called_once_with(other_image_)
+        assert image_part is new_image_part_
+        assert read_blob_.call_count == 0
+
+    def it_finds_an_image_part_appended_after_its_index_is_built(
+            self, get_image_part_fixture, request, sha1):
+        image_parts, image_descriptor, image_part_ = get_image_part_fixture
+        assert image_parts._get_by_sha1('deadbeef') is None
+        image_part_2_ = instance_mock(request, ImagePart, sha1='deadbeef')
+        image_parts.append(image_part_2_)
+        assert image_parts._get_by_sha1('deadbeef') is image_part_2_
+        assert image_parts._get_by_sha1(sha1) is image_part_
+
     def it_knows_the_next_available_image_partname(
             self, next_partname_fixture):
         image_parts, ext, expected_partname = next_partname_fixture
@@ -69,21 +103,25 @@ class DescribeImageParts(object):
     @pytest.fixture
     def add_image_part_fixture(
             self, Image_, _add_image_part_, image_descriptor_, image_,
-            new_image_part_,):
+            new_image_part_, read_blob_, image_part_):
         image_parts = ImageParts()
-        return image_parts, image_descriptor_, image_, new_image_part_
+        image_parts.append(image_part_)
+        read_blob_.return_value = (b'n3w', 'new.png')
+        return image_parts, image_descriptor_, Image_, image_, new_image_part_
 
     @pytest.fixture
-    def get_image_part_fixture(self, Image_, image_part_, image_descriptor_):
+    def get_image_part_fixture(
+            self, Image_, image_part_, image_descriptor_,
+            read_blob_):
         image_parts = ImageParts()
         image_parts.append(image_part_)
         return image_parts, image_descriptor_, image_part_
 
     @pytest.fixture
     def Image_(self, request, image_):
-        Image_ = class_mock(request, 'docx.package.Image')
-        Image_.from_file.return_value = image_
-        return Image_
+        method_mock(request, Image, 'from_blob', return_value=image_)
+        method_mock(request, Image, 'from_file')
+        return Image
 
     @pytest.fixture
     def image_(self, request, sha1):
@@ -147,6 +185,13 @@ class DescribeImageParts(object):
         _next_image_partname_.return_value = partname_
         return image_parts, image_, ImagePart_, partname_, image_part_
 
+    @pytest.fixture
+    def read_blob_(self, request):
+        return method_mock(
+            request, Image, 'read_blob',
+            return_value=(b'foobar', 'foobar.png')
+        )
+
     @pytest.fixture
     def sha1(self):
-        return 'F008AH'
+        return hashlib.sha1(b'foobar').hexdigest()
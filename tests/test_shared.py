@@ -8,12 +8,22 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+import gc
 import pytest
 
+from docx import shared
+from docx.blkcntnr import BlockItemContainer
+from docx.document import _Body
 from docx.opc.part import XmlPart
+from docx.section import Section, Sections
+from docx.shape import InlineShape, InlineShapes
 from docx.shared import (
-    ElementProxy, Length, Cm, Emu, Inches, Mm, Pt, RGBColor, Twips
+    ElementProxy, Length, Cm, Emu, Inches, Mm, Parented, ProxySequence, Pt,
+    RGBColor, Twips, enable_proxy_cache, proxy_for
 )
+from docx.table import _Cell, _Column, _Columns, _Row, _Rows, Table
+from docx.text.paragraph import Paragraph
+from docx.text.run import _Text, Run
 
 from .unitutil.cxml import element
 from .unitutil.mock import instance_mock
@@ -40,6 +50,10 @@ class DescribeElementProxy(object):
         proxy, part_ = part_fixture
         assert proxy.part is part_
 
+    def it_keeps_no_instance_dict(self):
+        proxy = ElementProxy(element('w:p'))
+        assert not hasattr(proxy, '__dict__')
+
     # fixture --------------------------------------------------------
 
     @pytest.fixture
@@ -74,6 +88,132 @@ class DescribeElementProxy(object):
         return instance_mock(request, XmlPart)
 
 
+class DescribeProxyClasses(object):
+
+    @pytest.mark.parametrize('cls', [
+        Parented, BlockItemContainer, _Body, Paragraph, Run, _Text, Table,
+        _Cell, _Column, _Columns, _Row, _Rows, Section, Sections,
+        InlineShape, InlineShapes,
+    ])
+    def they_keep_no_instance_dict(self, cls):
+        for klass in cls.__mro__[:-1]:
+            if klass.__module__.startswith('docx.'):
+                assert '__slots__' in vars(klass)
+        assert '__dict__' not in dir(cls)
+
+
+class DescribeProxySequence(object):
+
+    def it_knows_how_many_proxies_it_contains(self, seq_fixture):
+        seq, _ = seq_fixture
+        assert len(seq) == 3
+
+    def it_provides_indexed_access_to_a_proxy(self, seq_fixture):
+        seq, ps = seq_fixture
+        assert seq[0]._p is ps[0]
+        assert seq[2]._p is ps[2]
+        assert seq[-1]._p is ps[2]
+        assert seq[-3]._p is ps[0]
+
+    def it_raises_on_indexed_access_out_of_range(self, seq_fixture):
+        seq, _ = seq_fixture
+        with pytest.raises(IndexError):
+            seq[3]
+        with pytest.raises(IndexError):
+            seq[-4]
+
+    def it_provides_a_list_for_a_slice(self, seq_fixture):
+        seq, ps = seq_fixture
+        paragraphs = seq[1:]
+        assert isinstance(paragraphs, list)
+        assert [paragraph._p for paragraph in paragraphs] == ps[1:]
+
+    def it_iterates_the_proxies_present_when_it_starts(self, seq_fixture):
+        seq, ps = seq_fixture
+        proxies = []
+        for paragraph in seq:
+            paragraph._p.getparent().remove(paragraph._p)
+            proxies.append(paragraph)
+        assert [paragraph._p for paragraph in proxies] == ps
+        assert len(seq) == 0
+
+    def it_gives_each_proxy_its_parent(self, seq_fixture):
+        seq, _ = seq_fixture
+        assert seq[1]._parent == 'parent'
+
+    def it_compares_equal_to_a_sequence_of_equal_items(self, eq_fixture):
+        seq, proxies = eq_fixture
+        assert seq == proxies
+        assert seq == tuple(proxies)
+        assert seq == ProxySequence(seq._element, 'w:p', ElementProxy, None)
+        assert not seq != proxies
+        assert seq != proxies[1:]
+        assert seq != proxies[::-1]
+        assert seq != 42
+
+    def it_compares_equal_to_an_empty_list_when_empty(self):
+        seq = ProxySequence(element('w:body'), 'w:p', Paragraph, None)
+        assert seq == []
+
+    def it_concatenates_to_a_list(self, eq_fixture):
+        seq, proxies = eq_fixture
+        proxy = ElementProxy(element('w:p'))
+
+        assert seq + [proxy] == proxies + [proxy]
+        assert [proxy] + seq == [proxy] + proxies
+        assert isinstance(seq + seq, list)
+        assert seq + seq == proxies + proxies
+        with pytest.raises(TypeError):
+            seq + 42
+
+    def it_is_not_hashable(self, seq_fixture):
+        seq, _ = seq_fixture
+        with pytest.raises(TypeError):
+            hash(seq)
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def eq_fixture(self):
+        body = element('w:body/(w:p,w:tbl,w:p,w:p)')
+        seq = ProxySequence(body, 'w:p', ElementProxy, None)
+        return seq, [ElementProxy(p) for p in body.p_lst]
+
+    @pytest.fixture
+    def seq_fixture(self):
+        body = element('w:body/(w:p,w:tbl,w:p,w:p)')
+        seq = ProxySequence(body, 'w:p', Paragraph, 'parent')
+        return seq, body.p_lst
+
+
+class Describe_proxy_for(object):
+
+    def it_creates_a_new_proxy_by_default(self):
+        p = element('w:p')
+        paragraph = proxy_for(Paragraph, p, None)
+        assert isinstance(paragraph, Paragraph)
+        assert paragraph._p is p
+        assert proxy_for(Paragraph, p, None) is not paragraph
+
+    def it_reuses_a_proxy_still_in_use_when_enabled(self, cache_fixture):
+        p = element('w:p')
+        paragraph = proxy_for(Paragraph, p, None)
+        assert proxy_for(Paragraph, p, None) is paragraph
+        assert proxy_for(Run, p, None) is not paragraph
+
+    def it_drops_a_proxy_no_longer_in_use(self, cache_fixture):
+        proxy_for(Paragraph, element('w:p'), None)
+        gc.collect()
+        assert len(shared._proxy_cache) == 0
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def cache_fixture(self, request):
+        enable_proxy_cache()
+        request.addfinalizer(lambda: enable_proxy_cache(False))
+
+
 class DescribeLength(object):
 
     def it_can_construct_from_convenient_units(self, construct_fixture):
@@ -0,0 +1,159 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.streaming module
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import pytest
+
+from collections import Counter
+
+from docx.compat import BytesIO
+from docx.opc.constants import CONTENT_TYPE as CT
+from docx.opc.packuri import PackURI
+from docx.opc.phys_pkg import _ZipPkgReader
+from docx.oxml.table import CT_Tbl
+from docx.oxml.text.paragraph import CT_P
+from docx.streaming import (
+    _iter_body_blocks, iter_paragraph_text, _main_document_partname,
+    extract_text, iter_blocks
+)
+from docx.table import Table
+from docx.text.paragraph import Paragraph
+
+from .unitutil.cxml import xml
+from .unitutil.file import docx_path, test_file
+from .unitutil.mock import class_mock, instance_mock
+
+
+class Describe_extract_text(object):
+
+    def it_generates_the_text_of_each_paragraph(self, docx_fixture):
+        docx = docx_fixture
+        texts = list(extract_text(docx))
+        assert texts == ['python-docx was here!', 'python-docx was here too!']
+
+    def it_translates_run_content_to_text(self, text_fixture):
+        stream, expected_texts = text_fixture
+        assert list(iter_paragraph_text(stream)) == expected_texts
+
+    def it_can_count_style_references(self):
+        document_xml = xml(
+            'w:document/w:body/(w:p/(w:pPr/w:pStyle{w:val=Foo},w:r/(w:rPr/'
+            'w:rStyle{w:val=Bar},w:t"x")),w:p/w:pPr/w:pStyle{w:val=Foo},w:tb'
+            'l/w:tblPr/w:tblStyle{w:val=Baz})'
+        )
+        stream = BytesIO(document_xml.encode('utf-8'))
+        style_counts = Counter()
+
+        texts = list(iter_paragraph_text(stream, style_counts))
+
+        assert texts == ['x', '']
+        assert style_counts == {'Foo': 2, 'Bar': 1, 'Baz': 1}
+
+    def it_finds_the_main_document_part(self):
+        phys_reader = _ZipPkgReader(docx_path('test'))
+        partname = _main_document_partname(phys_reader)
+        assert partname == PackURI('/word/document.xml')
+
+    def it_raises_when_there_is_no_main_document_part(self, request):
+        phys_reader = instance_mock(request, _ZipPkgReader)
+        phys_reader.rels_xml_for.return_value = None
+        with pytest.raises(ValueError):
+            _main_document_partname(phys_reader)
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=['path', 'stream'])
+    def docx_fixture(self, request):
+        path = docx_path('test')
+        if request.param == 'path':
+            return path
+        with open(path, 'rb') as f:
+            return BytesIO(f.read())
+
+    @pytest.fixture(params=[
+        ('w:p', ['']),
+        ('w:p/w:r/w:t"foo"', ['foo']),
+        ('w:p/(w:r/w:t"foo",w:r/(w:tab,w:t"bar",w:br,w:cr))',
+         ['foo\tbar\n\n']),
+        ('w:p/(w:pPr/w:tabs/w:tab,w:r/w:t"foo")', ['foo']),
+        ('w:p/(w:r/w:t"foo",w:hyperlink/w:r/w:t"bar")', ['foobar']),
+        ('(w:p/w:r/w:t"foo",w:tbl/w:tr/(w:tc/w:p/w:r/w:t"a",w:tc/w:p))',
+         ['foo', 'a', '']),
+        ('w:p/(w:r/w:t"foo",w:r/w:txbxContent/w:p/w:r/w:t"bar")',
+         ['bar', 'foo']),
+    ])
+    def text_fixture(self, request):
+        body_cxml, expected_texts = request.param
+        document_xml = xml('w:document/w:body/%s' % body_cxml)
+        stream = BytesIO(document_xml.encode('utf-8'))
+        return stream, expected_texts
+
+
+class Describe_iter_blocks(object):
+
+    def it_generates_a_proxy_for_each_block(self, docx_fixture):
+        blocks, style_names = [], []
+        for block in iter_blocks(docx_fixture):
+            blocks.append(block)
+            style_names.append(block.style.name)
+
+        assert [type(block) for block in blocks] == [Paragraph, Paragraph]
+        assert [block.text for block in blocks] == [
+            'python-docx was here!', 'python-docx was here too!'
+        ]
+        assert style_names == ['Heading 1', 'Normal']
+
+    def it_closes_the_package_once_done(self, request):
+        Package_ = class_mock(request, 'docx.streaming.Package')
+        package_ = Package_.open.return_value
+        document_part = package_.main_document_part
+        document_part.content_type = CT.WML_DOCUMENT_MAIN
+        document_part.source_blob.open.return_value = BytesIO(
+            xml('w:document/w:body/(w:p,w:p)').encode('utf-8')
+        )
+
+        blocks = iter_blocks('foo.docx')
+        next(blocks)
+        assert package_.close.call_count == 0
+        blocks.close()
+
+        package_.close.assert_called_once_with()
+
+    def it_detaches_each_body_block_as_it_is_parsed(self):
+        document_xml = xml(
+            'w:document/w:body/(w:p/w:r/w:t"foo",w:bookmarkStart,w:tbl/w:tr'
+            '/w:tc/(w:p/w:r/w:t"bar",w:tbl/w:tr/w:tc/w:p),w:p,w:sectPr)'
+        )
+        stream = BytesIO(document_xml.encode('utf-8'))
+
+        blocks = []
+        for block in _iter_body_blocks(stream):
+            assert block.getparent() is None
+            blocks.append(block)
+
+        assert [type(block) for block in blocks] == [CT_P, CT_Tbl, CT_P]
+        assert blocks[0].xpath('string()') == 'foo'
+        assert len(blocks[1].xpath('.//w:p')) == 2
+
+    def it_raises_when_the_package_is_not_a_word_file(self, request):
+        Package_ = class_mock(request, 'docx.streaming.Package')
+        document_part = Package_.open.return_value.main_document_part
+        document_part.content_type = CT.PML_PRESENTATION_MAIN
+        with pytest.raises(ValueError):
+            next(iter_blocks(test_file('foo.pptx')))
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=['path', 'stream'])
+    def docx_fixture(self, request):
+        path = docx_path('test')
+        if request.param == 'path':
+            return path
+        with open(path, 'rb') as f:
+            return BytesIO(f.read())
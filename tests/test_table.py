@@ -51,6 +51,39 @@ class DescribeTable(object):
                 tc = tr.tc_lst[col_idx]
                 assert tc is cell._tc
 
+    def it_reuses_its_cells_until_the_table_changes(self):
+        table = Table(element(
+            'w:tbl/(w:tblGrid/(w:gridCol{w:w=1440},w:gridCol{w:w=1440}),'
+            'w:tr/(w:tc,w:tc),w:tr/(w:tc,w:tc))'
+        ), None)
+        cells = table._cells
+        assert table._cells is cells
+        table.add_row()
+        assert len(table._cells) == len(cells) + 2
+        Table(table._tbl, None).add_column(Inches(1))
+        assert len(table._cells) == 9
+
+    def it_sees_a_merge_made_through_another_table(self, grid_tbl):
+        table = Table(grid_tbl, None)
+        table._cells
+        other = Table(grid_tbl, None)
+
+        other.cell(0, 0).merge(other.cell(0, 1))
+
+        assert table.cell(0, 1)._tc is table.cell(0, 0)._tc
+        assert table.cell(0, 1)._tc.getparent() is grid_tbl.tr_lst[0]
+
+    def it_sees_a_row_removed_from_the_middle(self, grid_tbl):
+        table = Table(grid_tbl, None)
+        assert len(table._cells) == 9
+        middle_tr = grid_tbl.tr_lst[1]
+
+        grid_tbl.remove(middle_tr)
+
+        assert len(table.rows) == 2
+        assert len(table._cells) == 6
+        assert table.cell(1, 0)._tc is grid_tbl.tr_lst[1].tc_lst[0]
+
     def it_provides_access_to_the_table_rows(self, table):
         rows = table.rows
         assert isinstance(rows, _Rows)
@@ -317,6 +350,15 @@ class DescribeTable(object):
             request, Table, 'part', return_value=document_part_
         )
 
+    @pytest.fixture
+    def grid_tbl(self):
+        return element(
+            'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol,w:gridCol),'
+            'w:tr/(w:tc/w:p,w:tc/w:p,w:tc/w:p),'
+            'w:tr/(w:tc/w:p,w:tc/w:p,w:tc/w:p),'
+            'w:tr/(w:tc/w:p,w:tc/w:p,w:tc/w:p))'
+        )
+
     @pytest.fixture
     def table(self):
         tbl = _tbl_bldr(rows=2, cols=2).element
@@ -355,7 +397,7 @@ class Describe_Cell(object):
         count = 0
         for idx, paragraph in enumerate(paragraphs):
             assert isinstance(paragraph, Paragraph)
-            assert paragraph is paragraphs[idx]
+            assert paragraph._p is paragraphs[idx]._p
             count += 1
         assert count == 2
 
@@ -367,7 +409,7 @@ class Describe_Cell(object):
         count = 0
         for idx, table in enumerate(tables):
             assert isinstance(table, Table)
-            assert tables[idx] is table
+            assert tables[idx]._tbl is table._tbl
             count += 1
         assert count == expected_count
 
@@ -390,6 +432,7 @@ class Describe_Cell(object):
         assert isinstance(merged_cell, _Cell)
         assert merged_cell._tc is merged_tc_
         assert merged_cell._parent is cell._parent
+        cell._parent.table._reset_cells.assert_called_once_with()
 
     # fixtures -------------------------------------------------------
 
@@ -0,0 +1,96 @@
+# encoding: utf-8
+
+"""
+Test suite for the docx.template module
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+import os
+import shutil
+
+import pytest
+
+from docx.document import Document
+from docx.template import TemplateCache
+
+from .unitutil.file import absjoin, test_file_dir
+
+
+test_docx_path = absjoin(test_file_dir, 'test.docx')
+
+
+class DescribeTemplateCache(object):
+
+    def it_provides_a_copy_of_a_template(self):
+        cache = TemplateCache()
+
+        document = cache.document(test_docx_path)
+        document.add_paragraph('foobar')
+        other_document = cache.document(test_docx_path)
+
+        assert isinstance(document, Document)
+        assert len(cache) == 1
+        assert test_docx_path in cache
+        assert len(other_document.paragraphs) == len(document.paragraphs) - 1
+        assert other_document.element is not document.element
+
+    def it_uses_the_default_template_when_no_path_given(self):
+        cache = TemplateCache()
+        document = cache.document()
+        assert isinstance(document, Document)
+        assert len(cache) == 1
+
+    def it_evicts_the_least_recently_used_template(self, two_templates):
+        path_1, path_2 = two_templates
+        cache = TemplateCache(max_templates=1)
+
+        cache.document(path_1)
+        cache.document(path_2)
+
+        assert len(cache) == 1
+        assert path_2 in cache
+        assert path_1 not in cache
+
+    def it_evicts_templates_to_stay_under_its_size_cap(self, two_templates):
+        path_1, path_2 = two_templates
+        cache = TemplateCache()
+        cache.document(path_1)
+        nbytes = cache.nbytes
+        cache._max_bytes = nbytes
+
+        cache.document(path_2)
+
+        assert len(cache) == 1
+        assert cache.nbytes == nbytes
+
+    def it_reloads_a_template_that_changed_on_disk(self, two_templates):
+        path_1, path_2 = two_templates
+        cache = TemplateCache()
+        cache.document(path_1)
+        package = cache._package_for(path_1)
+        os.utime(path_1, (1, 1))
+
+        cache.document(path_1)
+
+        assert cache._package_for(path_1) is not package
+        assert len(cache) == 1
+
+    def it_can_be_cleared(self):
+        cache = TemplateCache()
+        cache.document(test_docx_path)
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.nbytes == 0
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def two_templates(self, tmpdir):
+        path_1 = str(tmpdir.join('template-1.docx'))
+        path_2 = str(tmpdir.join('template-2.docx'))
+        shutil.copy(test_docx_path, path_1)
+        shutil.copy(test_docx_path, path_2)
+        return path_1, path_2
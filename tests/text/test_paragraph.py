@@ -71,7 +71,7 @@ class DescribeParagraph(object):
 
     def it_provides_access_to_the_runs_it_contains(self, runs_fixture):
         paragraph, Run_, r_, r_2_, run_, run_2_ = runs_fixture
-        runs = paragraph.runs
+        runs = list(paragraph.runs)
         assert Run_.mock_calls == [
             call(r_, paragraph), call(r_2_, paragraph)
         ]
@@ -194,6 +194,7 @@ class DescribeParagraph(object):
 
     @pytest.fixture
     def runs_fixture(self, p_, Run_, r_, r_2_, runs_):
+        p_.xpath.return_value = [r_, r_2_]
         paragraph = Paragraph(p_, None)
         run_, run_2_ = runs_
         return paragraph, Run_, r_, r_2_, run_, run_2_
@@ -264,8 +265,8 @@ class DescribeParagraph(object):
         return method_mock(request, Paragraph, '_insert_paragraph_before')
 
     @pytest.fixture
-    def p_(self, request, r_, r_2_):
-        return instance_mock(request, CT_P, r_lst=(r_, r_2_))
+    def p_(self, request):
+        return instance_mock(request, CT_P)
 
     @pytest.fixture
     def ParagraphFormat_(self, request, paragraph_format_):
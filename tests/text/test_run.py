@@ -10,6 +10,7 @@ from __future__ import (
 
 from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_BREAK, WD_UNDERLINE
+from docx.image.downscale import Downscaler
 from docx.parts.document import DocumentPart
 from docx.shape import InlineShape
 from docx.text.font import Font
@@ -96,6 +97,18 @@ class DescribeRun(object):
         InlineShape_.assert_called_once_with(inline)
         assert picture is picture_
 
+    def it_can_downscale_a_picture_image(self, add_picture_fixture, request):
+        run, image, width, height, inline = add_picture_fixture[:5]
+        downscaler_ = instance_mock(request, Downscaler)
+        downscaler_.prepare.return_value = ('small.png', 3333, 4444)
+
+        run.add_picture(image, width, height, downscaler_)
+
+        downscaler_.prepare.assert_called_once_with(image, width, height)
+        run.part.new_pic_inline.assert_called_once_with(
+            'small.png', 3333, 4444
+        )
+
     def it_can_remove_its_content_but_keep_formatting(self, clear_fixture):
         run, expected_xml = clear_fixture
         _run = run.clear()